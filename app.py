@@ -3,78 +3,263 @@
 Beautiful Web Application for Resume Generator
 """
 
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, g, render_template, request, jsonify, send_file, stream_with_context
 import os
-import tempfile
+import io
+import time
+import base64
+import asyncio
 import json
-from resume_generator import ResumeGenerator
+import zipfile
+from resume_generator import DEFAULT_GENERATION_MODE, GENERATION_MODES, get_shared_generator
+from requirement_analyzer import RequirementAnalyzer
+from pdf_generator import PDFResumeGenerator
+from result_store import ResultStore
+from resume_model import Resume, section_text
+from llm_client import run_on_shared_loop
+from llm_backend import backend_configured
+from job_queue import get_job_queue
+from warm_pool import get_warm_pool
+from metrics import metrics_payload, observe_http_request
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-key-change-in-production')
 
+# Rendering needs no OpenAI client, so exports share one stylesheet
+pdf_generator = PDFResumeGenerator()
+
+# Stateless apart from its pooled client, so one analyzer serves every request
+requirement_analyzer = RequirementAnalyzer()
+
+# Generated resumes are kept server-side (as resume model JSON) so follow-up requests can send an ID instead of the text
+result_store = ResultStore(
+    max_bytes=int(os.environ.get('RESULT_STORE_MAX_BYTES', 64 * 1024 * 1024)),
+    ttl=float(os.environ.get('RESULT_STORE_TTL', 3600))
+)
+
+# Pre-generate non-matching experience and education sections in the background (WARM_POOL_SIZE > 0).
+# Started at import so it also runs under gunicorn and flask run, not just python app.py
+if get_warm_pool():
+    print("🔥 Warm pool enabled: pre-generating non-matching experience and education sections while idle")
+
+class ResumeExpired(Exception):
+    """Raised when a request references a resume ID that is no longer stored"""
+
+def store_resume(resume):
+    """Keep a generated resume model server-side and return its ID"""
+    return result_store.put(resume.to_json())
+
+def load_resume(resume_id):
+    stored = result_store.get(resume_id)
+    if stored is None:
+        raise ResumeExpired(resume_id)
+    return Resume.from_json(stored)
+
+def resolve_resume(data, text_key, id_key):
+    """Return resume text sent inline, or render it from the model stored under its ID"""
+    text = data.get(text_key, '').strip()
+    if text:
+        return text
+    
+    resume_id = data.get(id_key, '')
+    if not resume_id:
+        return ''
+    
+    return load_resume(resume_id).to_text()
+
+def resolve_resume_for_pdf(data, text_key, id_key):
+    """Prefer the stored model so the PDF needs no text parsing; fall back to text sent inline"""
+    resume_id = data.get(id_key, '')
+    if resume_id:
+        stored = result_store.get(resume_id)
+        if stored is not None:
+            return Resume.from_json(stored)
+
+    text = data.get(text_key, '').strip()
+    if text or not resume_id:
+        return text
+    raise ResumeExpired(resume_id)
+
+def generated_resumes_response(good_resume, bad_resume):
+    return {
+        'good_resume': good_resume.to_text(),
+        'bad_resume': bad_resume.to_text(),
+        'good_resume_id': store_resume(good_resume),
+        'bad_resume_id': store_resume(bad_resume),
+        'success': True
+    }
+
+def resume_expired_response():
+    return jsonify({'error': 'Resume not found or expired, please resend the resume text', 'expired': True}), 404
+
+def server_sent_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+PDF_FILENAMES = {'good': 'strong_candidate_example.pdf', 'bad': 'weak_candidate_example.pdf'}
+
+def render_pdf_pair(good_resume, bad_resume):
+    """Render already-generated resumes (models or text) to in-memory PDFs without any LLM calls"""
+    return pdf_generator.render_pdf_bytes(good_resume), pdf_generator.render_pdf_bytes(bad_resume)
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.after_request
+def record_request_metrics(response):
+    # Label by route pattern rather than raw path to keep metric cardinality bounded
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    observe_http_request(endpoint, request.method, response.status_code,
+                         time.perf_counter() - g.get('request_started', time.perf_counter()))
+    return response
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus metrics: per-section LLM latency, tokens and outcomes plus HTTP request counts"""
+    payload, content_type = metrics_payload()
+    return Response(payload, mimetype=content_type)
+
 @app.route('/')
 def index():
     """Main page with job posting input form"""
     return render_template('index.html')
 
 @app.route('/generate', methods=['POST'])
-def generate_resumes():
+async def generate_resumes():
     """API endpoint to generate resumes"""
     try:
         data = request.get_json()
         job_description = data.get('job_description', '').strip()
+        # 'fast' writes each resume in one call; 'detailed' generates every section separately
+        mode = data.get('mode', DEFAULT_GENERATION_MODE)
         
         if not job_description:
             return jsonify({'error': 'Job description is required'}), 400
         
-        if not os.getenv('OPENAI_API_KEY'):
-            return jsonify({'error': 'OpenAI API key not configured. Please set your OPENAI_API_KEY environment variable.'}), 500
+        if mode not in GENERATION_MODES:
+            return jsonify({'error': f"mode must be one of: {', '.join(GENERATION_MODES)}"}), 400
         
-        # Generate resumes
-        generator = ResumeGenerator()
+        if not backend_configured():
+            return jsonify({'error': 'OpenAI API key not configured. Please set your OPENAI_API_KEY environment variable.'}), 500
         
-        # Create temporary directory for outputs
-        with tempfile.TemporaryDirectory() as temp_dir:
-            matching_txt, non_matching_txt = generator.generate_resumes_txt(job_description, temp_dir)
-            
-            # Read the generated files
-            with open(matching_txt, 'r', encoding='utf-8') as f:
-                good_resume = f.read()
-            
-            with open(non_matching_txt, 'r', encoding='utf-8') as f:
-                bad_resume = f.read()
+        # Generate resumes on the shared loop, reusing its pooled keep-alive connections
+        generator = get_shared_generator()
+        good_resume, bad_resume = await run_on_shared_loop(generator.agenerate_resume_models(job_description, mode))
         
-        return jsonify({
-            'good_resume': good_resume,
-            'bad_resume': bad_resume,
-            'success': True
-        })
+        return jsonify(generated_resumes_response(good_resume, bad_resume))
         
     except Exception as e:
         return jsonify({'error': f'Generation failed: {str(e)}'}), 500
 
+@app.route('/jobs', methods=['POST'])
+def create_job():
+    """Queue a generation job and return at once; poll GET /jobs/<id> for progress and results"""
+    data = request.get_json()
+    job_description = data.get('job_description', '').strip()
+    mode = data.get('mode', DEFAULT_GENERATION_MODE)
+    
+    if not job_description:
+        return jsonify({'error': 'Job description is required'}), 400
+    
+    if mode not in GENERATION_MODES:
+        return jsonify({'error': f"mode must be one of: {', '.join(GENERATION_MODES)}"}), 400
+    
+    if not backend_configured():
+        return jsonify({'error': 'OpenAI API key not configured. Please set your OPENAI_API_KEY environment variable.'}), 500
+    
+    job_id = get_job_queue().enqueue(job_description, mode, render_pdf=bool(data.get('pdf', True)))
+    
+    return jsonify({'job_id': job_id, 'status': 'queued', 'status_url': f'/jobs/{job_id}'}), 202
+
+@app.route('/jobs/<job_id>')
+def job_status(job_id):
+    """Progress of a queued job, plus the same resume payload as /generate once it is done"""
+    queue = get_job_queue()
+    status = queue.status(job_id)
+    if status is None:
+        return jsonify({'error': 'Job not found or expired'}), 404
+    
+    if status['status'] == 'done':
+        resumes = queue.resumes(job_id)
+        if resumes is None:
+            # Purged between the two reads
+            return jsonify({'error': 'Job not found or expired'}), 404
+        status['result'] = generated_resumes_response(*resumes)
+        if status['has_pdf']:
+            status['pdf_urls'] = {which: f'/jobs/{job_id}/pdf/{which}' for which in PDF_FILENAMES}
+    
+    return jsonify(status)
+
+@app.route('/jobs/<job_id>/pdf/<which>')
+def job_pdf(job_id, which):
+    """PDF rendered by the worker for a finished job"""
+    if which not in PDF_FILENAMES:
+        return jsonify({'error': "which must be 'good' or 'bad'"}), 400
+    
+    pdf = get_job_queue().pdf(job_id, which)
+    if not pdf:
+        return jsonify({'error': 'PDF not available for this job'}), 404
+    
+    return send_file(io.BytesIO(pdf), mimetype='application/pdf', as_attachment=True,
+                     download_name=PDF_FILENAMES[which])
+
+@app.route('/generate/stream', methods=['POST'])
+def generate_resumes_stream():
+    """Stream each resume section as a Server-Sent Event as soon as it is generated"""
+    data = request.get_json()
+    job_description = data.get('job_description', '').strip()
+    
+    if not job_description:
+        return jsonify({'error': 'Job description is required'}), 400
+    
+    if not backend_configured():
+        return jsonify({'error': 'OpenAI API key not configured. Please set your OPENAI_API_KEY environment variable.'}), 500
+    
+    def events():
+        sections = {'good': {}, 'bad': {}}
+        try:
+            generator = get_shared_generator()
+            for is_matching, section, content in generator.iter_resume_sections(job_description):
+                resume = 'good' if is_matching else 'bad'
+                sections[resume][section] = content
+                yield server_sent_event('section', {'resume': resume, 'section': section, 'content': section_text(content)})
+            
+            good_resume = generator.build_resume(sections['good'])
+            bad_resume = generator.build_resume(sections['bad'])
+            yield server_sent_event('done', generated_resumes_response(good_resume, bad_resume))
+        except Exception as e:
+            yield server_sent_event('error', {'error': f'Generation failed: {str(e)}'})
+    
+    return Response(stream_with_context(events()), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        # Stop reverse proxies (nginx, Render, Railway) from buffering the stream
+        'X-Accel-Buffering': 'no'
+    })
+
 @app.route('/export/pdf', methods=['POST'])
-def export_pdf():
-    """Export resumes as PDF files"""
+async def export_pdf():
+    """Export the resumes returned by /generate as PDF files"""
     try:
         data = request.get_json()
+        good_resume = resolve_resume_for_pdf(data, 'good_resume', 'good_resume_id')
+        bad_resume = resolve_resume_for_pdf(data, 'bad_resume', 'bad_resume_id')
         job_description = data.get('job_description', '').strip()
         
-        if not job_description:
-            return jsonify({'error': 'Job description is required'}), 400
+        if not (good_resume and bad_resume) and not job_description:
+            return jsonify({'error': 'Generated resume text is required'}), 400
         
-        generator = ResumeGenerator()
+        if good_resume and bad_resume:
+            # Render exactly what the user is looking at
+            good_pdf, bad_pdf = await asyncio.to_thread(render_pdf_pair, good_resume, bad_resume)
+        else:
+            # Legacy clients that only send the job description regenerate from scratch
+            generator = get_shared_generator()
+            good_resume, bad_resume = await run_on_shared_loop(generator.agenerate_resume_models(job_description))
+            good_pdf, bad_pdf = await asyncio.to_thread(render_pdf_pair, good_resume, bad_resume)
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            matching_pdf, non_matching_pdf = generator.generate_resumes_pdf(job_description, temp_dir)
-            
-            # Read PDF files as base64
-            import base64
-            with open(matching_pdf, 'rb') as f:
-                good_pdf_data = base64.b64encode(f.read()).decode()
-            
-            with open(non_matching_pdf, 'rb') as f:
-                bad_pdf_data = base64.b64encode(f.read()).decode()
+        # Kept for older clients; /export/pdf/download serves raw PDF bytes without base64
+        good_pdf_data = base64.b64encode(good_pdf).decode()
+        bad_pdf_data = base64.b64encode(bad_pdf).decode()
         
         return jsonify({
             'good_pdf': good_pdf_data,
@@ -82,71 +267,97 @@ def export_pdf():
             'success': True
         })
         
+    except ResumeExpired:
+        return resume_expired_response()
+    except Exception as e:
+        return jsonify({'error': f'PDF export failed: {str(e)}'}), 500
+
+@app.route('/export/pdf/download', methods=['POST'])
+async def download_pdf():
+    """Download rendered PDFs as binary: one resume as application/pdf, or both as a zip"""
+    try:
+        data = request.get_json()
+        which = data.get('which', 'both')
+        
+        if which not in ('good', 'bad', 'both'):
+            return jsonify({'error': "which must be 'good', 'bad' or 'both'"}), 400
+        
+        names = ['good', 'bad'] if which == 'both' else [which]
+        resumes = {name: resolve_resume_for_pdf(data, f'{name}_resume', f'{name}_resume_id') for name in names}
+        
+        if not all(resumes.values()):
+            return jsonify({'error': 'Generated resume text is required'}), 400
+        
+        pdfs = {name: await asyncio.to_thread(pdf_generator.render_pdf_bytes, resume) for name, resume in resumes.items()}
+        
+        if which != 'both':
+            return send_file(io.BytesIO(pdfs[which]), mimetype='application/pdf',
+                             as_attachment=True, download_name=PDF_FILENAMES[which])
+        
+        # PDFs are already compressed, so store them in the zip as-is
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as archive:
+            for name, pdf in pdfs.items():
+                archive.writestr(PDF_FILENAMES[name], pdf)
+        buffer.seek(0)
+        
+        return send_file(buffer, mimetype='application/zip', as_attachment=True,
+                         download_name='candidate_examples.zip')
+        
+    except ResumeExpired:
+        return resume_expired_response()
     except Exception as e:
         return jsonify({'error': f'PDF export failed: {str(e)}'}), 500
 
 @app.route('/analyze-requirement', methods=['POST'])
-def analyze_requirement():
+async def analyze_requirement():
     """Analyze if a resume meets a specific requirement using AI"""
     try:
         data = request.get_json()
         requirement = data.get('requirement', '').strip()
-        resume_text = data.get('resume_text', '').strip()
+        resume_text = resolve_resume(data, 'resume_text', 'resume_id')
         
         if not requirement or not resume_text:
             return jsonify({'error': 'Both requirement and resume text are required'}), 400
         
-        if not os.getenv('OPENAI_API_KEY'):
+        if not backend_configured():
             return jsonify({'error': 'OpenAI API key not configured'}), 500
         
-        from openai import OpenAI
-        client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        result = await run_on_shared_loop(requirement_analyzer.analyze(requirement, resume_text))
         
-        prompt = f"""
-Analyze if the following resume meets the specific requirement. Return a JSON response with:
-1. "meets_requirement": true/false
-2. "explanation": Brief factual explanation (1-2 sentences)
-3. "evidence": Specific text from the resume that supports your decision (or lack thereof)
-
-Requirement: {requirement}
-
-Resume:
-{resume_text}
+        return jsonify(result)
+        
+    except ResumeExpired:
+        return resume_expired_response()
+    except Exception as e:
+        return jsonify({'error': f'Analysis failed: {str(e)}'}), 500
 
-Be strict in your evaluation. Only return true if the requirement is clearly and explicitly met.
-"""
+@app.route('/analyze-requirements', methods=['POST'])
+async def analyze_requirements():
+    """Analyze a list of requirements against one resume in a single batch"""
+    try:
+        data = request.get_json()
+        resume_text = resolve_resume(data, 'resume_text', 'resume_id')
+        requirements = [str(req).strip() for req in data.get('requirements', []) if str(req).strip()]
         
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0
-        )
+        if not requirements or not resume_text:
+            return jsonify({'error': 'Both requirements and resume text are required'}), 400
         
-        # Parse the AI response
-        ai_response = response.choices[0].message.content.strip()
+        if not backend_configured():
+            return jsonify({'error': 'OpenAI API key not configured'}), 500
         
-        # Try to extract JSON from the response
-        import re
-        json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
-        if json_match:
-            result = json.loads(json_match.group())
-        else:
-            # Fallback parsing if AI doesn't return proper JSON
-            meets = 'true' in ai_response.lower() and 'meets_requirement' in ai_response.lower()
-            result = {
-                'meets_requirement': meets,
-                'explanation': ai_response[:200] + '...' if len(ai_response) > 200 else ai_response,
-                'evidence': 'See full analysis above'
-            }
+        results = await run_on_shared_loop(requirement_analyzer.analyze_batch(requirements, resume_text))
         
-        return jsonify(result)
+        return jsonify({'results': results})
         
+    except ResumeExpired:
+        return resume_expired_response()
     except Exception as e:
         return jsonify({'error': f'Analysis failed: {str(e)}'}), 500
 
 if __name__ == '__main__':
-    # Check for API key
-    if not os.getenv('OPENAI_API_KEY'):
+    # Check for API key (not needed with RESUME_LLM_BACKEND=fake)
+    if not backend_configured():
         print("⚠️  Warning: OPENAI_API_KEY environment variable not set!")
         print("Please set it in your deployment platform's environment variables")
     
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Generate matching / non-matching resume pairs for many job descriptions.
+
+Input is a directory of .txt job descriptions (the file name is the job ID) or
+a JSONL file of {"id": ..., "job_description": ...} objects. Each job gets its
+own folder under the output directory. Finished jobs are appended to a
+checkpoint file, so an interrupted run picks up where it stopped when started
+again with the same output directory.
+
+Usage:
+    python batch_generate.py jobs/ --output-dir out --format txt,pdf --workers 8
+    RESUME_LLM_BACKEND=fake python batch_generate.py jobs.jsonl   # dry run without API calls
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Set, Tuple
+
+from llm_backend import backend_configured
+from pdf_generator import PDFResumeGenerator
+from resume_generator import DEFAULT_GENERATION_MODE, GENERATION_MODES, ResumeGenerator, get_shared_generator
+from resume_model import Resume
+
+OUTPUT_FORMATS = ('txt', 'json', 'pdf')
+CHECKPOINT_FILE = 'checkpoint.jsonl'
+# Each job fans out its own section calls, so a few jobs already keep many requests in flight
+DEFAULT_WORKERS = 4
+RESUME_NAMES = ('matching_resume', 'non_matching_resume')
+
+_JOB_ID_RE = re.compile(r'[^\w.-]+')
+
+
+def _job_id(raw: str) -> str:
+    """A folder-safe job ID; IDs that had to be changed get a hash of the original so 'a/b' and 'a_b' stay apart"""
+    raw = str(raw)
+    job_id = _JOB_ID_RE.sub('_', raw).strip('._') or 'job'
+    if job_id != raw:
+        job_id += '-' + hashlib.sha1(raw.encode('utf-8')).hexdigest()[:8]
+    return job_id
+
+
+def read_jobs(path: str) -> Iterator[Tuple[str, str]]:
+    """Yield (job_id, job_description) from a directory of .txt files or a JSONL file"""
+    if os.path.isdir(path):
+        for name in sorted(os.listdir(path)):
+            if name.endswith('.txt'):
+                with open(os.path.join(path, name), 'r', encoding='utf-8') as f:
+                    yield _job_id(name[:-4]), f.read()
+        return
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield _job_id(record.get('id', f"line-{line_number}")), record['job_description']
+
+
+class Checkpoint:
+    """Append-only record of finished jobs; each line is flushed so a crash loses at most the jobs in flight"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def completed(self) -> Set[str]:
+        if not os.path.exists(self.path):
+            return set()
+        done = set()
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # Half-written last line from a killed run
+                    continue
+                if entry.get('status') == 'done':
+                    done.add(entry['id'])
+        return done
+
+    def record(self, job_id: str, status: str, seconds: float, error: str = None):
+        entry = {'id': job_id, 'status': status, 'seconds': round(seconds, 3)}
+        if error:
+            entry['error'] = error
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry) + '\n')
+            f.flush()
+
+
+_pdf_renderer = None
+
+
+def _init_pdf_worker():
+    global _pdf_renderer
+    _pdf_renderer = PDFResumeGenerator()
+
+
+def render_pdf(resume_json: str, path: str) -> str:
+    """Process pool task: render a resume model (sent as JSON) to a PDF file"""
+    if _pdf_renderer is None:
+        _init_pdf_worker()
+    return _pdf_renderer.create_pdf_resume(Resume.from_json(resume_json), path)
+
+
+def write_outputs(resumes: Tuple[Resume, Resume], job_dir: str, formats: List[str], pdf_pool: Executor) -> List[str]:
+    """Write every requested format for one job; PDFs are rendered on the pool"""
+    os.makedirs(job_dir, exist_ok=True)
+    written, pending = [], []
+
+    for name, resume in zip(RESUME_NAMES, resumes):
+        base = os.path.join(job_dir, name)
+        if 'txt' in formats:
+            with open(f"{base}.txt", 'w', encoding='utf-8') as f:
+                f.write(resume.to_text())
+            written.append(f"{base}.txt")
+        if 'json' in formats:
+            with open(f"{base}.json", 'w', encoding='utf-8') as f:
+                json.dump(resume.to_dict(), f, ensure_ascii=False, indent=2)
+            written.append(f"{base}.json")
+        if 'pdf' in formats:
+            pending.append(pdf_pool.submit(render_pdf, resume.to_json(), f"{base}.pdf"))
+
+    return written + [future.result() for future in pending]
+
+
+def run_batch(jobs: List[Tuple[str, str]], output_dir: str, formats: List[str] = ('txt',),
+              workers: int = DEFAULT_WORKERS, pdf_processes: int = None, mode: str = DEFAULT_GENERATION_MODE,
+              generator: ResumeGenerator = None) -> Dict:
+    """
+    Generate and write resumes for every job not already in the checkpoint.
+    pdf_processes=0 renders PDFs on threads in this process instead of a process pool.
+    """
+    generator = generator or get_shared_generator()
+    os.makedirs(output_dir, exist_ok=True)
+    checkpoint = Checkpoint(os.path.join(output_dir, CHECKPOINT_FILE))
+    done = checkpoint.completed()
+    todo = [(job_id, text) for job_id, text in jobs if job_id not in done]
+    summary = {'total': len(jobs), 'skipped': len(jobs) - len(todo), 'succeeded': 0, 'failed': {}, 'job_seconds': []}
+
+    def process(job_id: str, job_description: str) -> float:
+        start = time.perf_counter()
+        resumes = generator.generate_resume_models(job_description, mode)
+        write_outputs(resumes, os.path.join(output_dir, job_id), formats, pdf_pool)
+        return time.perf_counter() - start
+
+    if pdf_processes is None:
+        pdf_processes = os.cpu_count() or 1
+    # spawn, not fork: forking a process that already runs client and pool threads can deadlock the child
+    pdf_pool = (ProcessPoolExecutor(pdf_processes, mp_context=multiprocessing.get_context('spawn'),
+                                    initializer=_init_pdf_worker)
+                if pdf_processes > 0 and 'pdf' in formats else ThreadPoolExecutor(max(1, workers)))
+    job_pool = ThreadPoolExecutor(max(1, workers))
+    start = time.perf_counter()
+    try:
+        futures = {job_pool.submit(process, job_id, text): job_id for job_id, text in todo}
+        for future in as_completed(futures):
+            job_id = futures[future]
+            try:
+                seconds = future.result()
+            except Exception as e:
+                summary['failed'][job_id] = f"{type(e).__name__}: {e}"
+                checkpoint.record(job_id, 'failed', 0, summary['failed'][job_id])
+                print(f"❌ {job_id}: {summary['failed'][job_id]}", file=sys.stderr)
+                continue
+            summary['succeeded'] += 1
+            summary['job_seconds'].append(seconds)
+            checkpoint.record(job_id, 'done', seconds)
+    except KeyboardInterrupt:
+        print("\n⚠️  Interrupted; finished jobs are checkpointed, run again to resume", file=sys.stderr)
+        summary['interrupted'] = True
+    finally:
+        job_pool.shutdown(wait=not summary.get('interrupted'), cancel_futures=True)
+        pdf_pool.shutdown(wait=not summary.get('interrupted'), cancel_futures=True)
+
+    summary['seconds'] = time.perf_counter() - start
+    return summary
+
+
+def print_summary(summary: Dict):
+    seconds = summary['seconds']
+    processed = summary['succeeded'] + len(summary['failed'])
+    print(f"\n📊 {summary['total']} jobs: {summary['succeeded']} generated, {len(summary['failed'])} failed, "
+          f"{summary['skipped']} already done")
+    if processed:
+        print(f"⏱️  {seconds:.1f}s total, {summary['succeeded'] / seconds:.2f} jobs/s "
+              f"({2 * summary['succeeded'] / seconds:.2f} resumes/s)")
+    if summary['job_seconds']:
+        print(f"   per job: median {statistics.median(summary['job_seconds']):.1f}s, "
+              f"max {max(summary['job_seconds']):.1f}s")
+    for job_id, error in list(summary['failed'].items())[:10]:
+        print(f"   ❌ {job_id}: {error}")
+    if len(summary['failed']) > 10:
+        print(f"   ... and {len(summary['failed']) - 10} more (see {CHECKPOINT_FILE})")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('input', help='directory of .txt job descriptions or a JSONL file')
+    arg_parser.add_argument('--output-dir', default='batch_output')
+    arg_parser.add_argument('--format', default='txt', help=f"comma-separated: {', '.join(OUTPUT_FORMATS)}")
+    arg_parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='jobs generated at once')
+    arg_parser.add_argument('--pdf-processes', type=int, default=None,
+                            help='PDF rendering processes (default: CPU count, 0 renders in-process)')
+    arg_parser.add_argument('--mode', default=DEFAULT_GENERATION_MODE, choices=GENERATION_MODES)
+    args = arg_parser.parse_args()
+
+    formats = [name.strip() for name in args.format.split(',') if name.strip()]
+    unknown = [name for name in formats if name not in OUTPUT_FORMATS]
+    if unknown:
+        arg_parser.error(f"unknown format(s): {', '.join(unknown)}")
+
+    if not backend_configured():
+        print("❌ OPENAI_API_KEY is not set (or use RESUME_LLM_BACKEND=fake for a dry run)")
+        sys.exit(1)
+
+    summary = run_batch(list(read_jobs(args.input)), args.output_dir, formats,
+                        args.workers, args.pdf_processes, args.mode)
+    print_summary(summary)
+    sys.exit(1 if summary['failed'] or summary.get('interrupted') else 0)
+
+
+if __name__ == '__main__':
+    main()
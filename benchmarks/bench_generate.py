@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+End-to-end generate_resumes throughput on the fake LLM backend at several
+section concurrency limits (1 is the original sequential behaviour).
+
+Usage: python -m benchmarks.bench_generate [--repeat N] [--latency SPEC]
+"""
+
+import argparse
+import statistics
+from typing import Dict, List
+
+from benchmarks.common import DEFAULT_FAKE_LATENCY, fake_generator, load_sample, time_calls
+
+CONCURRENCY_LEVELS = (1, 4, 12)
+
+
+def run(repeat: int = 3, latency: str = DEFAULT_FAKE_LATENCY) -> List[Dict]:
+    job_description = load_sample('sample_job_description.txt')
+    results = []
+
+    for concurrency in CONCURRENCY_LEVELS:
+        samples = time_calls(
+            lambda: fake_generator(concurrency, latency).generate_resumes(job_description), repeat
+        )
+        seconds = statistics.median(samples)
+        results.append({
+            'concurrency': concurrency,
+            'seconds': seconds,
+            # Each call produces a good and a bad resume
+            'resumes_per_second': 2 / seconds
+        })
+
+    return results
+
+
+def metrics(results: List[Dict]) -> Dict[str, float]:
+    return {f"c{result['concurrency']}.resumes_per_second": result['resumes_per_second'] for result in results}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--repeat', type=int, default=3, help='runs per level; the median is reported')
+    arg_parser.add_argument('--latency', default=DEFAULT_FAKE_LATENCY, help='fake LLM latency spec, e.g. uniform:0.02:0.1')
+    args = arg_parser.parse_args()
+
+    print(f"{'concurrency':>11} {'s/call':>8} {'resumes/s':>10}")
+    for result in run(args.repeat, args.latency):
+        print(f"{result['concurrency']:>11} {result['seconds']:>8.3f} {result['resumes_per_second']:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Request latency of /generate and /export/pdf through the Flask test client,
+with generation on the fake LLM backend.
+
+Usage: python -m benchmarks.bench_http [--requests N]
+"""
+
+import argparse
+from typing import Dict
+from unittest.mock import patch
+
+import app as web_app
+from benchmarks.common import fake_generator, latency_summary, load_sample, time_calls
+
+
+def _post(client, path: str, payload: Dict) -> Dict:
+    response = client.post(path, json=payload)
+    if response.status_code != 200:
+        raise RuntimeError(f"{path} returned {response.status_code}: {response.get_data(as_text=True)[:200]}")
+    return response.get_json()
+
+
+def run(requests: int = 20) -> Dict[str, Dict[str, float]]:
+    client = web_app.app.test_client()
+    job_description = load_sample('sample_job_description.txt')
+    generator = fake_generator()
+
+    # backend_configured would otherwise want an OpenAI key for the shared (OpenAI) backend
+    with patch.object(web_app, 'get_shared_generator', return_value=generator), \
+            patch.object(web_app, 'backend_configured', return_value=True):
+        generated = _post(client, '/generate', {'job_description': job_description})
+        generate = time_calls(lambda: _post(client, '/generate', {'job_description': job_description}), requests)
+
+    export_payload = {'good_resume_id': generated['good_resume_id'], 'bad_resume_id': generated['bad_resume_id']}
+    export = time_calls(lambda: _post(client, '/export/pdf', export_payload), requests)
+
+    return {'generate': latency_summary(generate), 'export_pdf': latency_summary(export)}
+
+
+def metrics(results: Dict[str, Dict[str, float]]) -> Dict[str, float]:
+    return {f"{endpoint}.{stat}": value for endpoint, summary in results.items() for stat, value in summary.items()}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--requests', type=int, default=20, help='requests per endpoint')
+    args = arg_parser.parse_args()
+
+    print(f"{'endpoint':>12} {'p50 ms':>9} {'p95 ms':>9}")
+    for endpoint, summary in run(args.requests).items():
+        print(f"{endpoint:>12} {summary['p50_ms']:>9.1f} {summary['p95_ms']:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
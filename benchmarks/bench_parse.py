@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for PDFResumeGenerator._parse_resume_text on resumes of
+normal length and 10x-100x longer (extra experience entries and skills lines).
+
+Usage: python -m benchmarks.bench_parse [--repeat N]
+"""
+
+import argparse
+import os
+import time
+
+from pdf_generator import PDFResumeGenerator
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCALES = (1, 10, 100)
+
+
+def load_sample_resume() -> str:
+    with open(os.path.join(ROOT, 'detailed_tech_resume.txt'), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def scale_resume(resume_text: str, factor: int) -> str:
+    """Repeat the body sections so the resume is roughly factor times longer"""
+    header, separator, body = resume_text.partition('💼 PROFESSIONAL SUMMARY')
+    return header + separator + body * factor
+
+
+def measure(parser: PDFResumeGenerator, text: str, repeat: int) -> float:
+    """Best-of-repeat wall time for one parse, in seconds"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parser._parse_resume_text(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(repeat: int = 5):
+    parser = PDFResumeGenerator()
+    sample = load_sample_resume()
+    results = []
+
+    for factor in SCALES:
+        text = scale_resume(sample, factor)
+        seconds = measure(parser, text, repeat)
+        results.append({
+            'scale': factor,
+            'kilobytes': len(text.encode('utf-8')) / 1024,
+            'lines': text.count('\n') + 1,
+            'seconds': seconds,
+            'kb_per_second': len(text.encode('utf-8')) / 1024 / seconds,
+            'lines_per_second': (text.count('\n') + 1) / seconds
+        })
+
+    return results
+
+
+def metrics(results):
+    return {f"x{result['scale']}.kb_per_second": result['kb_per_second'] for result in results}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--repeat', type=int, default=5, help='runs per scale; the best is reported')
+    args = arg_parser.parse_args()
+
+    print(f"{'scale':>6} {'size KB':>9} {'lines':>8} {'ms/parse':>10} {'KB/s':>10} {'lines/s':>12}")
+    for result in run(args.repeat):
+        print(f"{result['scale']:>5}x {result['kilobytes']:>9.1f} {result['lines']:>8} "
+              f"{result['seconds'] * 1000:>10.2f} {result['kb_per_second']:>10.0f} {result['lines_per_second']:>12.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+create_pdf_resume rendering speed in pages per second, for a resume model and
+for resume text that has to be parsed first.
+
+Usage: python -m benchmarks.bench_pdf [--repeat N]
+"""
+
+import argparse
+import io
+import re
+from typing import Dict, List
+
+from benchmarks.common import fake_generator, load_sample, time_calls
+from pdf_generator import PDFResumeGenerator
+
+# Page objects, not the /Type /Pages tree node
+_PAGE_RE = re.compile(rb'/Type\s*/Page(?![a-zA-Z])')
+
+
+def count_pages(pdf: bytes) -> int:
+    return len(_PAGE_RE.findall(pdf))
+
+
+def run(repeat: int = 20) -> List[Dict]:
+    renderer = PDFResumeGenerator()
+    model, _ = fake_generator(latency='0').generate_resume_models(load_sample('sample_job_description.txt'))
+    inputs = {'model': model, 'text': load_sample('detailed_tech_resume.txt')}
+    results = []
+
+    for name, resume in inputs.items():
+        pages = count_pages(renderer.render_pdf_bytes(resume))
+        samples = time_calls(lambda: renderer.create_pdf_resume(resume, io.BytesIO()), repeat)
+        # Best run, as in bench_parse: CPU-bound, so slower runs are mostly scheduler noise
+        seconds = min(samples)
+        results.append({'input': name, 'pages': pages, 'seconds': seconds, 'pages_per_second': pages / seconds})
+
+    return results
+
+
+def metrics(results: List[Dict]) -> Dict[str, float]:
+    return {f"{result['input']}.pages_per_second": result['pages_per_second'] for result in results}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--repeat', type=int, default=20, help='renders per input; the best is reported')
+    args = arg_parser.parse_args()
+
+    print(f"{'input':>6} {'pages':>6} {'ms/render':>10} {'pages/s':>9}")
+    for result in run(args.repeat):
+        print(f"{result['input']:>6} {result['pages']:>6} {result['seconds'] * 1000:>10.2f} {result['pages_per_second']:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""
+Shared helpers for the offline benchmarks: fake-backed generators and timing stats.
+"""
+
+import os
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from cache import TTLCache, VariantCache
+from llm_backend import FakeLLMBackend
+from resume_generator import ResumeGenerator
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Per-call latency of the fake LLM; low enough to keep runs short, high enough
+# that scheduling (not CPU) dominates generation time as it does with the real API
+DEFAULT_FAKE_LATENCY = os.getenv('BENCH_FAKE_LATENCY', 'fixed:0.05')
+
+
+def load_sample(name: str) -> str:
+    with open(os.path.join(ROOT, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def fake_generator(max_concurrency: int = None, latency: str = DEFAULT_FAKE_LATENCY, **kwargs) -> ResumeGenerator:
+    """Generator on a seeded fake backend with a fresh analysis cache and no section cache, so every run makes every call"""
+    return ResumeGenerator(max_concurrency=max_concurrency, analysis_cache=TTLCache(),
+                           section_cache=VariantCache(maxsize=0), backend=FakeLLMBackend(latency=latency), **kwargs)
+
+
+def time_calls(call: Callable[[], object], repeat: int, warmup: int = 1) -> List[float]:
+    """Wall time of each of repeat calls, in seconds, after untimed warm-up calls"""
+    for _ in range(warmup):
+        call()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))]
+
+
+def latency_summary(samples: List[float]) -> Dict[str, float]:
+    return {
+        'p50_ms': statistics.median(samples) * 1000,
+        'p95_ms': percentile(samples, 95) * 1000
+    }
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Run every offline benchmark, save the results as a JSON baseline and compare
+against an earlier one.
+
+Metrics ending in _per_second are throughput (higher is better); the rest are
+latencies (lower is better). A metric regresses when it is worse than the
+baseline by more than the threshold; the exit status is 1 if any did.
+
+Usage:
+    python -m benchmarks.runner [--quick] [--only parse,pdf] [--save [PATH]] [--compare [PATH]] [--threshold 0.25]
+
+PATH defaults to benchmarks/baselines/baseline.json.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+from typing import Dict, List, Tuple
+
+from benchmarks import bench_generate, bench_http, bench_parse, bench_pdf
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'baseline.json')
+# Wall-clock benchmarks on shared machines move 10-20% between runs on their own
+DEFAULT_THRESHOLD = 0.25
+
+# Suite name -> (module, run kwargs for a full run, run kwargs for --quick)
+SUITES = {
+    'parse': (bench_parse, {'repeat': 5}, {'repeat': 2}),
+    'pdf': (bench_pdf, {'repeat': 20}, {'repeat': 5}),
+    'generate': (bench_generate, {'repeat': 3}, {'repeat': 1}),
+    'http': (bench_http, {'requests': 20}, {'requests': 5}),
+}
+
+
+def run_suites(names: List[str], quick: bool = False) -> Dict[str, float]:
+    """Flat {suite.metric: value} for the selected suites"""
+    results = {}
+    for name in names:
+        module, full, short = SUITES[name]
+        print(f"⏱️  {name}...", file=sys.stderr)
+        for metric, value in module.metrics(module.run(**(short if quick else full))).items():
+            results[f"{name}.{metric}"] = value
+    return results
+
+
+def higher_is_better(metric: str) -> bool:
+    return metric.endswith('_per_second')
+
+
+def compare(baseline: Dict[str, float], current: Dict[str, float],
+            threshold: float = DEFAULT_THRESHOLD) -> List[Tuple[str, float, float, float, bool]]:
+    """(metric, baseline, current, relative change, regressed) for metrics present in both"""
+    rows = []
+    for metric in sorted(baseline.keys() & current.keys()):
+        before, after = baseline[metric], current[metric]
+        change = (after - before) / before if before else 0.0
+        worse = -change if higher_is_better(metric) else change
+        rows.append((metric, before, after, change, worse > threshold))
+    return rows
+
+
+def save_baseline(path: str, results: Dict[str, float], quick: bool):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'created': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'quick': quick,
+            'metrics': results
+        }, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def load_baseline(path: str) -> Dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument('--only', help=f"comma-separated suites (default: {','.join(SUITES)})")
+    arg_parser.add_argument('--quick', action='store_true', help='fewer repeats, for a smoke run')
+    arg_parser.add_argument('--save', metavar='PATH', nargs='?', const=DEFAULT_BASELINE,
+                            help='write the results as a JSON baseline')
+    arg_parser.add_argument('--compare', metavar='PATH', nargs='?', const=DEFAULT_BASELINE,
+                            help='baseline JSON to check for regressions')
+    arg_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                            help='relative change that counts as a regression (default: %(default)s)')
+    args = arg_parser.parse_args()
+
+    names = args.only.split(',') if args.only else list(SUITES)
+    unknown = [name for name in names if name not in SUITES]
+    if unknown:
+        arg_parser.error(f"unknown suite(s): {', '.join(unknown)}")
+
+    results = run_suites(names, args.quick)
+
+    if args.save:
+        save_baseline(args.save, results, args.quick)
+        print(f"💾 Saved {len(results)} metrics to {args.save}")
+
+    if not args.compare:
+        for metric, value in results.items():
+            print(f"{metric:<45} {value:>12.2f}")
+        return
+
+    baseline = load_baseline(args.compare)
+    if baseline.get('quick') != args.quick:
+        print("⚠️  Warning: baseline and this run used different --quick settings, expect noise")
+    rows = compare(baseline['metrics'], results, args.threshold)
+    print(f"{'metric':<45} {'baseline':>12} {'current':>12} {'change':>8}")
+    for metric, before, after, change, regressed in rows:
+        print(f"{metric:<45} {before:>12.2f} {after:>12.2f} {change:>+8.1%}{'  ❌ REGRESSION' if regressed else ''}")
+
+    regressions = [row for row in rows if row[4]]
+    if regressions:
+        print(f"❌ {len(regressions)} metric(s) regressed by more than {args.threshold:.0%}")
+        sys.exit(1)
+    print(f"✅ No regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+import re
+import time
+import random
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Tuple
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace and case so trivially different pastes hash the same"""
+    return re.sub(r'\s+', ' ', text).strip().lower()
+
+
+def content_key(*parts: Any) -> str:
+    """Stable SHA-256 key over the given parts"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+class TTLCache:
+    """Thread-safe LRU cache with a per-entry time-to-live and hit/miss counters"""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600):
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
+
+
+class VariantCache:
+    """
+    Thread-safe LRU of small pools of interchangeable values per key.
+
+    Lookups miss until a key's pool holds `variants` values, so the first few
+    callers each generate (and add) a fresh one; after that a random variant is
+    served. maxsize bounds the total number of stored values across all keys,
+    evicting least recently used keys first; 0 disables the cache.
+    """
+
+    def __init__(self, maxsize: int = 1024, variants: int = 3, ttl: float = 3600, rng: random.Random = None):
+        self.maxsize = max(0, maxsize)
+        self.variants = max(1, variants)
+        self.ttl = ttl
+        self._rng = rng or random.Random()
+        self._pools = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _live_pool(self, key: Hashable) -> List[Tuple[float, Any]]:
+        pool = self._pools.get(key)
+        if pool is None:
+            return []
+        now = time.monotonic()
+        live = [entry for entry in pool if entry[0] >= now]
+        self._size -= len(pool) - len(live)
+        if live:
+            self._pools[key] = live
+        else:
+            del self._pools[key]
+        return live
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """A random variant for key, or default while its pool is still filling"""
+        with self._lock:
+            pool = self._live_pool(key)
+            if len(pool) < self.variants:
+                self.misses += 1
+                return default
+            self._pools.move_to_end(key)
+            self.hits += 1
+            return self._rng.choice(pool)[1]
+
+    def add(self, key: Hashable, value: Any):
+        """Add a variant to key's pool; ignored once the pool is full"""
+        if self.maxsize == 0:
+            return
+        with self._lock:
+            pool = self._live_pool(key)
+            if len(pool) >= self.variants:
+                return
+            self._pools[key] = pool + [(time.monotonic() + self.ttl, value)]
+            self._pools.move_to_end(key)
+            self._size += 1
+            while self._size > self.maxsize:
+                _, evicted = self._pools.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._pools.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._pools)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'size': len(self._pools),
+                'variants': self._size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
@@ -0,0 +1,24 @@
+"""
+Reset the process-wide caches around every test so results don't depend on test order.
+Shared test helpers live in testing_helpers.py.
+"""
+
+import pytest
+
+import requirement_analyzer
+import resume_generator
+
+SHARED_CACHES = (
+    resume_generator.job_analysis_cache,
+    resume_generator.section_variant_cache,
+    requirement_analyzer.requirement_verdict_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_shared_caches():
+    for cache in SHARED_CACHES:
+        cache.clear()
+    yield
+    for cache in SHARED_CACHES:
+        cache.clear()
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Persistent background queue for resume generation jobs.
+
+Jobs live in a SQLite database, so they survive restarts and can be worked by
+threads in the web process and/or by separate worker processes sharing the
+same file (python job_queue.py). Workers claim the oldest queued job with an
+atomic UPDATE, report section-level progress while generating, and store the
+resume models (and optionally rendered PDFs) on the job row.
+"""
+
+import os
+import sys
+import time
+import uuid
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+
+from pdf_generator import PDFResumeGenerator
+from resume_generator import DEFAULT_GENERATION_MODE, ResumeGenerator, get_shared_generator
+from resume_model import Resume
+
+# Running jobs that have not reported progress for this long are assumed to
+# belong to a crashed worker and are handed out again
+STALE_AFTER = 600
+# Idle workers re-check the database this often for jobs enqueued by other processes
+POLL_INTERVAL = 1.0
+# Expired jobs are deleted at most this often per queue
+PURGE_INTERVAL = 60.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    job_description TEXT NOT NULL,
+    render_pdf INTEGER NOT NULL,
+    stage TEXT,
+    completed INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    good_resume TEXT,
+    bad_resume TEXT,
+    good_pdf BLOB,
+    bad_pdf BLOB,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at);
+"""
+
+
+class JobQueue:
+    """SQLite-backed generation job queue with an optional pool of worker threads"""
+
+    def __init__(self, path: str, generator: ResumeGenerator = None, ttl: float = 24 * 3600,
+                 max_attempts: int = 2):
+        self.path = path
+        self.ttl = ttl
+        self.max_attempts = max_attempts
+        self._generator = generator
+        self._local = threading.local()
+        self._wakeup = threading.Condition()
+        self._stopping = threading.Event()
+        self._workers: List[threading.Thread] = []
+        self._pdf_generator = None
+        self._last_purge = None
+        self._purge_lock = threading.Lock()
+        self._connection().executescript(SCHEMA)
+
+    @property
+    def generator(self) -> ResumeGenerator:
+        return self._generator or get_shared_generator()
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared across threads, so each thread opens its own
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute('PRAGMA journal_mode=WAL')
+            self._local.connection = connection
+        return connection
+
+    def _update(self, job_id: str, **fields):
+        fields['updated_at'] = time.time()
+        columns = ', '.join(f"{name} = ?" for name in fields)
+        self._connection().execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+
+    def enqueue(self, job_description: str, mode: str = DEFAULT_GENERATION_MODE, render_pdf: bool = True) -> str:
+        """Add a job and return its ID without waiting for any generation"""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        self._connection().execute(
+            "INSERT INTO jobs (id, status, mode, job_description, render_pdf, stage, created_at, updated_at) "
+            "VALUES (?, 'queued', ?, ?, ?, 'queued', ?, ?)",
+            (job_id, mode, job_description, int(render_pdf), now, now)
+        )
+        with self._wakeup:
+            self._wakeup.notify()
+        return job_id
+
+    def get(self, job_id: str) -> Optional[sqlite3.Row]:
+        return self._connection().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+    def status(self, job_id: str) -> Optional[Dict]:
+        """Job state for polling clients; resume models and PDFs are left to the caller to fetch"""
+        row = self._connection().execute(
+            "SELECT id, status, mode, stage, completed, total, error, created_at, updated_at, finished_at, "
+            "good_pdf IS NOT NULL AS has_pdf, "
+            "(SELECT COUNT(*) FROM jobs AS ahead WHERE ahead.status = 'queued' AND ahead.created_at < jobs.created_at) "
+            "AS queue_position FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        status = {
+            'job_id': row['id'],
+            'status': row['status'],
+            'mode': row['mode'],
+            'stage': row['stage'],
+            'progress': {'completed': row['completed'], 'total': row['total']},
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at'],
+            'finished_at': row['finished_at'],
+            'has_pdf': bool(row['has_pdf'])
+        }
+        if row['status'] == 'queued':
+            status['queue_position'] = row['queue_position']
+        if row['error']:
+            status['error'] = row['error']
+        return status
+
+    def resumes(self, job_id: str) -> Optional[tuple]:
+        row = self.get(job_id)
+        if row is None or row['status'] != 'done':
+            return None
+        return Resume.from_json(row['good_resume']), Resume.from_json(row['bad_resume'])
+
+    def pdf(self, job_id: str, which: str) -> Optional[bytes]:
+        if which not in ('good', 'bad'):
+            raise ValueError("which must be 'good' or 'bad'")
+        row = self._connection().execute(f"SELECT {which}_pdf FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return row[0] if row else None
+
+    def claim(self) -> Optional[sqlite3.Row]:
+        """
+        Atomically take the oldest queued (or stale running) job, or None if there is nothing to do.
+        Stale jobs that have used up their attempts are marked failed instead of being handed out again.
+        """
+        now = time.time()
+        connection = self._connection()
+        connection.execute(
+            "UPDATE jobs SET status = 'failed', stage = 'failed', error = 'Worker stopped responding', "
+            "updated_at = ?, finished_at = ? WHERE status = 'running' AND updated_at < ? AND attempts >= ?",
+            (now, now, now - STALE_AFTER, self.max_attempts)
+        )
+        return connection.execute(
+            "UPDATE jobs SET status = 'running', stage = 'starting', attempts = attempts + 1, updated_at = ? "
+            "WHERE id = (SELECT id FROM jobs WHERE status = 'queued' "
+            "            OR (status = 'running' AND updated_at < ? AND attempts < ?) ORDER BY created_at LIMIT 1) "
+            "RETURNING *", (now, now - STALE_AFTER, self.max_attempts)
+        ).fetchone()
+
+    def purge_expired(self) -> int:
+        """Delete finished jobs older than the TTL"""
+        cursor = self._connection().execute(
+            "DELETE FROM jobs WHERE status IN ('done', 'failed') AND finished_at < ?", (time.time() - self.ttl,)
+        )
+        return cursor.rowcount
+
+    def purge_if_due(self) -> int:
+        """purge_expired at most once per PURGE_INTERVAL, however many workers are idle"""
+        with self._purge_lock:
+            now = time.monotonic()
+            if self._last_purge is not None and now - self._last_purge < PURGE_INTERVAL:
+                return 0
+            self._last_purge = now
+        return self.purge_expired()
+
+    def run_job(self, job: sqlite3.Row):
+        """Generate (and render) one claimed job, recording progress as sections complete"""
+        job_id = job['id']
+        generator = self.generator
+        try:
+            if job['mode'] == 'fast':
+                total = 2 + job['render_pdf']
+                self._update(job_id, stage='generating', completed=0, total=total)
+                good_resume, bad_resume = generator.generate_resume_models(job['job_description'], 'fast')
+                completed = 2
+            else:
+                sections = generator.section_names()
+                total = 2 * len(sections) + job['render_pdf']
+                self._update(job_id, stage='generating', completed=0, total=total)
+                built = {True: {}, False: {}}
+                completed = 0
+                for is_matching, name, content in generator.iter_resume_sections(job['job_description']):
+                    built[is_matching][name] = content
+                    completed += 1
+                    self._update(job_id, completed=completed)
+                good_resume, bad_resume = generator.build_resume(built[True]), generator.build_resume(built[False])
+
+            fields = {'good_resume': good_resume.to_json(), 'bad_resume': bad_resume.to_json()}
+            if job['render_pdf']:
+                self._update(job_id, stage='rendering_pdf', completed=completed, **fields)
+                if self._pdf_generator is None:
+                    self._pdf_generator = PDFResumeGenerator()
+                fields['good_pdf'] = self._pdf_generator.render_pdf_bytes(good_resume)
+                fields['bad_pdf'] = self._pdf_generator.render_pdf_bytes(bad_resume)
+
+            self._update(job_id, status='done', stage='done', completed=total, error=None, finished_at=time.time(),
+                         **fields)
+        except Exception as e:
+            # Requeue once for transient API failures; after that the error is reported to the client
+            retry = job['attempts'] < self.max_attempts
+            self._update(job_id, status='queued' if retry else 'failed', stage='queued' if retry else 'failed',
+                         error=f"{type(e).__name__}: {e}", finished_at=None if retry else time.time())
+            print(f"⚠️  Job {job_id} failed (attempt {job['attempts']}): {e}")
+
+    def work(self):
+        """Worker loop: run jobs until stop() is called"""
+        while not self._stopping.is_set():
+            try:
+                job = self.claim()
+            except sqlite3.OperationalError as e:
+                # Another process held the write lock past the timeout; try again shortly
+                print(f"⚠️  Could not claim a job: {e}")
+                job = None
+            if job is None:
+                self.purge_if_due()
+                with self._wakeup:
+                    self._wakeup.wait(POLL_INTERVAL)
+                continue
+            self.run_job(job)
+
+    def start_workers(self, count: int):
+        for index in range(count):
+            worker = threading.Thread(target=self.work, name=f"job-worker-{index}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def stop(self, timeout: float = None):
+        self._stopping.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+        for worker in self._workers:
+            worker.join(timeout)
+
+
+_shared_queue = None
+_shared_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """
+    Process-wide queue at JOB_QUEUE_PATH, started with JOB_WORKERS worker threads.
+    Set JOB_WORKERS=0 on the web tier when separate `python job_queue.py` processes do the work.
+    """
+    global _shared_queue
+    if _shared_queue is None:
+        with _shared_queue_lock:
+            if _shared_queue is None:
+                queue = JobQueue(os.getenv('JOB_QUEUE_PATH', 'jobs.sqlite3'),
+                                 ttl=float(os.getenv('JOB_TTL', 24 * 3600)))
+                queue.start_workers(int(os.getenv('JOB_WORKERS', 2)))
+                _shared_queue = queue
+    return _shared_queue
+
+
+if __name__ == '__main__':
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else int(os.getenv('JOB_WORKERS', 2))
+    queue = JobQueue(os.getenv('JOB_QUEUE_PATH', 'jobs.sqlite3'), ttl=float(os.getenv('JOB_TTL', 24 * 3600)))
+    print(f"🚀 Working jobs from {queue.path} with {workers} worker threads")
+    queue.start_workers(workers)
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print("\n👋 Finishing current jobs...")
+        queue.stop()
@@ -0,0 +1,334 @@
+import os
+import re
+import ast
+import json
+import time
+import random
+import asyncio
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Protocol
+
+from cache import content_key
+from llm_client import get_async_client, get_shared_client
+
+
+@dataclass(slots=True)
+class Completion:
+    """Text of one chat completion plus the token usage reported for it"""
+    content: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+
+class LLMBackend(Protocol):
+    """
+    Where chat completion requests go. Requests are OpenAI chat.completions
+    keyword arguments; section names the call site (summary, parse, ...).
+    """
+
+    def complete(self, request: Dict, section: str) -> Completion: ...
+
+    async def acomplete(self, request: Dict, section: str) -> Completion: ...
+
+
+def _completion(response) -> Completion:
+    usage = getattr(response, 'usage', None)
+    return Completion(
+        content=response.choices[0].message.content.strip(),
+        prompt_tokens=getattr(usage, 'prompt_tokens', 0) or 0,
+        completion_tokens=getattr(usage, 'completion_tokens', 0) or 0
+    )
+
+
+class OpenAIBackend:
+    """OpenAI API backend; uses the pooled process-wide clients unless given its own"""
+
+    def __init__(self, client=None, async_client=None):
+        self._client = client
+        self._async_client = async_client
+
+    @property
+    def client(self):
+        return self._client or get_shared_client()
+
+    @property
+    def async_client(self):
+        """AsyncOpenAI client for the running event loop"""
+        return self._async_client or get_async_client()
+
+    def complete(self, request: Dict, section: str) -> Completion:
+        return _completion(self.client.chat.completions.create(**request))
+
+    async def acomplete(self, request: Dict, section: str) -> Completion:
+        return _completion(await self.async_client.chat.completions.create(**request))
+
+
+class FakeBackendError(RuntimeError):
+    """Injected failure from FakeLLMBackend, shaped like a transient server error"""
+    status_code = 503
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """
+    Latency distribution from a spec string, in seconds:
+    "0.5" or "fixed:0.5", "uniform:0.2:1.5", "normal:1.0:0.3" or
+    "lognormal:1.2:0.5" (median and sigma). Negative samples are clamped to 0.
+    """
+    kind, _, params = spec.partition(':') if ':' in spec else ('fixed', '', spec)
+    values = [float(value) for value in params.split(':') if value]
+    samplers = {
+        'fixed': lambda rng: values[0],
+        'uniform': lambda rng: rng.uniform(values[0], values[1]),
+        'normal': lambda rng: rng.gauss(values[0], values[1]),
+        'lognormal': lambda rng: values[0] * rng.lognormvariate(0, values[1]),
+    }
+    if kind not in samplers:
+        raise ValueError(f"Unknown latency distribution {kind!r}, expected one of {', '.join(samplers)}")
+    sampler = samplers[kind]
+    return lambda rng: max(0.0, sampler(rng))
+
+
+COMPANIES = ['TechCorp', 'InnovateSoft', 'DataFlow Systems', 'CloudTech Solutions', 'DevTools Inc.']
+CITIES = ['Seattle, WA', 'Austin, TX', 'Denver, CO', 'Boston, MA', 'Chicago, IL']
+LEVELS = {
+    'Senior': ('Senior Software Engineer', 'January 2022 - Present'),
+    'Mid-level': ('Software Engineer', 'March 2019 - December 2021'),
+    'Junior': ('Junior Developer', 'June 2016 - February 2019'),
+}
+VERBS = ['Architected', 'Developed', 'Led', 'Optimized', 'Implemented', 'Collaborated on', 'Automated']
+WEAK_SKILLS = ['Excel', 'basic SQL', 'WordPress', 'HTML/CSS', 'Power BI', 'Google Analytics']
+_REQUIREMENTS_RE = re.compile(r'(?:Must-have[^:\n]*|Job requirements): (\[[^\n]*\])')
+_WORD_RE = re.compile(r'[a-z0-9+#.]{2,}')
+
+
+class FakeLLMBackend:
+    """
+    Deterministic in-process backend for benchmarks and load tests.
+
+    Responses are shaped like what the real prompts ask for (section text,
+    job analysis JSON, requirement verdicts, or JSON for json_schema requests),
+    so the whole pipeline runs offline. Latency, errors and malformed
+    structured output are drawn from a random stream seeded by the request
+    and how many times it has been sent, so a run is reproducible regardless
+    of scheduling while retries still see fresh draws. Attempt counts are
+    kept for the max_keys most recently sent requests.
+    """
+
+    def __init__(self, latency: str = '0', error_rate: float = 0.0, malformed_rate: float = 0.0,
+                 chars_per_token: float = 4.0, seed: int = 0, max_keys: int = 10000):
+        self.latency = parse_latency(latency)
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.chars_per_token = chars_per_token
+        self.seed = seed
+        self.max_keys = max_keys
+        self._attempts: 'OrderedDict[str, int]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> 'FakeLLMBackend':
+        return cls(
+            latency=os.getenv('FAKE_LLM_LATENCY', '0'),
+            error_rate=float(os.getenv('FAKE_LLM_ERROR_RATE', 0)),
+            malformed_rate=float(os.getenv('FAKE_LLM_MALFORMED_RATE', 0)),
+            chars_per_token=float(os.getenv('FAKE_LLM_CHARS_PER_TOKEN', 4)),
+            seed=int(os.getenv('FAKE_LLM_SEED', 0))
+        )
+
+    def _rng(self, request: Dict) -> random.Random:
+        key = content_key(self.seed, json.dumps(request, sort_keys=True, default=str))
+        with self._lock:
+            attempt = self._attempts.pop(key, 0) + 1
+            self._attempts[key] = attempt
+            while len(self._attempts) > self.max_keys:
+                self._attempts.popitem(last=False)
+        return random.Random(f"{key}:{attempt}")
+
+    def _respond(self, request: Dict, section: str, rng: random.Random) -> Completion:
+        if rng.random() < self.error_rate:
+            raise FakeBackendError(f"Injected failure for {section} call")
+
+        prompt = '\n'.join(message['content'] for message in request['messages'])
+        response_format = request.get('response_format') or {}
+        if response_format.get('type') == 'json_schema':
+            content = json.dumps(self._structured(response_format['json_schema']['name'], prompt, rng))
+            if rng.random() < self.malformed_rate:
+                content = content[:len(content) // 2]
+        else:
+            content = self._text(section, prompt, rng)
+
+        return Completion(
+            content=content,
+            prompt_tokens=max(1, round(len(prompt) / self.chars_per_token)),
+            completion_tokens=max(1, round(len(content) / self.chars_per_token))
+        )
+
+    def complete(self, request: Dict, section: str) -> Completion:
+        rng = self._rng(request)
+        time.sleep(self.latency(rng))
+        return self._respond(request, section, rng)
+
+    async def acomplete(self, request: Dict, section: str) -> Completion:
+        rng = self._rng(request)
+        await asyncio.sleep(self.latency(rng))
+        return self._respond(request, section, rng)
+
+    # Content shaped like the prompts ask for
+
+    def _requirements(self, prompt: str) -> List[str]:
+        match = _REQUIREMENTS_RE.search(prompt)
+        try:
+            requirements = ast.literal_eval(match.group(1)) if match else []
+        except (ValueError, SyntaxError):
+            return []
+        return [str(requirement) for requirement in requirements]
+
+    def _skills(self, prompt: str, matching: bool, rng: random.Random) -> List[str]:
+        requirements = self._requirements(prompt)
+        if matching:
+            return requirements[:6] or ['Python', 'PostgreSQL', 'REST APIs', 'AWS']
+        return requirements[:1] + rng.sample(WEAK_SKILLS, 3)
+
+    def _bullets(self, skills: List[str], rng: random.Random, count: int) -> List[str]:
+        return [
+            f"{rng.choice(VERBS)} {rng.choice(['services', 'pipelines', 'dashboards', 'APIs'])} using "
+            f"{rng.choice(skills)}, improving {rng.choice(['performance', 'uptime', 'throughput', 'user growth'])} "
+            f"by {rng.randint(10, 60)}%"
+            for _ in range(count)
+        ]
+
+    def _experience(self, prompt: str, matching: bool, rng: random.Random, level: str) -> Dict:
+        title, dates = LEVELS[level]
+        return {
+            'company': rng.choice(COMPANIES), 'title': title, 'dates': dates, 'location': rng.choice(CITIES),
+            'bullets': self._bullets(self._skills(prompt, matching, rng), rng, rng.randint(4, 6))
+        }
+
+    def _education(self, matching: bool, rng: random.Random) -> Dict:
+        return {
+            'entries': [{
+                'degree': "Bachelor of Science in Computer Science" if matching else "Bachelor of Arts in Communications",
+                'institution': rng.choice(['University of Washington', 'University of Texas', 'Boston University']),
+                'year': str(rng.randint(2012, 2018)),
+                'details': ["Relevant Coursework: Distributed Systems, Databases"] if matching else []
+            }],
+            'certifications': ["AWS Certified Solutions Architect - Amazon (2022)",
+                               "Certified Scrum Master - Scrum Alliance (2021)"] if matching else []
+        }
+
+    def _summary(self, prompt: str, matching: bool, rng: random.Random) -> str:
+        skills = self._skills(prompt, matching, rng)
+        years = rng.randint(8, 15) if matching else rng.randint(2, 5)
+        return (f"Results-driven professional with {years} years of experience building production systems. "
+                f"Improved system performance by {rng.randint(20, 60)}% for a platform serving "
+                f"{rng.randint(1, 9)}M users. Experienced with {', '.join(skills[:3])}. "
+                f"Seeking to apply these skills to drive measurable business outcomes.")
+
+    def _structured(self, name: str, prompt: str, rng: random.Random) -> Dict:
+        matching = 'Excellent' in prompt
+        level = next((level for level in LEVELS if f"for a {level}" in prompt), 'Senior')
+        skills = self._skills(prompt, matching, rng)
+        groups = [{'category': 'Core Skills', 'skills': ', '.join(skills)},
+                  {'category': 'Additional Skills', 'skills': 'Git, Docker, Jira'}]
+        education = self._education(matching, rng)
+
+        if name == 'summary':
+            return {'summary': self._summary(prompt, matching, rng)}
+        if name == 'skills':
+            return {'groups': groups}
+        if name == 'experienceentry':
+            return {'entries': [self._experience(prompt, matching, rng, level)]}
+        if name == 'education':
+            return education
+        return {
+            'summary': self._summary(prompt, matching, rng),
+            'skills': groups,
+            'experience': [self._experience(prompt, matching, rng, level) for level in LEVELS],
+            'education': education['entries'],
+            'certifications': education['certifications']
+        }
+
+    def _text(self, section: str, prompt: str, rng: random.Random) -> str:
+        if section == 'parse':
+            requirements = re.findall(r'^\s*\d+\.\s*(.+)$', prompt, re.MULTILINE)
+            return json.dumps({
+                'must_have': requirements[:5] or ['5+ years Python experience', 'SQL databases', 'REST APIs'],
+                'nice_to_have': requirements[5:] or ['AWS experience', 'Docker knowledge'],
+                'job_title': 'Senior Software Engineer',
+                'industry': 'Technology/Software',
+                'responsibilities': ['Develop web applications', 'Build APIs']
+            })
+        if section in ('requirement', 'requirement_batch'):
+            return self._verdicts(section, prompt)
+
+        data = self._structured({'experience': 'experienceentry'}.get(section, section), prompt, rng)
+        if section == 'summary':
+            return data['summary']
+        if section == 'skills':
+            return '\n'.join(f"{group['category']}: {group['skills']}" for group in data['groups'])
+        if section == 'experience':
+            [entry] = data['entries']
+            bullets = '\n'.join(f"• {bullet}" for bullet in entry['bullets'])
+            return f"{entry['company']} - {entry['title']}\n{entry['dates']} | {entry['location']}\n\n{bullets}"
+        if section == 'education':
+            [entry] = data['entries']
+            lines = ['EDUCATION', '', entry['degree'], f"{entry['institution']} | {entry['year']}", *entry['details']]
+            if data['certifications']:
+                lines += ['', 'CERTIFICATIONS', '', *(f"• {name}" for name in data['certifications'])]
+            return '\n'.join(lines)
+        return json.dumps(data)
+
+    def _verdict(self, requirement: str, resume_text: str) -> Dict:
+        words = set(_WORD_RE.findall(requirement.lower()))
+        found = sorted(word for word in words if word in resume_text.lower())
+        meets = bool(words) and len(found) * 2 >= len(words)
+        return {
+            'meets_requirement': meets,
+            'explanation': f"The resume {'mentions' if meets else 'does not clearly mention'} {requirement}.",
+            'evidence': ', '.join(found) or 'No matching text found'
+        }
+
+    def _verdicts(self, section: str, prompt: str) -> str:
+        resume_text = prompt.split('Resume:', 1)[-1]
+        if section == 'requirement':
+            requirement = prompt.split('Requirement: ', 1)[-1].split('\n', 1)[0]
+            return json.dumps(self._verdict(requirement, resume_text))
+
+        block = prompt.split('Requirements:\n', 1)[-1].split('\n\nResume:', 1)[0]
+        results = []
+        for line in block.splitlines():
+            index, _, requirement = line.partition('. ')
+            if index.isdigit():
+                results.append(dict(self._verdict(requirement, resume_text), index=int(index)))
+        return json.dumps({'results': results})
+
+
+_shared_backend = None
+_backend_lock = threading.Lock()
+
+
+def create_backend(name: str = None) -> LLMBackend:
+    """Backend selected by name or RESUME_LLM_BACKEND: "openai" (default) or "fake" """
+    name = (name or os.getenv('RESUME_LLM_BACKEND', 'openai')).lower()
+    if name == 'fake':
+        return FakeLLMBackend.from_env()
+    if name == 'openai':
+        return OpenAIBackend()
+    raise ValueError(f"Unknown LLM backend {name!r}, expected 'openai' or 'fake'")
+
+
+def get_backend() -> LLMBackend:
+    """Process-wide backend chosen by RESUME_LLM_BACKEND"""
+    global _shared_backend
+    if _shared_backend is None:
+        with _backend_lock:
+            if _shared_backend is None:
+                _shared_backend = create_backend()
+    return _shared_backend
+
+
+def backend_configured() -> bool:
+    """Whether LLM calls can be made: the fake needs nothing, OpenAI needs an API key"""
+    return isinstance(get_backend(), FakeLLMBackend) or bool(os.getenv('OPENAI_API_KEY'))
@@ -0,0 +1,90 @@
+import os
+import asyncio
+import threading
+import weakref
+from typing import Any, Coroutine
+
+from openai import (AsyncOpenAI, DEFAULT_CONNECTION_LIMITS, DEFAULT_TIMEOUT,
+                    DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI)
+
+# The HTTP library's Limits/Timeout types, taken from the SDK so we don't pin which one it uses
+Limits = type(DEFAULT_CONNECTION_LIMITS)
+Timeout = type(DEFAULT_TIMEOUT)
+
+_lock = threading.Lock()
+_shared_client = None
+_async_clients = weakref.WeakKeyDictionary()
+_shared_loop = None
+
+
+def _http_limits() -> Limits:
+    """Connection pool limits for OpenAI traffic, tunable per deployment"""
+    return Limits(
+        max_connections=int(os.getenv('OPENAI_MAX_CONNECTIONS', 100)),
+        max_keepalive_connections=int(os.getenv('OPENAI_MAX_KEEPALIVE_CONNECTIONS', 20)),
+        keepalive_expiry=float(os.getenv('OPENAI_KEEPALIVE_EXPIRY', 60))
+    )
+
+
+def _http_timeout() -> Timeout:
+    return Timeout(float(os.getenv('OPENAI_TIMEOUT', 120)), connect=10.0)
+
+
+def create_openai_client() -> OpenAI:
+    return OpenAI(
+        api_key=os.getenv('OPENAI_API_KEY'),
+        http_client=DefaultHttpxClient(limits=_http_limits(), timeout=_http_timeout())
+    )
+
+
+def create_async_openai_client() -> AsyncOpenAI:
+    return AsyncOpenAI(
+        api_key=os.getenv('OPENAI_API_KEY'),
+        http_client=DefaultAsyncHttpxClient(limits=_http_limits(), timeout=_http_timeout())
+    )
+
+
+def get_shared_client() -> OpenAI:
+    """Process-wide OpenAI client; httpx.Client is thread-safe, so every request shares its pool"""
+    global _shared_client
+    if _shared_client is None:
+        with _lock:
+            if _shared_client is None:
+                _shared_client = create_openai_client()
+    return _shared_client
+
+
+def get_async_client() -> AsyncOpenAI:
+    """AsyncOpenAI client for the running event loop (httpx async pools can't cross loops)"""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.get(loop)
+        if client is None:
+            client = create_async_openai_client()
+            _async_clients[loop] = client
+    return client
+
+
+def get_shared_loop() -> asyncio.AbstractEventLoop:
+    """
+    Long-lived event loop running in a daemon thread.
+
+    Flask async views get a fresh loop per request, which would mean a fresh
+    AsyncOpenAI pool (and TLS handshake) per request. Running LLM coroutines on
+    this loop instead keeps one warm pool per worker process. Started lazily so
+    it is created after gunicorn forks.
+    """
+    global _shared_loop
+    if _shared_loop is None:
+        with _lock:
+            if _shared_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='llm-event-loop', daemon=True).start()
+                _shared_loop = loop
+    return _shared_loop
+
+
+async def run_on_shared_loop(coro: Coroutine) -> Any:
+    """Run a coroutine on the shared loop and await its result from any other loop"""
+    future = asyncio.run_coroutine_threadsafe(coro, get_shared_loop())
+    return await asyncio.wrap_future(future)
@@ -0,0 +1,121 @@
+import os
+import time
+import asyncio
+from contextlib import contextmanager
+from typing import Iterator, Tuple
+
+from prometheus_client import (CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram,
+                               generate_latest, multiprocess)
+
+# LLM calls take seconds, not milliseconds, so the default buckets are too fine at the bottom
+LLM_LATENCY_BUCKETS = (0.25, 0.5, 1, 2, 3, 5, 8, 13, 20, 30, 60, 120)
+
+LLM_CALL_SECONDS = Histogram(
+    'llm_call_duration_seconds', 'Wall time of one chat completion call',
+    ['model', 'section', 'outcome'], buckets=LLM_LATENCY_BUCKETS
+)
+LLM_CALLS = Counter('llm_calls_total', 'Chat completion calls', ['model', 'section', 'outcome'])
+LLM_TOKENS = Counter('llm_tokens_total', 'Tokens used by chat completion calls', ['model', 'section', 'kind'])
+LLM_MALFORMED_RESPONSES = Counter(
+    'llm_malformed_responses_total', 'Structured responses that failed to parse and were retried', ['section']
+)
+
+# Outbound rate limiter (see rate_limiter.py); gauges are summed over live workers in multiprocess mode
+LLM_LIMITER_QUEUE_DEPTH = Gauge('llm_limiter_queue_depth', 'LLM calls waiting for the rate limiter',
+                                multiprocess_mode='livesum')
+LLM_LIMITER_IN_FLIGHT = Gauge('llm_limiter_in_flight', 'LLM calls admitted by the rate limiter and not finished',
+                              multiprocess_mode='livesum')
+LLM_LIMITER_CONCURRENCY = Gauge('llm_limiter_concurrency_limit', 'Current adaptive (AIMD) concurrency limit',
+                                multiprocess_mode='livesum')
+LLM_LIMITER_WAIT_SECONDS = Histogram(
+    'llm_limiter_wait_seconds', 'Time an LLM call waited for the rate limiter',
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60)
+)
+LLM_LIMITER_BACKOFFS = Counter('llm_limiter_backoffs_total', 'Concurrency limit decreases', ['reason'])
+
+LLM_RETRIES = Counter('llm_retries_total', 'LLM calls retried after a transient error', ['section', 'error'])
+LLM_HEDGES = Counter('llm_hedges_total', 'Hedged LLM calls by which request answered first', ['section', 'outcome'])
+
+SINGLEFLIGHT_SHARED = Counter(
+    'singleflight_shared_total', 'Calls that joined an identical in-flight call instead of running their own', ['operation']
+)
+
+SECTION_CACHE_LOOKUPS = Counter(
+    'section_cache_lookups_total', 'Section variant cache lookups by result (hit or miss)', ['section', 'result']
+)
+
+REQUIREMENT_VERDICT_CACHE = Counter(
+    'requirement_verdict_cache_total', 'Requirement verdict cache lookups by result (hit or miss)', ['result']
+)
+REQUIREMENT_VERDICT_EVICTIONS = Counter(
+    'requirement_verdict_cache_evictions_total', 'Requirement verdicts evicted to stay within VERDICT_CACHE_SIZE'
+)
+
+REQUIREMENT_PRESCREEN = Counter(
+    'requirement_prescreen_total', 'Requirements checked by the local matcher, by outcome (met, ambiguous)',
+    ['outcome']
+)
+
+WARM_POOL_TAKES = Counter('warm_pool_takes_total',
+                          'Warm pool lookups by result (hit, miss, or conflict when every ready section names a must-have)',
+                          ['section', 'result'])
+WARM_POOL_SECTIONS = Gauge('warm_pool_sections', 'Pre-generated sections ready in the warm pool',
+                           multiprocess_mode='livesum')
+
+HTTP_REQUESTS = Counter('http_requests_total', 'HTTP requests handled', ['endpoint', 'method', 'status'])
+HTTP_REQUEST_SECONDS = Histogram(
+    'http_request_duration_seconds', 'Time to build the HTTP response (streams are timed to the first byte)',
+    ['endpoint', 'method'], buckets=LLM_LATENCY_BUCKETS
+)
+
+
+class LLMCall:
+    """Collects token usage for one instrumented call"""
+
+    def __init__(self, model: str, section: str):
+        self.model = model
+        self.section = section
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def record_usage(self, completion):
+        """Take token counts from an llm_backend Completion"""
+        self.prompt_tokens = completion.prompt_tokens
+        self.completion_tokens = completion.completion_tokens
+
+
+@contextmanager
+def observe_llm_call(model: str, section: str) -> Iterator[LLMCall]:
+    """Time a chat completion call and record its outcome and token usage"""
+    call = LLMCall(model, section)
+    outcome = 'error'
+    start = time.perf_counter()
+    try:
+        yield call
+        outcome = 'success'
+    except asyncio.CancelledError:
+        # The losing half of a hedged call
+        outcome = 'cancelled'
+        raise
+    finally:
+        LLM_CALL_SECONDS.labels(model, section, outcome).observe(time.perf_counter() - start)
+        LLM_CALLS.labels(model, section, outcome).inc()
+        if call.prompt_tokens:
+            LLM_TOKENS.labels(model, section, 'prompt').inc(call.prompt_tokens)
+        if call.completion_tokens:
+            LLM_TOKENS.labels(model, section, 'completion').inc(call.completion_tokens)
+
+
+def observe_http_request(endpoint: str, method: str, status: int, seconds: float):
+    HTTP_REQUESTS.labels(endpoint, method, str(status)).inc()
+    HTTP_REQUEST_SECONDS.labels(endpoint, method).observe(seconds)
+
+
+def metrics_payload() -> Tuple[bytes, str]:
+    """Prometheus exposition of every metric, aggregated across workers when multiprocess mode is on"""
+    if os.getenv('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
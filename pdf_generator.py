@@ -4,7 +4,45 @@ from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak, Table, TableStyle, HRFlowable
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
 from reportlab.lib.colors import black, darkblue, grey
+import io
 import re
+from xml.sax.saxutils import escape
+from resume_model import Resume
+
+# Line classification patterns for _parse_resume_text, compiled once
+_NON_NAME_PREFIXES = ('📧', 'Email:', 'Phone:', 'LinkedIn:', '💼', '🛠️', '🎓', '🏅')
+_LEADING_SYMBOLS_RE = re.compile(r'^[^\w\s]+\s*')
+_NAME_STOPWORDS_RE = re.compile(r'SUMMARY|SKILLS|EXPERIENCE|EDUCATION')
+_CONTACT_EMOJI_RE = re.compile(r'[📧📞🌍💼]\s*')
+_COMPANY_EMOJI_RE = re.compile(r'[🏢]\s*')
+_DATES_EMOJI_RE = re.compile(r'[📅📍]\s*')
+_SECTION_EMOJI_RES = {
+    'summary': re.compile(r'[💼🛠️🎓🏅🚀📧📞🌍🏢📅📍]\s*'),
+    'skills': re.compile(r'[🛠️💼🎓🏅]\s*'),
+    'education': re.compile(r'[🎓📚🏅]\s*'),
+    'certifications': re.compile(r'[🏅🎓]\s*'),
+}
+# Checked in order, so a line naming several sections picks the first one listed
+_SECTION_HEADERS = (
+    ('summary', ('PROFESSIONAL SUMMARY',)),
+    ('experience', ('WORK EXPERIENCE', 'PROFESSIONAL EXPERIENCE')),
+    ('skills', ('TECHNICAL SKILLS', 'TECHNICAL EXPERTISE')),
+    ('education', ('EDUCATION',)),
+    ('certifications', ('CERTIFICATIONS',)),
+)
+_SECTION_KEYWORDS_RE = re.compile('|'.join(
+    re.escape(keyword) for _, keywords in _SECTION_HEADERS for keyword in keywords
+))
+
+
+def _section_header(line_upper):
+    """Section a header line opens, or None; the combined search rules out most lines cheaply"""
+    if not _SECTION_KEYWORDS_RE.search(line_upper):
+        return None
+    for section, keywords in _SECTION_HEADERS:
+        if any(keyword in line_upper for keyword in keywords):
+            return section
+    return None
 
 class PDFResumeGenerator:
     def __init__(self):
@@ -124,102 +162,69 @@ class PDFResumeGenerator:
         ))
     
     def _parse_resume_text(self, resume_text):
-        lines = [line.strip() for line in resume_text.strip().split('\n') if line.strip()]
-        
-        parsed = {
-            'name': '',
-            'contact': '',
-            'summary': '',
-            'experience': [],
-            'skills': '',
-            'education': '',
-            'certifications': ''
-        }
+        """
+        Single pass over the lines: each line is classified once with the
+        precompiled patterns above, and section text is collected in lists
+        that are joined at the end so parsing stays linear in resume length.
+        """
+        name = ''
+        contact = ''
+        sections = {'summary': [], 'skills': [], 'education': [], 'certifications': []}
+        experience = []
         
         current_section = None
         current_job = None
         
-        for line in lines:
-            # Skip separator lines
-            if line.startswith('══════'):
+        for raw_line in resume_text.strip().split('\n'):
+            line = raw_line.strip()
+            # Skip blank and separator lines
+            if not line or line.startswith('══════'):
                 continue
-                
-            line_upper = line.upper()
             
             # Extract name (remove emojis if present)
-            if not parsed['name'] and not line.startswith(('📧', 'Email:', 'Phone:', 'LinkedIn:', '💼', '🛠️', '🎓', '🏅')):
-                # Clean name of any leading emojis
-                clean_name = re.sub(r'^[^\w\s]+\s*', '', line)
-                if clean_name.strip() and not any(keyword in clean_name.upper() for keyword in ['SUMMARY', 'SKILLS', 'EXPERIENCE', 'EDUCATION']):
-                    parsed['name'] = clean_name.strip()
+            if not name and not line.startswith(_NON_NAME_PREFIXES):
+                clean_name = _LEADING_SYMBOLS_RE.sub('', line).strip()
+                if clean_name and not _NAME_STOPWORDS_RE.search(clean_name.upper()):
+                    name = clean_name
                 continue
             
             # Handle emoji-formatted contact info
-            if line.startswith('📧') or line.startswith('Email:') or ('📞' in line and '🌍' in line and '💼' in line):
-                # Extract contact info and clean emojis for PDF
-                contact_line = re.sub(r'[📧📞🌍💼]\s*', '', line)
-                parsed['contact'] = contact_line
+            if line.startswith(('📧', 'Email:')) or ('📞' in line and '🌍' in line and '💼' in line):
+                contact = _CONTACT_EMOJI_RE.sub('', line)
                 continue
             
-            # Section detection with emoji support
-            if ('💼' in line and 'PROFESSIONAL SUMMARY' in line_upper) or 'PROFESSIONAL SUMMARY' in line_upper:
-                current_section = 'summary'
-                continue
-            elif ('💼' in line and 'PROFESSIONAL EXPERIENCE' in line_upper) or 'WORK EXPERIENCE' in line_upper or 'PROFESSIONAL EXPERIENCE' in line_upper:
-                current_section = 'experience'
-                continue
-            elif ('🛠️' in line and 'TECHNICAL EXPERTISE' in line_upper) or 'TECHNICAL SKILLS' in line_upper or 'TECHNICAL EXPERTISE' in line_upper:
-                current_section = 'skills'
-                continue
-            elif ('🎓' in line and 'EDUCATION' in line_upper) or 'EDUCATION' in line_upper:
-                current_section = 'education'
-                continue
-            elif ('🏅' in line and 'CERTIFICATIONS' in line_upper) or 'CERTIFICATIONS' in line_upper:
-                current_section = 'certifications'
+            # Section detection; the cheap combined search rules out almost every line
+            section = _section_header(line.upper())
+            if section:
+                current_section = section
                 continue
             
-            if current_section == 'summary':
-                # Clean emojis from summary content
-                clean_line = re.sub(r'[💼🛠️🎓🏅🚀📧📞🌍🏢📅📍]\s*', '', line)
-                if clean_line.strip():
-                    parsed['summary'] += clean_line + ' '
-            elif current_section == 'experience':
-                # Handle emoji-formatted experience entries
+            if current_section == 'experience':
                 if line.startswith('🏢'):
                     # Company-title line
                     if current_job:
-                        parsed['experience'].append(current_job)
-                    clean_line = re.sub(r'[🏢]\s*', '', line)
-                    if ' - ' in clean_line:
-                        parts = clean_line.split(' - ', 1)
-                        current_job = {
-                            'title': parts[1].strip() if len(parts) > 1 else clean_line.strip(),
-                            'company': parts[0].strip() if len(parts) > 1 else '',
-                            'dates': '',
-                            'bullets': []
-                        }
+                        experience.append(current_job)
+                    clean_line = _COMPANY_EMOJI_RE.sub('', line)
+                    company, dash, title = clean_line.partition(' - ')
+                    if dash:
+                        current_job = {'title': title.strip(), 'company': company.strip(), 'dates': '', 'bullets': []}
                     else:
-                        current_job = {
-                            'title': clean_line.strip(),
-                            'company': '',
-                            'dates': '',
-                            'bullets': []
-                        }
+                        current_job = {'title': clean_line.strip(), 'company': '', 'dates': '', 'bullets': []}
                 elif line.startswith('📅') and current_job:
                     # Date-location line
-                    clean_line = re.sub(r'[📅📍]\s*', '', line)
+                    clean_line = _DATES_EMOJI_RE.sub('', line)
                     if '|' in clean_line:
                         parts = clean_line.split('|')
                         current_job['dates'] = parts[0].strip()
-                        current_job['company'] += f" | {parts[1].strip()}" if len(parts) > 1 else ""
+                        current_job['company'] += f" | {parts[1].strip()}"
                     else:
                         current_job['dates'] = clean_line.strip()
                 elif line.startswith('•') and current_job:
                     current_job['bullets'].append(line[1:].strip())
-                elif '|' in line and not line.startswith('•') and not line.startswith('🏢') and not line.startswith('📅'):
+                elif '|' in line and not line.startswith(('•', '🏢', '📅')):
                     # Fallback for traditional format
                     if current_job:
-                        parsed['experience'].append(current_job)
+                        experience.append(current_job)
                     parts = line.split('|')
                     current_job = {
                         'title': parts[0].strip(),
@@ -227,93 +232,134 @@ class PDFResumeGenerator:
                         'dates': parts[2].strip() if len(parts) > 2 else '',
                         'bullets': []
                     }
-            elif current_section == 'skills':
-                # Clean emojis from skills
-                clean_line = re.sub(r'[🛠️💼🎓🏅]\s*', '', line)
+            elif current_section:
+                # Clean emojis from summary, skills, education and certifications
+                clean_line = _SECTION_EMOJI_RES[current_section].sub('', line)
                 if clean_line.strip():
-                    parsed['skills'] += clean_line + '\n'
-            elif current_section == 'education':
-                # Clean emojis from education
-                clean_line = re.sub(r'[🎓📚🏅]\s*', '', line)
-                if clean_line.strip():
-                    parsed['education'] += clean_line + '\n'
-            elif current_section == 'certifications':
-                # Clean emojis from certifications
-                clean_line = re.sub(r'[🏅🎓]\s*', '', line)
-                if clean_line.strip():
-                    parsed['certifications'] += clean_line + '\n'
+                    sections[current_section].append(clean_line)
         
         if current_job:
-            parsed['experience'].append(current_job)
+            experience.append(current_job)
+        
+        return {
+            'name': name,
+            'contact': contact.rstrip(' | '),
+            'summary': ''.join(part + ' ' for part in sections['summary']),
+            'experience': experience,
+            'skills': ''.join(part + '\n' for part in sections['skills']),
+            'education': ''.join(part + '\n' for part in sections['education']),
+            'certifications': ''.join(part + '\n' for part in sections['certifications'])
+        }
+    
+    def _resume_fields(self, resume):
+        """Fields the PDF layout needs, read straight from the model"""
+        education = []
+        for entry in resume.education.entries:
+            education.extend(entry.lines())
+        
+        return {
+            'name': resume.contact.name,
+            'contact': resume.contact.to_line(),
+            'summary': resume.summary.text,
+            'experience': [
+                {'title': job.title, 'company_info': job.company_line(), 'bullets': job.details + job.bullets}
+                for job in resume.experience
+            ],
+            'skills': resume.skills.lines(),
+            'education': education,
+            'certifications': [f"• {certification}" for certification in resume.education.certifications]
+        }
+    
+    def _text_fields(self, resume_text):
+        """Fields the PDF layout needs, recovered from emoji-formatted text"""
+        parsed = self._parse_resume_text(resume_text)
+        
+        experience = []
+        for job in parsed['experience']:
+            company_info = f"{job['company']} | {job['dates']}" if job['company'] and job['dates'] else job['company'] or job['dates']
+            experience.append({'title': job['title'], 'company_info': company_info, 'bullets': job['bullets']})
         
-        parsed['contact'] = parsed['contact'].rstrip(' | ')
-        return parsed
+        return {
+            'name': parsed['name'],
+            'contact': parsed['contact'],
+            'summary': parsed['summary'].strip(),
+            'experience': experience,
+            'skills': parsed['skills'].strip().split('\n'),
+            'education': parsed['education'].strip().split('\n'),
+            'certifications': parsed['certifications'].strip().split('\n')
+        }
+    
+    def _escape_fields(self, fields):
+        """Escape every string so client-supplied text is never read as Paragraph markup"""
+        if isinstance(fields, str):
+            return escape(fields)
+        if isinstance(fields, dict):
+            return {key: self._escape_fields(value) for key, value in fields.items()}
+        if isinstance(fields, list):
+            return [self._escape_fields(value) for value in fields]
+        return fields
     
-    def create_pdf_resume(self, resume_text, filename):
+    def create_pdf_resume(self, resume, filename):
+        # resume is a Resume model, or resume text from clients that only have the text
+        # filename may also be a binary file-like object (see render_pdf_bytes)
         # Reduced top margin to remove extra spacing
         doc = SimpleDocTemplate(filename, pagesize=letter,
                               rightMargin=0.75*inch, leftMargin=0.75*inch,
                               topMargin=0.5*inch, bottomMargin=0.75*inch)
         
         story = []
-        parsed = self._parse_resume_text(resume_text)
+        fields = self._escape_fields(self._resume_fields(resume) if isinstance(resume, Resume) else self._text_fields(resume))
         
         # Name with no top spacing
-        if parsed['name']:
-            story.append(Paragraph(parsed['name'], self.styles['Name']))
+        if fields['name']:
+            story.append(Paragraph(fields['name'], self.styles['Name']))
         
         # Contact info
-        if parsed['contact']:
-            story.append(Paragraph(parsed['contact'], self.styles['Contact']))
+        if fields['contact']:
+            story.append(Paragraph(fields['contact'], self.styles['Contact']))
         
         # Professional Summary with section line
-        if parsed['summary']:
+        if fields['summary']:
             story.append(self._create_section_header("PROFESSIONAL SUMMARY"))
-            story.append(Paragraph(parsed['summary'].strip(), self.styles['Summary']))
+            story.append(Paragraph(fields['summary'], self.styles['Summary']))
         
         # Work Experience
-        if parsed['experience']:
+        if fields['experience']:
             story.append(self._create_section_header("WORK EXPERIENCE"))
-            for i, job in enumerate(parsed['experience']):
+            for i, job in enumerate(fields['experience']):
                 if job['title']:
                     story.append(Paragraph(job['title'], self.styles['JobTitle']))
                 
-                if job['company'] or job['dates']:
-                    company_info = f"{job['company']} | {job['dates']}" if job['company'] and job['dates'] else job['company'] or job['dates']
-                    story.append(Paragraph(company_info, self.styles['CompanyDates']))
+                if job['company_info']:
+                    story.append(Paragraph(job['company_info'], self.styles['CompanyDates']))
                 
                 # Bullet points with proper spacing
                 for bullet in job['bullets']:
                     story.append(Paragraph(f"• {bullet}", self.styles['BulletPoint']))
                 
                 # Add spacing between jobs (except after last job)
-                if i < len(parsed['experience']) - 1:
+                if i < len(fields['experience']) - 1:
                     story.append(Spacer(1, 6))
         
-        # Technical Skills
-        if parsed['skills']:
-            story.append(self._create_section_header("TECHNICAL SKILLS"))
-            for line in parsed['skills'].strip().split('\n'):
-                if line.strip():
-                    story.append(Paragraph(line.strip(), self.styles['Skills']))
-        
-        # Education
-        if parsed['education']:
-            story.append(self._create_section_header("EDUCATION"))
-            for line in parsed['education'].strip().split('\n'):
-                if line.strip():
-                    story.append(Paragraph(line.strip(), self.styles['Education']))
-        
-        # Certifications
-        if parsed['certifications']:
-            story.append(self._create_section_header("CERTIFICATIONS"))
-            for line in parsed['certifications'].strip().split('\n'):
-                if line.strip():
-                    story.append(Paragraph(line.strip(), self.styles['Education']))
+        # Technical Skills, Education and Certifications, one paragraph per line
+        for title, key, style in (("TECHNICAL SKILLS", 'skills', 'Skills'),
+                                  ("EDUCATION", 'education', 'Education'),
+                                  ("CERTIFICATIONS", 'certifications', 'Education')):
+            lines = [line.strip() for line in fields[key] if line.strip()]
+            if lines:
+                story.append(self._create_section_header(title))
+                for line in lines:
+                    story.append(Paragraph(line, self.styles[style]))
         
         doc.build(story)
         return filename
     
+    def render_pdf_bytes(self, resume):
+        """Render the resume (model or text) into an in-memory buffer and return the PDF bytes"""
+        buffer = io.BytesIO()
+        self.create_pdf_resume(resume, buffer)
+        return buffer.getvalue()
+    
     def _create_section_header(self, title):
         """Create a section header with a horizontal line underneath"""
         from reportlab.platypus import KeepTogether
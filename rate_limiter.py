@@ -0,0 +1,261 @@
+import os
+import time
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Dict, Iterator
+
+from metrics import (LLM_LIMITER_BACKOFFS, LLM_LIMITER_CONCURRENCY, LLM_LIMITER_IN_FLIGHT, LLM_LIMITER_QUEUE_DEPTH,
+                     LLM_LIMITER_WAIT_SECONDS)
+
+# Requests don't set max_tokens, so this stands in for the completion until the real usage is known
+DEFAULT_COMPLETION_ESTIMATE = 500
+# How often waiters re-check when blocked on concurrency rather than a known refill time
+RECHECK_INTERVAL = 0.05
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """OpenAI RateLimitError (and any other API error) carries the HTTP status"""
+    return getattr(error, 'status_code', None) == 429
+
+
+class TokenBucket:
+    """
+    Budget refilled continuously at per_minute / 60 per second up to one minute's worth.
+    The level may go negative when a call turns out to cost more than was reserved.
+    """
+
+    def __init__(self, per_minute: float, now: float):
+        self.rate = per_minute / 60
+        self.capacity = per_minute
+        self.level = per_minute
+        self.updated = now
+
+    def _refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until amount is available; 0 if it is now. Amounts above capacity wait for a full bucket"""
+        self._refill(now)
+        shortfall = min(amount, self.capacity) - self.level
+        return max(0.0, shortfall / self.rate)
+
+    def take(self, amount: float, now: float):
+        self._refill(now)
+        self.level -= amount
+
+
+class AIMDLimit:
+    """
+    Additive-increase / multiplicative-decrease concurrency limit.
+
+    Every successful call raises the limit by 1/limit (about +1 per limit's worth
+    of calls); a 429 or a latency spike multiplies it by decrease, at most once
+    per cooldown so one burst of failures counts as one signal. Latency is judged
+    per section against that section's moving average, since sections differ
+    several-fold in length.
+    """
+
+    def __init__(self, initial: float, minimum: float = 1, maximum: float = None, decrease: float = 0.5,
+                 cooldown: float = 2.0, spike_factor: float = 3.0, min_spike_seconds: float = 1.0):
+        self.minimum = minimum
+        self.maximum = maximum or initial
+        self.limit = min(max(initial, minimum), self.maximum)
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.spike_factor = spike_factor
+        self.min_spike_seconds = min_spike_seconds
+        self._baselines: Dict[str, list] = {}
+        self._last_decrease = float('-inf')
+
+    def _back_off(self, reason: str, now: float):
+        if now - self._last_decrease < self.cooldown:
+            return
+        self._last_decrease = now
+        self.limit = max(self.minimum, self.limit * self.decrease)
+        LLM_LIMITER_BACKOFFS.labels(reason).inc()
+
+    def on_success(self, section: str, latency: float, now: float):
+        baseline = self._baselines.setdefault(section, [0.0, 0])
+        average, samples = baseline
+        # Need a few samples before a single slow call can count as a spike
+        if samples >= 5 and latency > average * self.spike_factor and latency - average > self.min_spike_seconds:
+            self._back_off('latency', now)
+        else:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+        baseline[0] = latency if samples == 0 else 0.9 * average + 0.1 * latency
+        baseline[1] = samples + 1
+
+    def on_rate_limited(self, now: float):
+        self._back_off('rate_limited', now)
+
+
+class Permit:
+    """An admitted call; report the completion so the token budget reflects real usage"""
+
+    def __init__(self, section: str, reserved_tokens: int):
+        self.section = section
+        self.reserved_tokens = reserved_tokens
+        self.used_tokens = None
+
+    def record_usage(self, completion):
+        total = completion.prompt_tokens + completion.completion_tokens
+        if total:
+            self.used_tokens = total
+
+
+class RateLimiter:
+    """
+    Process-wide gate in front of LLM calls: requests-per-minute and
+    tokens-per-minute token buckets plus an adaptive concurrency limit.
+
+    Works from threads (acquire) and from any event loop (aacquire); state sits
+    behind one threading lock, and async waiters sleep instead of blocking the loop.
+    A budget of 0 disables that bucket.
+    """
+
+    def __init__(self, requests_per_minute: float = 0, tokens_per_minute: float = 0, max_concurrency: int = 32,
+                 min_concurrency: int = 1, completion_estimate: int = DEFAULT_COMPLETION_ESTIMATE,
+                 clock: Callable[[], float] = time.monotonic, **aimd_options):
+        self.clock = clock
+        now = clock()
+        self.requests = TokenBucket(requests_per_minute, now) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute, now) if tokens_per_minute else None
+        self.concurrency = AIMDLimit(max_concurrency, minimum=min_concurrency, **aimd_options)
+        self.completion_estimate = completion_estimate
+        self.in_flight = 0
+        self.waiting = 0
+        self._changed = threading.Condition(threading.Lock())
+        LLM_LIMITER_CONCURRENCY.set(self.concurrency.limit)
+
+    def estimate_tokens(self, request: Dict) -> int:
+        """Prompt tokens at ~4 characters each plus the expected completion"""
+        prompt_chars = sum(len(str(message.get('content', ''))) for message in request.get('messages', []))
+        return prompt_chars // 4 + request.get('max_tokens', self.completion_estimate)
+
+    def _try_admit(self, tokens: int) -> float:
+        """Admit the call and return 0, or return how long to wait before trying again (lock held)"""
+        if self.in_flight >= int(self.concurrency.limit):
+            return RECHECK_INTERVAL
+        now = self.clock()
+        wait = max(self.requests.wait_time(1, now) if self.requests else 0.0,
+                   self.tokens.wait_time(tokens, now) if self.tokens else 0.0)
+        if wait > 0:
+            return wait
+        if self.requests:
+            self.requests.take(1, now)
+        if self.tokens:
+            self.tokens.take(tokens, now)
+        self.in_flight += 1
+        LLM_LIMITER_IN_FLIGHT.inc()
+        return 0.0
+
+    def _release(self, permit: Permit, started: float, error: BaseException = None):
+        with self._changed:
+            now = self.clock()
+            self.in_flight -= 1
+            LLM_LIMITER_IN_FLIGHT.dec()
+            if self.tokens and permit.used_tokens is not None:
+                # Settle the reservation against what the call actually used
+                self.tokens.take(permit.used_tokens - permit.reserved_tokens, now)
+            if error is None:
+                self.concurrency.on_success(permit.section, now - started, now)
+            elif is_rate_limit_error(error):
+                self.concurrency.on_rate_limited(now)
+            LLM_LIMITER_CONCURRENCY.set(self.concurrency.limit)
+            self._changed.notify_all()
+
+    def _start_waiting(self):
+        self.waiting += 1
+        LLM_LIMITER_QUEUE_DEPTH.inc()
+
+    def _stop_waiting(self, queued_at: float):
+        self.waiting -= 1
+        LLM_LIMITER_QUEUE_DEPTH.dec()
+        LLM_LIMITER_WAIT_SECONDS.observe(self.clock() - queued_at)
+
+    @contextmanager
+    def acquire(self, request: Dict, section: str) -> Iterator[Permit]:
+        """Block until the call may go out; wrap exactly one LLM call"""
+        permit = Permit(section, self.estimate_tokens(request))
+        queued_at = self.clock()
+        with self._changed:
+            self._start_waiting()
+            try:
+                while (wait := self._try_admit(permit.reserved_tokens)) > 0:
+                    self._changed.wait(wait)
+            finally:
+                self._stop_waiting(queued_at)
+
+        started = self.clock()
+        try:
+            yield permit
+        except BaseException as e:
+            self._release(permit, started, e)
+            raise
+        self._release(permit, started)
+
+    @asynccontextmanager
+    async def aacquire(self, request: Dict, section: str) -> AsyncIterator[Permit]:
+        """Async version of acquire; waits with asyncio.sleep so the event loop keeps running"""
+        permit = Permit(section, self.estimate_tokens(request))
+        queued_at = self.clock()
+        with self._changed:
+            self._start_waiting()
+        try:
+            while True:
+                with self._changed:
+                    wait = self._try_admit(permit.reserved_tokens)
+                if wait == 0:
+                    break
+                await asyncio.sleep(min(wait, RECHECK_INTERVAL))
+        finally:
+            with self._changed:
+                self._stop_waiting(queued_at)
+
+        started = self.clock()
+        try:
+            yield permit
+        except BaseException as e:
+            self._release(permit, started, e)
+            raise
+        self._release(permit, started)
+
+    def stats(self) -> Dict[str, float]:
+        with self._changed:
+            return {
+                'in_flight': self.in_flight,
+                'waiting': self.waiting,
+                'concurrency_limit': self.concurrency.limit,
+                'request_budget': self.requests.level if self.requests else None,
+                'token_budget': self.tokens.level if self.tokens else None
+            }
+
+
+_shared_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def create_rate_limiter() -> RateLimiter:
+    """
+    Limiter configured from the environment. Budgets are per process: with N
+    workers, set each to the account limit divided by N. 0 disables a budget.
+    """
+    return RateLimiter(
+        requests_per_minute=float(os.getenv('LLM_REQUESTS_PER_MINUTE', 0)),
+        tokens_per_minute=float(os.getenv('LLM_TOKENS_PER_MINUTE', 0)),
+        max_concurrency=int(os.getenv('LLM_MAX_CONCURRENCY', 32)),
+        min_concurrency=int(os.getenv('LLM_MIN_CONCURRENCY', 1)),
+        completion_estimate=int(os.getenv('LLM_COMPLETION_TOKEN_ESTIMATE', DEFAULT_COMPLETION_ESTIMATE))
+    )
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Process-wide limiter shared by every generator and analyzer"""
+    global _shared_limiter
+    if _shared_limiter is None:
+        with _limiter_lock:
+            if _shared_limiter is None:
+                _shared_limiter = create_rate_limiter()
+    return _shared_limiter
@@ -0,0 +1,223 @@
+import os
+import re
+import json
+import asyncio
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+from openai import AsyncOpenAI
+from cache import TTLCache, content_key, normalize_text
+from llm_backend import LLMBackend, OpenAIBackend, get_backend
+from metrics import REQUIREMENT_VERDICT_CACHE, REQUIREMENT_VERDICT_EVICTIONS, observe_llm_call
+from rate_limiter import RateLimiter, get_rate_limiter
+from requirement_matcher import RequirementMatcher
+from retry_policy import ResilientCaller, get_resilient_caller
+
+ANALYSIS_MODEL = "gpt-3.5-turbo"
+
+# Requirements judged per structured call; larger lists are split into parallel chunks
+MAX_REQUIREMENTS_PER_CALL = 12
+MAX_PARALLEL_CALLS = 4
+
+# Bump VERDICT_PROMPT_VERSION whenever the analysis prompts change so cached verdicts are not reused
+VERDICT_PROMPT_VERSION = 1
+
+# Verdicts per (resume content, requirement), shared by every analyzer in the process, so the
+# evidence modal and repeat evaluations reuse the batch answer instead of asking again
+requirement_verdict_cache = TTLCache(
+    maxsize=int(os.getenv('VERDICT_CACHE_SIZE', 4096)),
+    ttl=float(os.getenv('VERDICT_CACHE_TTL', 3600))
+)
+
+
+class RequirementAnalyzer:
+    """Judge whether a resume meets job requirements using an LLM"""
+
+    def __init__(self, max_requirements_per_call: int = MAX_REQUIREMENTS_PER_CALL,
+                 max_parallel_calls: int = MAX_PARALLEL_CALLS, async_client: AsyncOpenAI = None,
+                 backend: LLMBackend = None, limiter: RateLimiter = None, resilience: ResilientCaller = None,
+                 verdict_cache: TTLCache = None, prescreen: bool = None):
+        if backend is None and async_client:
+            backend = OpenAIBackend(async_client=async_client)
+        self.backend = backend or get_backend()
+        self.limiter = limiter or get_rate_limiter()
+        self.resilience = resilience or get_resilient_caller()
+        self.max_requirements_per_call = max(1, max_requirements_per_call)
+        self.max_parallel_calls = max(1, max_parallel_calls)
+        self.verdict_cache = requirement_verdict_cache if verdict_cache is None else verdict_cache
+        if prescreen is None:
+            prescreen = os.getenv('REQUIREMENT_PRESCREEN', '1').lower() not in ('0', 'false', 'no')
+        # Answer plain keyword requirements locally and only ask the model about the rest
+        self.matcher = RequirementMatcher() if prescreen else None
+
+    async def _complete(self, request: Dict, section: str) -> str:
+        return await self.resilience.acall(section, partial(self._complete_once, request, section))
+
+    async def _complete_once(self, request: Dict, section: str) -> str:
+        async with self.limiter.aacquire(request, section) as permit:
+            with observe_llm_call(request['model'], section) as call:
+                completion = await self.backend.acomplete(request, section)
+                call.record_usage(completion)
+                permit.record_usage(completion)
+        return completion.content.strip()
+
+    def _single_request(self, requirement: str, resume_text: str) -> Dict:
+        prompt = f"""
+Analyze if the following resume meets the specific requirement. Return a JSON response with:
+1. "meets_requirement": true/false
+2. "explanation": Brief factual explanation (1-2 sentences)
+3. "evidence": Specific text from the resume that supports your decision (or lack thereof)
+
+Requirement: {requirement}
+
+Resume:
+{resume_text}
+
+Be strict in your evaluation. Only return true if the requirement is clearly and explicitly met.
+"""
+        return {
+            'model': ANALYSIS_MODEL,
+            'messages': [{"role": "user", "content": prompt}],
+            'temperature': 0
+        }
+
+    def _parse_single(self, ai_response: str) -> Tuple[Dict, bool]:
+        """
+        The verdict in a single-requirement answer, and whether it was well-formed.
+        Answers without a JSON object holding a boolean meets_requirement get a
+        best-effort verdict from the raw text, which is not worth caching.
+        """
+        # Try to extract JSON from the response
+        json_match = re.search(r'\{.*\}', ai_response, re.DOTALL)
+        if json_match:
+            try:
+                verdict = json.loads(json_match.group())
+            except json.JSONDecodeError:
+                verdict = None
+            if isinstance(verdict, dict) and isinstance(verdict.get('meets_requirement'), bool):
+                return verdict, True
+
+        # Fallback parsing if AI doesn't return proper JSON
+        meets = 'true' in ai_response.lower() and 'meets_requirement' in ai_response.lower()
+        return {
+            'meets_requirement': meets,
+            'explanation': ai_response[:200] + '...' if len(ai_response) > 200 else ai_response,
+            'evidence': 'See full analysis above'
+        }, False
+
+    def _verdict_key(self, requirement: str, resume_text: str) -> str:
+        return content_key(ANALYSIS_MODEL, VERDICT_PROMPT_VERSION, normalize_text(resume_text), normalize_text(requirement))
+
+    def _cached_verdict(self, requirement: str, resume_text: str) -> Optional[Dict]:
+        verdict = self.verdict_cache.get(self._verdict_key(requirement, resume_text))
+        REQUIREMENT_VERDICT_CACHE.labels('miss' if verdict is None else 'hit').inc()
+        return None if verdict is None else dict(verdict)
+
+    def _cache_verdict(self, requirement: str, resume_text: str, verdict: Dict):
+        evictions = self.verdict_cache.evictions
+        self.verdict_cache.set(self._verdict_key(requirement, resume_text), dict(verdict))
+        REQUIREMENT_VERDICT_EVICTIONS.inc(self.verdict_cache.evictions - evictions)
+
+    def _prescreen(self, requirement: str, resume_text: str) -> Optional[Dict]:
+        return self.matcher.match(requirement, resume_text) if self.matcher else None
+
+    async def analyze(self, requirement: str, resume_text: str) -> Dict:
+        """
+        Analyze a single requirement against the resume, reusing a cached verdict or
+        answering locally when the requirement is a clear-cut keyword check
+        """
+        verdict = self._cached_verdict(requirement, resume_text) or self._prescreen(requirement, resume_text)
+        if verdict is None:
+            verdict, well_formed = await self._analyze_uncached(requirement, resume_text)
+            if well_formed:
+                self._cache_verdict(requirement, resume_text, verdict)
+        return verdict
+
+    async def _analyze_uncached(self, requirement: str, resume_text: str) -> Tuple[Dict, bool]:
+        return self._parse_single(await self._complete(self._single_request(requirement, resume_text), 'requirement'))
+
+    def _batch_request(self, requirements: List[str], resume_text: str) -> Dict:
+        numbered = '\n'.join(f"{index}. {requirement}" for index, requirement in enumerate(requirements))
+        prompt = f"""
+Analyze if the following resume meets each of the numbered requirements. Return a JSON object with a "results" array containing one entry per requirement, in the same order, each with:
+1. "index": the requirement number
+2. "meets_requirement": true/false
+3. "explanation": Brief factual explanation (1-2 sentences)
+4. "evidence": Specific text from the resume that supports your decision (or lack thereof)
+
+Requirements:
+{numbered}
+
+Resume:
+{resume_text}
+
+Be strict in your evaluation. Only return true if a requirement is clearly and explicitly met.
+"""
+        return {
+            'model': ANALYSIS_MODEL,
+            'messages': [{"role": "user", "content": prompt}],
+            'temperature': 0,
+            'response_format': {"type": "json_object"}
+        }
+
+    def _parse_batch(self, ai_response: str, count: int) -> Dict[int, Dict]:
+        """Map requirement index to verdict; entries the model skipped or mangled are left out"""
+        try:
+            entries = json.loads(ai_response).get('results', [])
+        except (json.JSONDecodeError, AttributeError):
+            return {}
+
+        verdicts = {}
+        for position, entry in enumerate(entries):
+            # A verdict that isn't a real boolean (e.g. the string "false") counts as mangled
+            if not isinstance(entry, dict) or not isinstance(entry.get('meets_requirement'), bool):
+                continue
+            index = entry.get('index', position)
+            if isinstance(index, int) and 0 <= index < count:
+                verdicts[index] = {
+                    'meets_requirement': entry['meets_requirement'],
+                    'explanation': entry.get('explanation', ''),
+                    'evidence': entry.get('evidence', '')
+                }
+        return verdicts
+
+    async def _analyze_chunk(self, requirements: List[str], resume_text: str) -> List[Dict]:
+        verdicts = self._parse_batch(
+            await self._complete(self._batch_request(requirements, resume_text), 'requirement_batch'), len(requirements)
+        )
+
+        # Fall back to one call per requirement the batch answer did not cover
+        missing = [index for index in range(len(requirements)) if index not in verdicts]
+        fallbacks = await asyncio.gather(*(self._analyze_uncached(requirements[index], resume_text) for index in missing))
+        malformed = {index for index, (_, well_formed) in zip(missing, fallbacks) if not well_formed}
+        verdicts.update((index, verdict) for index, (verdict, _) in zip(missing, fallbacks))
+
+        for index, verdict in verdicts.items():
+            if index not in malformed:
+                self._cache_verdict(requirements[index], resume_text, verdict)
+
+        return [verdicts[index] for index in range(len(requirements))]
+
+    async def analyze_batch(self, requirements: List[str], resume_text: str) -> List[Dict]:
+        """
+        Analyze many requirements with one structured call per chunk, chunks run in parallel.
+        Requirements with a cached verdict for this resume, or that the local matcher
+        can answer, are not sent.
+        """
+        verdicts = {
+            requirement: self._cached_verdict(requirement, resume_text) or self._prescreen(requirement, resume_text)
+            for requirement in dict.fromkeys(requirements)
+        }
+        uncached = [requirement for requirement, verdict in verdicts.items() if verdict is None]
+
+        size = self.max_requirements_per_call
+        chunks = [uncached[start:start + size] for start in range(0, len(uncached), size)]
+        semaphore = asyncio.Semaphore(self.max_parallel_calls)
+
+        async def run(chunk):
+            async with semaphore:
+                return await self._analyze_chunk(chunk, resume_text)
+
+        for chunk, chunk_results in zip(chunks, await asyncio.gather(*(run(chunk) for chunk in chunks))):
+            verdicts.update(zip(chunk, chunk_results))
+
+        return [dict(verdicts[requirement], requirement=requirement) for requirement in requirements]
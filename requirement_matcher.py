@@ -0,0 +1,201 @@
+import re
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+from metrics import REQUIREMENT_PRESCREEN
+
+# Variant spellings and abbreviations mapped to one canonical term
+ALIASES = {
+    'js': 'javascript', 'ts': 'typescript', 'py': 'python', 'golang': 'go',
+    'nodejs': 'node.js', 'reactjs': 'react', 'react.js': 'react', 'vue.js': 'vue', 'vuejs': 'vue',
+    'postgres': 'postgresql', 'k8s': 'kubernetes', 'tf': 'tensorflow', 'sklearn': 'scikit-learn',
+    'ci/cd': 'cicd', 'bachelors': 'bachelor', 'b.s': 'bachelor', 'bs': 'bachelor', 'bsc': 'bachelor',
+    'b.sc': 'bachelor', 'b.a': 'bachelor', 'ba': 'bachelor', 'masters': 'master', 'm.s': 'master', 'msc': 'master',
+    'm.sc': 'master', 'ph.d': 'phd', 'doctorate': 'phd',
+}
+
+# Multi-word terms, matched before single words so their words don't count on their own
+PHRASES = {
+    'machine learning': 'ml', 'artificial intelligence': 'ai', 'natural language processing': 'nlp',
+    'amazon web services': 'aws', 'google cloud platform': 'gcp', 'google cloud': 'gcp',
+    'continuous integration': 'cicd', 'continuous deployment': 'cicd', 'continuous delivery': 'cicd',
+    'version control': 'vcs', 'sql server': 'mssql', 'microsoft excel': 'excel', 'power bi': 'powerbi',
+    'bachelor of science': 'bachelor', 'bachelor of arts': 'bachelor', 'master of science': 'master',
+    'master of arts': 'master', 'master of business administration': 'mba',
+}
+
+# Having the key term on a resume also shows these (a PostgreSQL user knows SQL, a PhD has a master's)
+IMPLIES = {
+    'postgresql': ('sql',), 'mysql': ('sql',), 'mssql': ('sql',), 'sqlite': ('sql',),
+    'github': ('git', 'vcs'), 'gitlab': ('git', 'vcs'), 'git': ('vcs',),
+    'typescript': ('javascript',), 'react': ('javascript',), 'vue': ('javascript',), 'node.js': ('javascript',),
+    'aws': ('cloud',), 'gcp': ('cloud',), 'azure': ('cloud',),
+    'tensorflow': ('ml',), 'pytorch': ('ml',), 'scikit-learn': ('ml',),
+    'docker': ('container',), 'kubernetes': ('container',),
+    'phd': ('master', 'bachelor'), 'master': ('bachelor',), 'mba': ('master', 'bachelor'),
+}
+
+# Short terms that are also ordinary words or abbreviations ("R&D", "go to market", "a cluster node"),
+# so a requirement naming one is always left to the model
+AMBIGUOUS_TERMS = {'r', 'go', 'node', 'ai', 'sem'}
+
+# Terms spelled with '/' or '-' that mean something other than their parts, so they are never split
+COMPOUND_TERMS = {'ci/cd', 'scikit-learn', 'hands-on'}
+
+# Qualifiers that say how a requirement is phrased rather than what it asks for
+STOPWORDS = {
+    'a', 'an', 'and', 'or', 'the', 'of', 'in', 'on', 'with', 'for', 'to', 'at', 'as', 'is', 'be', 'are', 'any',
+    'experience', 'experienced', 'knowledge', 'proficiency', 'proficient', 'skills', 'skill', 'strong', 'solid',
+    'working', 'familiarity', 'familiar', 'understanding', 'ability', 'using', 'use', 'degree', 'database',
+    'databases', 'tools', 'tool', 'plus', 'good', 'excellent', 'expertise', 'background', 'hands-on', 'related',
+    'field', 'equivalent', 'etc', 'similar', 'modern', 'practices', 'technologies', 'technology', 'framework',
+    'frameworks', 'language', 'languages', 'platform', 'platforms', 'systems', 'concepts', 'preferred', 'required',
+}
+
+# Requirements about amounts, seniority or negation need judgement, so they always go to the model
+NEEDS_JUDGEMENT = re.compile(r'\d|\b(years?|senior|junior|lead|minimum|at least|not|without|no|advanced|expert)\b')
+
+# Resume wording that denies or plays down what a sentence names ("Never used Docker", "Some exposure to
+# JavaScript", "basic SQL"); such a sentence is not evidence either way, so the requirement goes to the model
+HEDGED = re.compile(r"\b(no|not|never|without|lacks?|lacking|limited|basic|simple|some|exposure|familiar(?:ity)?|"
+                    r"introductory|beginner)\b|n't\b")
+
+TOKEN = re.compile(r"[a-z0-9][a-z0-9+#./'-]*")
+COMPOUND_PART = re.compile(r"[^/-]+")
+SENTENCE = re.compile(r'[^\n.!?;•]+(?:\.(?=\S)[^\n.!?;•]*)*')
+
+Term = Tuple[str, int, int]
+
+
+def stem(word: str) -> str:
+    """Light suffix stripping, enough for plurals and -ing/-ed/-er/-ment forms to meet"""
+    if len(word) <= 4 or not word.isalpha():
+        return word
+    if word.endswith('ies'):
+        word = word[:-3] + 'y'
+    elif word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        word = word[:-1]
+    for suffix in ('ation', 'ment', 'ing', 'ed', 'er'):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+            word = word[:-len(suffix)]
+            break
+    return word[:-1] if word.endswith('e') and len(word) > 4 else word
+
+
+STEMMED_STOPWORDS = {stem(word) for word in STOPWORDS}
+
+
+def terms(text: str, offset: int = 0, implied: bool = False, whole: bool = True) -> List[Term]:
+    """
+    Canonical stemmed terms in text with their character spans (shifted by offset).
+    Words joined by '/' or '-' ("Python/Django", "MySQL-backed") also count separately;
+    with whole=False only the separate words are kept. With implied=True, terms implied
+    by each one (see IMPLIES) are added at the same span.
+    """
+    lowered = text.lower().replace('’', "'")
+    found = []
+    for phrase, term in PHRASES.items():
+        for match in re.finditer(r'\b' + re.escape(phrase) + r'\b', lowered):
+            found.append((term, match.start(), match.end()))
+            # Blank the phrase out so its words aren't matched again one by one
+            lowered = lowered[:match.start()] + ' ' * len(phrase) + lowered[match.end():]
+    for match in TOKEN.finditer(lowered):
+        token = match.group().rstrip("./-'")
+        if token.endswith("'s"):
+            token = token[:-2]
+        parts = [] if token in COMPOUND_TERMS else list(COMPOUND_PART.finditer(token))
+        if whole or len(parts) < 2:
+            found.append((ALIASES.get(token, token), match.start(), match.start() + len(token)))
+        if len(parts) > 1:
+            for part in parts:
+                name, start = part.group().rstrip(".'"), match.start() + part.start()
+                found.append((ALIASES.get(name, name), start, start + len(name)))
+
+    result = []
+    for term, start, end in found:
+        related = (term,) + (IMPLIES.get(term, ()) if implied else ())
+        result.extend((stem(name), offset + start, offset + end) for name in related)
+    return result
+
+
+def mentions_any(requirements: List[str], text: str) -> bool:
+    """
+    Whether text names every term of at least one requirement anywhere in it (after
+    aliases, implied terms and stemming), ignoring qualifiers like "5+ years of"
+    """
+    present = {term for term, _, _ in terms(text, implied=True)}
+    for requirement in requirements:
+        wanted = {term for term, _, _ in terms(NEEDS_JUDGEMENT.sub(' ', str(requirement).lower()), whole=False)
+                  if term not in STEMMED_STOPWORDS and not any(char.isdigit() for char in term)}
+        if wanted and wanted <= present:
+            return True
+    return False
+
+
+class RequirementMatcher:
+    """
+    Local pre-screen for requirements that are plain keyword checks ("Git",
+    "SQL databases", "Bachelor's degree").
+
+    A requirement is met when one resume sentence contains all of its terms
+    (after aliases, implied terms and stemming) and doesn't negate or hedge
+    them ("Never used", "limited exposure to"). The matcher never decides a
+    requirement is not met, since a resume can show a skill without naming it;
+    that, partial matches, ambiguous short terms, long requirements, years,
+    seniority and negation are left to the model (match returns None).
+    """
+
+    def __init__(self, max_terms: int = 3):
+        self.max_terms = max_terms
+        self._lock = threading.Lock()
+        self.checked = 0
+        self.answered = 0
+
+    def requirement_terms(self, requirement: str) -> Optional[Set[str]]:
+        """The terms a resume must show, or None if the requirement needs the model"""
+        if NEEDS_JUDGEMENT.search(requirement.lower()):
+            return None
+        wanted = {term for term, _, _ in terms(requirement, whole=False) if term not in STEMMED_STOPWORDS}
+        if not wanted or len(wanted) > self.max_terms or wanted & AMBIGUOUS_TERMS:
+            return None
+        return wanted
+
+    def _record(self, outcome: str):
+        with self._lock:
+            self.checked += 1
+            if outcome != 'ambiguous':
+                self.answered += 1
+        REQUIREMENT_PRESCREEN.labels(outcome).inc()
+
+    def match(self, requirement: str, resume_text: str) -> Optional[Dict]:
+        """A verdict for clear-cut requirements (with evidence spans into resume_text), otherwise None"""
+        wanted = self.requirement_terms(requirement)
+        if wanted is None:
+            self._record('ambiguous')
+            return None
+
+        for sentence in SENTENCE.finditer(resume_text):
+            found = [term for term in terms(sentence.group(), sentence.start(), implied=True) if term[0] in wanted]
+            names = {name for name, _, _ in found}
+            if names == wanted:
+                if HEDGED.search(sentence.group().lower().replace('’', "'")):
+                    break
+                self._record('met')
+                return {
+                    'meets_requirement': True,
+                    'explanation': f"The resume explicitly mentions {requirement}.",
+                    'evidence': sentence.group().strip(),
+                    'evidence_spans': sorted({(start, end) for _, start, end in found}),
+                    'source': 'lexical'
+                }
+
+        self._record('ambiguous')
+        return None
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                'checked': self.checked,
+                'answered': self.answered,
+                'avoided_fraction': self.answered / self.checked if self.checked else 0.0
+            }
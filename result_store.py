@@ -0,0 +1,84 @@
+import time
+import zlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from cache import content_key
+
+
+class ResultStore:
+    """
+    Bounded in-process store for generated resumes.
+
+    Entries are zlib-compressed, expire after a TTL and are evicted least recently
+    used first once the compressed total exceeds max_bytes. IDs are derived from the
+    content hash, so storing the same resume twice returns the same ID.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttl: float = 3600):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def put(self, text: str) -> str:
+        resume_id = content_key(text)[:32]
+        data = zlib.compress(text.encode('utf-8'))
+
+        with self._lock:
+            previous = self._entries.pop(resume_id, None)
+            if previous is not None:
+                self.total_bytes -= len(previous[1])
+
+            self._entries[resume_id] = (time.monotonic() + self.ttl, data)
+            self.total_bytes += len(data)
+            self._evict()
+
+        return resume_id
+
+    def get(self, resume_id: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(resume_id)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(resume_id)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(resume_id)
+            self.hits += 1
+            data = entry[1]
+
+        return zlib.decompress(data).decode('utf-8')
+
+    def _remove(self, resume_id: str):
+        _, data = self._entries.pop(resume_id)
+        self.total_bytes -= len(data)
+
+    def _evict(self):
+        now = time.monotonic()
+        for resume_id in [key for key, (expires_at, _) in self._entries.items() if expires_at < now]:
+            self._remove(resume_id)
+
+        # Always keep the newest entry even if it alone exceeds the budget
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'bytes': self.total_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
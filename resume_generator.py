@@ -1,68 +1,150 @@
 import os
+import copy
 import json
-from typing import Dict, List, Tuple
-from openai import OpenAI
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Tuple
+from openai import AsyncOpenAI, OpenAI
 from dotenv import load_dotenv
 from pdf_generator import PDFResumeGenerator
+from cache import TTLCache, VariantCache, content_key, normalize_text
+from llm_backend import LLMBackend, OpenAIBackend, get_backend
+from metrics import LLM_MALFORMED_RESPONSES, SECTION_CACHE_LOOKUPS, observe_llm_call
+from rate_limiter import RateLimiter, get_rate_limiter
+from retry_policy import ResilientCaller, get_resilient_caller
+from singleflight import FanOutFlight, SingleFlight
+from resume_model import ContactInfo, Education, ExperienceEntry, Resume, Skills, Summary
 
 load_dotenv()
 
+# Upper bound on section LLM calls in flight at once; 12 covers both resumes
+DEFAULT_MAX_CONCURRENCY = 12
+
+# Attempts per section in structured-output mode before giving up on a malformed response
+STRUCTURED_OUTPUT_ATTEMPTS = 3
+
+STRUCTURED_OUTPUT_INSTRUCTIONS = (
+    "Return the content as JSON matching the provided schema instead of formatted text. "
+    "Put each bullet point, certification or coursework line in its own array item, "
+    "without bullet characters, emojis or numbering. Use an empty string for any unknown field."
+)
+
+# "detailed" makes one call per section (7 per resume); "fast" writes each resume in one structured call
+GENERATION_MODES = ('detailed', 'fast')
+DEFAULT_GENERATION_MODE = 'detailed'
+
+# Bump PARSE_PROMPT_VERSION whenever the parse prompt changes so cached analyses are not reused
+PARSE_MODEL = "gpt-4o-mini"
+PARSE_PROMPT_VERSION = 1
+
+# Shared by every generator in the process so repeat submissions skip the parse call
+job_analysis_cache = TTLCache(
+    maxsize=int(os.getenv('JOB_ANALYSIS_CACHE_SIZE', 512)),
+    ttl=float(os.getenv('JOB_ANALYSIS_CACHE_TTL', 24 * 3600))
+)
+
+# Bump SECTION_PROMPT_VERSION whenever the skills or education prompts change so cached sections are not reused
+SECTION_PROMPT_VERSION = 1
+
+# Skills and education depend only on the industry, the requirement lists and match polarity, which many
+# postings share; a few variants per key are kept so repeat jobs don't all get the identical section.
+# SECTION_CACHE_SIZE counts stored sections across all keys; 0 turns the cache off.
+section_variant_cache = VariantCache(
+    maxsize=int(os.getenv('SECTION_CACHE_SIZE', 2048)),
+    variants=int(os.getenv('SECTION_CACHE_VARIANTS', 3)),
+    ttl=float(os.getenv('SECTION_CACHE_TTL', 24 * 3600))
+)
+
+# Industry classification mappings
+INDUSTRY_MAPPINGS = {
+    'technology': {
+        'keywords': ['software', 'tech', 'developer', 'engineer', 'programming', 'coding', 'IT', 'computer'],
+        'focus_areas': ['Technical Skills', 'Programming Languages', 'Frameworks & Tools', 'Software Development', 'System Architecture'],
+        'metrics': ['performance improvements', 'system scalability', 'user base growth', 'uptime', 'response times'],
+        'companies': ['TechCorp', 'InnovateSoft', 'DataFlow Systems', 'CloudTech Solutions', 'DevTools Inc.'],
+        'achievements': ['Improved system performance by {}%', 'Led team of {} developers', 'Deployed applications serving {}+ users'],
+        'optional_sections': ['Technical Projects', 'Open Source Contributions', 'Technical Publications']
+    },
+    'marketing': {
+        'keywords': ['marketing', 'digital', 'advertising', 'campaign', 'brand', 'social media', 'content'],
+        'focus_areas': ['Digital Marketing', 'Campaign Management', 'Analytics & Reporting', 'Social Media', 'Content Strategy'],
+        'metrics': ['ROI', 'conversion rates', 'engagement rates', 'lead generation', 'campaign performance'],
+        'companies': ['BrandBoost Marketing', 'DigitalEdge Agency', 'MarketPro Solutions', 'Creative Campaigns Inc.', 'GrowthHacker Co.'],
+        'achievements': ['Increased ROI by {}%', 'Generated {}+ qualified leads', 'Improved conversion rates by {}%'],
+        'optional_sections': ['Notable Campaigns', 'Awards & Recognition', 'Speaking Engagements']
+    },
+    'data_science': {
+        'keywords': ['data', 'analytics', 'scientist', 'machine learning', 'AI', 'statistics', 'modeling'],
+        'focus_areas': ['Machine Learning', 'Statistical Analysis', 'Data Visualization', 'Programming', 'Research & Development'],
+        'metrics': ['model accuracy', 'data processing speed', 'prediction accuracy', 'cost savings', 'automation'],
+        'companies': ['DataInsights Corp', 'Analytics Pro', 'ML Solutions Inc.', 'PredictiveEdge', 'Intelligence Systems'],
+        'achievements': ['Improved model accuracy by {}%', 'Processed {}+ GB of data daily', 'Reduced analysis time by {}%'],
+        'optional_sections': ['Research Publications', 'Data Science Projects', 'Conference Presentations']
+    },
+    'finance': {
+        'keywords': ['finance', 'financial', 'accounting', 'investment', 'banking', 'analyst', 'risk'],
+        'focus_areas': ['Financial Analysis', 'Risk Management', 'Investment Strategy', 'Compliance', 'Financial Reporting'],
+        'metrics': ['revenue growth', 'cost reduction', 'portfolio performance', 'risk mitigation', 'compliance rates'],
+        'companies': ['FinanceFirst Corp', 'Capital Advisors', 'Risk Management Solutions', 'Investment Partners', 'Financial Analytics'],
+        'achievements': ['Managed portfolio worth ${}M', 'Reduced operational costs by {}%', 'Achieved {}% return on investments'],
+        'optional_sections': ['Professional Licenses', 'Investment Track Record', 'Risk Management Initiatives']
+    },
+    'healthcare': {
+        'keywords': ['healthcare', 'medical', 'clinical', 'patient', 'hospital', 'nursing', 'therapy'],
+        'focus_areas': ['Patient Care', 'Clinical Procedures', 'Healthcare Technology', 'Compliance', 'Quality Improvement'],
+        'metrics': ['patient outcomes', 'satisfaction scores', 'treatment efficiency', 'compliance rates', 'cost per patient'],
+        'companies': ['HealthCare Partners', 'Medical Excellence Center', 'Patient First Hospital', 'Clinical Solutions Inc.', 'WellCare Systems'],
+        'achievements': ['Improved patient satisfaction by {}%', 'Treated {}+ patients annually', 'Reduced treatment time by {}%'],
+        'optional_sections': ['Medical Licenses', 'Clinical Research', 'Professional Memberships']
+    },
+    'sales': {
+        'keywords': ['sales', 'business development', 'account management', 'revenue', 'client relations'],
+        'focus_areas': ['Sales Strategy', 'Client Relationship Management', 'Revenue Generation', 'Market Analysis', 'Negotiation'],
+        'metrics': ['revenue generated', 'quota achievement', 'client retention', 'deal closure rates', 'territory growth'],
+        'companies': ['SalesForce Solutions', 'Revenue Growth Partners', 'ClientFirst Sales', 'Business Development Corp', 'Market Leaders Inc.'],
+        'achievements': ['Generated ${}M in revenue', 'Exceeded quota by {}%', 'Maintained {}% client retention rate'],
+        'optional_sections': ['Sales Awards', 'Key Client Relationships', 'Sales Training & Development']
+    }
+}
+
+class SectionFormatError(ValueError):
+    """Raised when a section's structured response stays malformed after every attempt"""
+
+
 class ResumeGenerator:
-    def __init__(self):
-        self.client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+    def __init__(self, max_concurrency: int = None, analysis_cache: TTLCache = None,
+                 client: OpenAI = None, async_client: AsyncOpenAI = None, structured_output: bool = None,
+                 backend: LLMBackend = None, limiter: RateLimiter = None, resilience: ResilientCaller = None,
+                 section_cache: VariantCache = None):
+        # Clients passed in explicitly go straight to OpenAI; otherwise RESUME_LLM_BACKEND picks the backend
+        if backend is None and (client or async_client):
+            backend = OpenAIBackend(client, async_client)
+        self.backend = backend or get_backend()
+        # Shared by every generator in the process so RPM/TPM budgets are enforced globally
+        self.limiter = limiter or get_rate_limiter()
+        # Per-section retry and hedging policies, with latency history shared across the process
+        self.resilience = resilience or get_resilient_caller()
+        # Identical parses and generations that overlap in time share one run (and its LLM calls)
+        self.parse_flights = SingleFlight('parse')
+        self.generation_flights = SingleFlight('generate')
+        self.section_flights = FanOutFlight('generate_sections')
+        self.analysis_cache = job_analysis_cache if analysis_cache is None else analysis_cache
+        self.section_cache = section_variant_cache if section_cache is None else section_cache
+        # Set by warm_pool.WarmPool; non-matching resumes then use its pre-generated sections instead of LLM calls
+        self.warm_pool = None
+        if max_concurrency is None:
+            max_concurrency = int(os.getenv('RESUME_MAX_CONCURRENCY', DEFAULT_MAX_CONCURRENCY))
+        # 1 restores the original fully sequential behaviour
+        self.max_concurrency = max(1, max_concurrency)
+        if structured_output is None:
+            structured_output = os.getenv('RESUME_STRUCTURED_OUTPUT', '').lower() in ('1', 'true', 'yes')
+        # Ask for JSON matching each section's schema instead of parsing formatted text
+        self.structured_output = structured_output
         self.pdf_generator = PDFResumeGenerator()
         
-        # Industry classification mappings
-        self.industry_mappings = {
-            'technology': {
-                'keywords': ['software', 'tech', 'developer', 'engineer', 'programming', 'coding', 'IT', 'computer'],
-                'focus_areas': ['Technical Skills', 'Programming Languages', 'Frameworks & Tools', 'Software Development', 'System Architecture'],
-                'metrics': ['performance improvements', 'system scalability', 'user base growth', 'uptime', 'response times'],
-                'companies': ['TechCorp', 'InnovateSoft', 'DataFlow Systems', 'CloudTech Solutions', 'DevTools Inc.'],
-                'achievements': ['Improved system performance by {}%', 'Led team of {} developers', 'Deployed applications serving {}+ users'],
-                'optional_sections': ['Technical Projects', 'Open Source Contributions', 'Technical Publications']
-            },
-            'marketing': {
-                'keywords': ['marketing', 'digital', 'advertising', 'campaign', 'brand', 'social media', 'content'],
-                'focus_areas': ['Digital Marketing', 'Campaign Management', 'Analytics & Reporting', 'Social Media', 'Content Strategy'],
-                'metrics': ['ROI', 'conversion rates', 'engagement rates', 'lead generation', 'campaign performance'],
-                'companies': ['BrandBoost Marketing', 'DigitalEdge Agency', 'MarketPro Solutions', 'Creative Campaigns Inc.', 'GrowthHacker Co.'],
-                'achievements': ['Increased ROI by {}%', 'Generated {}+ qualified leads', 'Improved conversion rates by {}%'],
-                'optional_sections': ['Notable Campaigns', 'Awards & Recognition', 'Speaking Engagements']
-            },
-            'data_science': {
-                'keywords': ['data', 'analytics', 'scientist', 'machine learning', 'AI', 'statistics', 'modeling'],
-                'focus_areas': ['Machine Learning', 'Statistical Analysis', 'Data Visualization', 'Programming', 'Research & Development'],
-                'metrics': ['model accuracy', 'data processing speed', 'prediction accuracy', 'cost savings', 'automation'],
-                'companies': ['DataInsights Corp', 'Analytics Pro', 'ML Solutions Inc.', 'PredictiveEdge', 'Intelligence Systems'],
-                'achievements': ['Improved model accuracy by {}%', 'Processed {}+ GB of data daily', 'Reduced analysis time by {}%'],
-                'optional_sections': ['Research Publications', 'Data Science Projects', 'Conference Presentations']
-            },
-            'finance': {
-                'keywords': ['finance', 'financial', 'accounting', 'investment', 'banking', 'analyst', 'risk'],
-                'focus_areas': ['Financial Analysis', 'Risk Management', 'Investment Strategy', 'Compliance', 'Financial Reporting'],
-                'metrics': ['revenue growth', 'cost reduction', 'portfolio performance', 'risk mitigation', 'compliance rates'],
-                'companies': ['FinanceFirst Corp', 'Capital Advisors', 'Risk Management Solutions', 'Investment Partners', 'Financial Analytics'],
-                'achievements': ['Managed portfolio worth ${}M', 'Reduced operational costs by {}%', 'Achieved {}% return on investments'],
-                'optional_sections': ['Professional Licenses', 'Investment Track Record', 'Risk Management Initiatives']
-            },
-            'healthcare': {
-                'keywords': ['healthcare', 'medical', 'clinical', 'patient', 'hospital', 'nursing', 'therapy'],
-                'focus_areas': ['Patient Care', 'Clinical Procedures', 'Healthcare Technology', 'Compliance', 'Quality Improvement'],
-                'metrics': ['patient outcomes', 'satisfaction scores', 'treatment efficiency', 'compliance rates', 'cost per patient'],
-                'companies': ['HealthCare Partners', 'Medical Excellence Center', 'Patient First Hospital', 'Clinical Solutions Inc.', 'WellCare Systems'],
-                'achievements': ['Improved patient satisfaction by {}%', 'Treated {}+ patients annually', 'Reduced treatment time by {}%'],
-                'optional_sections': ['Medical Licenses', 'Clinical Research', 'Professional Memberships']
-            },
-            'sales': {
-                'keywords': ['sales', 'business development', 'account management', 'revenue', 'client relations'],
-                'focus_areas': ['Sales Strategy', 'Client Relationship Management', 'Revenue Generation', 'Market Analysis', 'Negotiation'],
-                'metrics': ['revenue generated', 'quota achievement', 'client retention', 'deal closure rates', 'territory growth'],
-                'companies': ['SalesForce Solutions', 'Revenue Growth Partners', 'ClientFirst Sales', 'Business Development Corp', 'Market Leaders Inc.'],
-                'achievements': ['Generated ${}M in revenue', 'Exceeded quota by {}%', 'Maintained {}% client retention rate'],
-                'optional_sections': ['Sales Awards', 'Key Client Relationships', 'Sales Training & Development']
-            }
-        }
+        self.industry_mappings = INDUSTRY_MAPPINGS
     
     def classify_industry(self, job_analysis: Dict) -> str:
         """
@@ -85,7 +167,7 @@ class ResumeGenerator:
         return max(industry_scores, key=industry_scores.get) if max(industry_scores.values()) > 0 else 'technology'
     
     
-    def generate_contact_info(self, is_matching: bool = True) -> str:
+    def generate_contact_info(self, is_matching: bool = True) -> ContactInfo:
         """Generate realistic contact information"""
         names = [
             "Michael Rodriguez", "Sarah Chen", "David Patel", "Lisa Thompson", "James Wilson",
@@ -104,16 +186,132 @@ class ResumeGenerator:
         first_name = name.split()[0].lower()
         last_name = name.split()[1].lower()
         
-        return f"""══════════════════════════════════════════════════════════
-
-{name}
-
-📧 {first_name}.{last_name}@gmail.com | 📞 (555) {random.randint(200, 999)}-{random.randint(1000, 9999)} | 🌍 {city} | 💼 linkedin.com/in/{first_name}-{last_name}
-
-══════════════════════════════════════════════════════════"""
+        return ContactInfo(
+            name=name,
+            email=f"{first_name}.{last_name}@gmail.com",
+            phone=f"(555) {random.randint(200, 999)}-{random.randint(1000, 9999)}",
+            location=city,
+            linkedin=f"linkedin.com/in/{first_name}-{last_name}"
+        )
     
-    def generate_professional_summary(self, job_analysis: Dict, industry: str, is_matching: bool = True) -> str:
-        """Generate compelling professional summary"""
+    def _complete(self, request: Dict, section: str) -> str:
+        """Run a chat completion request (retried and hedged per section policy) and return the stripped content"""
+        return self.resilience.call(section, partial(self._complete_once, request, section))
+    
+    async def _acomplete(self, request: Dict, section: str) -> str:
+        """Async version of _complete"""
+        return await self.resilience.acall(section, partial(self._acomplete_once, request, section))
+    
+    def _complete_once(self, request: Dict, section: str) -> str:
+        """Send one chat completion request through the rate limiter"""
+        with self.limiter.acquire(request, section) as permit, observe_llm_call(request['model'], section) as call:
+            completion = self.backend.complete(request, section)
+            call.record_usage(completion)
+            permit.record_usage(completion)
+        return completion.content.strip()
+    
+    async def _acomplete_once(self, request: Dict, section: str) -> str:
+        """Async version of _complete_once"""
+        async with self.limiter.aacquire(request, section) as permit:
+            with observe_llm_call(request['model'], section) as call:
+                completion = await self.backend.acomplete(request, section)
+                call.record_usage(completion)
+                permit.record_usage(completion)
+        return completion.content.strip()
+    
+    def _structured_request(self, request: Dict, section_type: type) -> Dict:
+        """Extend a section request with a strict JSON schema response format"""
+        return dict(
+            request,
+            messages=request['messages'] + [{"role": "user", "content": STRUCTURED_OUTPUT_INSTRUCTIONS}],
+            response_format={
+                'type': 'json_schema',
+                'json_schema': {'name': section_type.__name__.lower(), 'strict': True, 'schema': section_type.SCHEMA}
+            }
+        )
+    
+    def _parse_structured(self, content: str, section: str, build: Callable, attempt: int):
+        """Build the section from a structured response, or return None if it is malformed"""
+        try:
+            return build(json.loads(content))
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            LLM_MALFORMED_RESPONSES.labels(section).inc()
+            print(f"Warning: Malformed {section} section (attempt {attempt}/{STRUCTURED_OUTPUT_ATTEMPTS}): {e}")
+            return None
+    
+    def _complete_structured(self, request: Dict, section_type: type, section: str, build: Callable = None):
+        """Run a request in structured-output mode, retrying only this request while the response is malformed"""
+        request = self._structured_request(request, section_type)
+        build = build or section_type.from_data
+        for attempt in range(1, STRUCTURED_OUTPUT_ATTEMPTS + 1):
+            result = self._parse_structured(self._complete(request, section), section, build, attempt)
+            if result is not None:
+                return result
+        raise SectionFormatError(f"{section} section was malformed after {STRUCTURED_OUTPUT_ATTEMPTS} attempts")
+    
+    async def _acomplete_structured(self, request: Dict, section_type: type, section: str, build: Callable = None):
+        """Async version of _complete_structured"""
+        request = self._structured_request(request, section_type)
+        build = build or section_type.from_data
+        for attempt in range(1, STRUCTURED_OUTPUT_ATTEMPTS + 1):
+            result = self._parse_structured(await self._acomplete(request, section), section, build, attempt)
+            if result is not None:
+                return result
+        raise SectionFormatError(f"{section} section was malformed after {STRUCTURED_OUTPUT_ATTEMPTS} attempts")
+    
+    def _complete_section(self, request: Dict, section_type: type, section: str):
+        """Run a section request and build the section model"""
+        if self.structured_output:
+            return self._complete_structured(request, section_type, section)
+        return section_type.from_response(self._complete(request, section))
+    
+    async def _acomplete_section(self, request: Dict, section_type: type, section: str):
+        """Async version of _complete_section"""
+        if self.structured_output:
+            return await self._acomplete_structured(request, section_type, section)
+        return section_type.from_response(await self._acomplete(request, section))
+    
+    def _section_key(self, section: str, industry: str, is_matching: bool, *requirement_lists) -> str:
+        """Cache key over a section's inputs, with requirement lists normalized and order-insensitive"""
+        requirements = [
+            sorted(normalize_text(str(item)) for item in self.extract_requirements_list(items))
+            for items in requirement_lists
+        ]
+        return content_key(section, SECTION_PROMPT_VERSION, self.structured_output, industry, is_matching, *requirements)
+    
+    def _cached_section(self, key: str, section: str, generate: Callable):
+        """Serve a cached variant of the section, or generate one and add it to the pool"""
+        cached = self.section_cache.get(key)
+        SECTION_CACHE_LOOKUPS.labels(section, 'miss' if cached is None else 'hit').inc()
+        if cached is not None:
+            return copy.deepcopy(cached)
+        result = generate()
+        self.section_cache.add(key, copy.deepcopy(result))
+        return result
+    
+    async def _acached_section(self, key: str, section: str, generate: Callable[[], Awaitable[Any]]):
+        """Async version of _cached_section"""
+        cached = self.section_cache.get(key)
+        SECTION_CACHE_LOOKUPS.labels(section, 'miss' if cached is None else 'hit').inc()
+        if cached is not None:
+            return copy.deepcopy(cached)
+        result = await generate()
+        self.section_cache.add(key, copy.deepcopy(result))
+        return result
+    
+    def _skills_key(self, job_analysis: Dict, industry: str, is_matching: bool) -> str:
+        return self._section_key('skills', industry, is_matching,
+                                 job_analysis.get('must_have', []), job_analysis.get('nice_to_have', []))
+    
+    def _education_key(self, job_analysis: Dict, industry: str, is_matching: bool) -> str:
+        return self._section_key('education', industry, is_matching, job_analysis.get('must_have', []))
+    
+    async def agenerate_contact_info(self, is_matching: bool = True) -> ContactInfo:
+        """Async version of generate_contact_info (no LLM call involved)"""
+        return self.generate_contact_info(is_matching)
+    
+    def _summary_request(self, job_analysis: Dict, industry: str, is_matching: bool = True) -> Dict:
+        """Build the chat completion request for the professional summary"""
         industry_data = self.industry_mappings[industry]
         must_haves = self.extract_requirements_list(job_analysis.get('must_have', []))
         
@@ -150,25 +348,25 @@ class ResumeGenerator:
         """}.
         """
         
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
+        return {
+            'model': "gpt-4o-mini",
+            'messages': [
                 {"role": "system", "content": f"You are a professional resume writer. {'Create compelling summaries for excellent candidates' if is_matching else 'Create summaries for candidates who LACK most required skills - they should NOT be strong matches'}."},
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.7
-        )
-        
-        summary = response.choices[0].message.content.strip()
-        
-        return f"""💼 PROFESSIONAL SUMMARY
-
-{summary}
-
-══════════════════════════════════════════════════════════"""
+            'temperature': 0.7
+        }
+    
+    def generate_professional_summary(self, job_analysis: Dict, industry: str, is_matching: bool = True) -> Summary:
+        """Generate compelling professional summary"""
+        return self._complete_section(self._summary_request(job_analysis, industry, is_matching), Summary, 'summary')
+    
+    async def agenerate_professional_summary(self, job_analysis: Dict, industry: str, is_matching: bool = True) -> Summary:
+        """Async version of generate_professional_summary"""
+        return await self._acomplete_section(self._summary_request(job_analysis, industry, is_matching), Summary, 'summary')
     
-    def generate_skills_section(self, job_analysis: Dict, industry: str, is_matching: bool = True) -> str:
-        """Generate detailed skills section"""
+    def _skills_request(self, job_analysis: Dict, industry: str, is_matching: bool = True) -> Dict:
+        """Build the chat completion request for the skills section"""
         industry_data = self.industry_mappings[industry]
         must_haves = self.extract_requirements_list(job_analysis.get('must_have', []))
         nice_to_haves = self.extract_requirements_list(job_analysis.get('nice_to_have', []))
@@ -211,30 +409,26 @@ class ResumeGenerator:
         DO NOT include: years of experience, degree requirements, certifications, soft skills, or job requirements.
         """
         
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
+        return {
+            'model': "gpt-4o-mini",
+            'messages': [
                 {"role": "system", "content": f"You are a professional resume writer specializing in technical skills sections. {'Include all required skills for excellent candidates' if is_matching else 'EXCLUDE most required skills for candidates who are NOT qualified - include only 1-2 required skills maximum'}."},
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.5
-        )
-        
-        skills_content = response.choices[0].message.content.strip()
-        
-        # Add bullet points to each skill line
-        formatted_skills = []
-        for line in skills_content.split('\n'):
-            if line.strip() and ':' in line:
-                formatted_skills.append(f"• {line.strip()}")
-            elif line.strip():
-                formatted_skills.append(line.strip())
-        
-        return f"""🛠️ TECHNICAL EXPERTISE
-
-{chr(10).join(formatted_skills)}
-
-══════════════════════════════════════════════════════════"""
+            'temperature': 0.5
+        }
+    
+    def generate_skills_section(self, job_analysis: Dict, industry: str, is_matching: bool = True) -> Skills:
+        """Generate detailed skills section (served from the section cache when the inputs repeat)"""
+        request = self._skills_request(job_analysis, industry, is_matching)
+        return self._cached_section(self._skills_key(job_analysis, industry, is_matching), 'skills',
+                                    partial(self._complete_section, request, Skills, 'skills'))
+    
+    async def agenerate_skills_section(self, job_analysis: Dict, industry: str, is_matching: bool = True) -> Skills:
+        """Async version of generate_skills_section"""
+        request = self._skills_request(job_analysis, industry, is_matching)
+        return await self._acached_section(self._skills_key(job_analysis, industry, is_matching), 'skills',
+                                           partial(self._acomplete_section, request, Skills, 'skills'))
     
     def extract_requirements_list(self, requirements):
         """Helper method to convert requirements to list format"""
@@ -245,8 +439,8 @@ class ResumeGenerator:
         else:
             return []
     
-    def generate_work_experience(self, job_analysis: Dict, industry: str, position_level: str, is_matching: bool = True) -> str:
-        """Generate detailed work experience for a single position"""
+    def _work_experience_request(self, job_analysis: Dict, industry: str, position_level: str, is_matching: bool = True) -> Dict:
+        """Build the chat completion request for a single work experience entry"""
         industry_data = self.industry_mappings[industry]
         must_haves = self.extract_requirements_list(job_analysis.get('must_have', []))
         
@@ -332,47 +526,25 @@ class ResumeGenerator:
         Use realistic dates (2016-2024), specific numbers, and concrete technical details.
         """
         
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
+        return {
+            'model': "gpt-4o-mini",
+            'messages': [
                 {"role": "system", "content": f"You are a professional resume writer specializing in {industry} roles. {'Create strong experience entries for excellent candidates' if is_matching else 'Create experience entries for candidates who LACK most required qualifications - they should NOT demonstrate proficiency in most job requirements'}."},
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.6
-        )
-        
-        work_content = response.choices[0].message.content.strip()
-        
-        # Add emojis and ensure consistent formatting
-        formatted_lines = []
-        lines = work_content.split('\n')
-        for line in lines:
-            line = line.strip()
-            if not line:
-                formatted_lines.append('')
-                continue
-                
-            if ' - ' in line and not line.startswith('•') and not line.startswith('-') and not line.startswith('🏢'):
-                # This is a company-title line
-                formatted_lines.append(f"🏢 {line}")
-            elif '|' in line and any(year in line for year in ['2016', '2017', '2018', '2019', '2020', '2021', '2022', '2023', '2024']):
-                # This is a date-location line  
-                formatted_lines.append(f"📅 {line}")
-            elif line.startswith('•'):
-                # Already properly formatted bullet point
-                formatted_lines.append(line)
-            elif line.startswith('-') or line.startswith('*'):
-                # Convert dashes or asterisks to bullet points
-                cleaned_line = line.lstrip('-*').strip()
-                formatted_lines.append(f"• {cleaned_line}")
-            elif line and not line.startswith('🏢') and not line.startswith('📅'):
-                # Regular text line
-                formatted_lines.append(line)
-        
-        return chr(10).join(formatted_lines)
-    
-    def generate_education_certifications(self, job_analysis: Dict, industry: str, is_matching: bool = True) -> str:
-        """Generate education and certifications section"""
+            'temperature': 0.6
+        }
+    
+    def generate_work_experience(self, job_analysis: Dict, industry: str, position_level: str, is_matching: bool = True) -> List[ExperienceEntry]:
+        """Generate detailed work experience for a single position"""
+        return self._complete_section(self._work_experience_request(job_analysis, industry, position_level, is_matching), ExperienceEntry, 'experience')
+    
+    async def agenerate_work_experience(self, job_analysis: Dict, industry: str, position_level: str, is_matching: bool = True) -> List[ExperienceEntry]:
+        """Async version of generate_work_experience"""
+        return await self._acomplete_section(self._work_experience_request(job_analysis, industry, position_level, is_matching), ExperienceEntry, 'experience')
+    
+    def _education_request(self, job_analysis: Dict, industry: str, is_matching: bool = True) -> Dict:
+        """Build the chat completion request for the education and certifications section"""
         prompt = f"""
         Create education and certifications section for a {industry} professional.
         
@@ -419,99 +591,178 @@ class ResumeGenerator:
         Use realistic certification names for {industry} and recent dates (2020-2024).
         """
         
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
+        return {
+            'model': "gpt-4o-mini",
+            'messages': [
                 {"role": "system", "content": f"You are a professional resume writer specializing in {industry} education and certifications."},
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.4
-        )
+            'temperature': 0.4
+        }
+    
+    def generate_education_certifications(self, job_analysis: Dict, industry: str, is_matching: bool = True) -> Education:
+        """Generate education and certifications section (served from the section cache when the inputs repeat)"""
+        request = self._education_request(job_analysis, industry, is_matching)
+        return self._cached_section(self._education_key(job_analysis, industry, is_matching), 'education',
+                                    partial(self._complete_section, request, Education, 'education'))
+    
+    async def agenerate_education_certifications(self, job_analysis: Dict, industry: str, is_matching: bool = True) -> Education:
+        """Async version of generate_education_certifications"""
+        request = self._education_request(job_analysis, industry, is_matching)
+        return await self._acached_section(self._education_key(job_analysis, industry, is_matching), 'education',
+                                           partial(self._acomplete_section, request, Education, 'education'))
+    
+    def _fast_resume_request(self, job_analysis: Dict, industry: str, is_matching: bool = True) -> Dict:
+        """Build one structured request covering every section of a resume"""
+        industry_data = self.industry_mappings[industry]
+        must_haves = self.extract_requirements_list(job_analysis.get('must_have', []))
+        nice_to_haves = self.extract_requirements_list(job_analysis.get('nice_to_have', []))
         
-        edu_content = response.choices[0].message.content.strip()
-        
-        # Add emojis to education section
-        formatted_lines = []
-        in_education = False
-        in_certifications = False
-        
-        for line in edu_content.split('\n'):
-            line = line.strip()
-            if not line:
-                formatted_lines.append('')
-                continue
-                
-            if 'EDUCATION' in line.upper():
-                formatted_lines.append(f"🎓 EDUCATION & CERTIFICATIONS")
-                in_education = True
-                formatted_lines.append('')
-                continue
-            elif 'CERTIFICATIONS' in line.upper():
-                formatted_lines.append('')
-                formatted_lines.append("🏅 CERTIFICATIONS (Recent & Relevant)")
-                in_certifications = True
-                continue
-            elif line.startswith('-') or line.startswith('•') or line.startswith('*'):
-                # Certification item - standardize to bullet points
-                cleaned_line = line.lstrip('-•*').strip()
-                formatted_lines.append(f"• {cleaned_line}")
-            elif '|' in line and in_education:
-                # University line
-                formatted_lines.append(f"🎓 {line}")
-            elif in_education and any(word in line for word in ['Bachelor', 'Master', 'PhD', 'Degree']):
-                # Degree line
-                formatted_lines.append(f"🎓 {line}")
-            elif in_education and ('Coursework' in line or 'Project' in line):
-                # Coursework or project line
-                formatted_lines.append(f"📚 {line}")
-            else:
-                formatted_lines.append(line)
-        
-        result = chr(10).join(formatted_lines)
-        
-        # Add bottom separator
-        if not result.endswith('══════════════════════════════════════════════════════════'):
-            result += f"\n\n══════════════════════════════════════════════════════════"
+        prompt = f"""
+        Write a complete resume for a {industry} professional applying for: {job_analysis.get('job_title', 'Unknown')}
+        
+        Must-have requirements: {must_haves}
+        Nice-to-have requirements: {nice_to_haves}
+        Candidate quality: {"Excellent match - demonstrate every must-have and most nice-to-haves" if is_matching else f"Poor match - same {industry} industry but include at most 1-2 of the must-haves: {must_haves}"}
+        
+        summary: 3-4 sentences with years of experience, specialties and one quantified achievement.
+        skills: groups for {industry_data['focus_areas'][:3]} plus "Additional Skills", each with comma-separated technologies and versions; no soft skills, degrees or years of experience.
+        experience: exactly 3 positions, Senior then Mid-level then Junior, at different companies from {industry_data['companies']}.
+          Use a logical, non-overlapping date progression between 2016 and Present (e.g. "January 2022 - Present", "March 2019 - December 2021", "June 2016 - February 2019") and "City, ST" locations.
+          Give 4-6 bullets per position, each starting with an action verb, naming a specific technology or method and a quantified impact (templates: {industry_data['achievements']}).
+        education: {"a relevant degree" if is_matching else "a degree that does not satisfy the requirements"}, a realistic university and a graduation year between 2012 and 2018; details may list relevant coursework.
+        certifications: {"2-3 relevant certifications formatted as Name - Organization (Year), 2020-2024" if is_matching else "0-1 basic certification"}.
+        """
         
-        return result
+        return {
+            'model': "gpt-4o-mini",
+            'messages': [
+                {"role": "system", "content": f"You are a professional resume writer specializing in {industry} roles. {'Create strong resumes for excellent candidates' if is_matching else 'Create resumes for candidates who LACK most required qualifications - they should NOT be strong matches'}."},
+                {"role": "user", "content": prompt}
+            ],
+            'temperature': 0.6
+        }
     
-    def assemble_multi_stage_resume(self, job_analysis: Dict, is_matching: bool = True) -> str:
-        """Assemble resume using multi-stage generation approach"""
+    def generate_fast_resume(self, job_analysis: Dict, is_matching: bool = True) -> Resume:
+        """Generate a whole resume with a single structured call"""
+        industry = self.classify_industry(job_analysis)
+        contact = self.generate_contact_info(is_matching)
+        return self._complete_structured(self._fast_resume_request(job_analysis, industry, is_matching), Resume, 'resume',
+                                         partial(Resume.from_data, contact=contact))
+    
+    async def agenerate_fast_resume(self, job_analysis: Dict, is_matching: bool = True) -> Resume:
+        """Async version of generate_fast_resume"""
+        industry = self.classify_industry(job_analysis)
+        contact = self.generate_contact_info(is_matching)
+        return await self._acomplete_structured(self._fast_resume_request(job_analysis, industry, is_matching), Resume, 'resume',
+                                                partial(Resume.from_data, contact=contact))
+    
+    def _section_specs(self, job_analysis: Dict, is_matching: bool = True) -> List[Tuple[str, str, tuple]]:
+        """Describe the independent section calls for one resume, in output order"""
         industry = self.classify_industry(job_analysis)
         
-        # Generate each section separately
-        contact_info = self.generate_contact_info(is_matching)
-        summary = self.generate_professional_summary(job_analysis, industry, is_matching)
-        skills = self.generate_skills_section(job_analysis, industry, is_matching)
+        return [
+            ('contact_info', 'generate_contact_info', (is_matching,)),
+            ('summary', 'generate_professional_summary', (job_analysis, industry, is_matching)),
+            ('skills', 'generate_skills_section', (job_analysis, industry, is_matching)),
+            # 3 work experience entries
+            ('senior_experience', 'generate_work_experience', (job_analysis, industry, "Senior", is_matching)),
+            ('mid_experience', 'generate_work_experience', (job_analysis, industry, "Mid-level", is_matching)),
+            ('junior_experience', 'generate_work_experience', (job_analysis, industry, "Junior", is_matching)),
+            ('education_certs', 'generate_education_certifications', (job_analysis, industry, is_matching)),
+        ]
+    
+    def section_names(self) -> List[str]:
+        """Names of the sections each detailed-mode resume is built from"""
+        return [name for name, _, _ in self._section_specs({})]
+    
+    def _section_tasks(self, job_analysis: Dict, is_matching: bool = True) -> List[Tuple[str, Callable[[], Any]]]:
+        """Build the section calls for one resume as (name, callable) pairs"""
+        tasks = [(name, partial(getattr(self, method), *args))
+                 for name, method, args in self._section_specs(job_analysis, is_matching)]
+        if self.warm_pool is None or is_matching:
+            return tasks
+        industry = self.classify_industry(job_analysis)
+        must_haves = self.extract_requirements_list(job_analysis.get('must_have', []))
+        return [(name, partial(self._from_warm_pool, industry, must_haves, name, task)) for name, task in tasks]
+    
+    def _async_section_tasks(self, job_analysis: Dict, is_matching: bool = True) -> List[Tuple[str, Callable[[], Awaitable[Any]]]]:
+        """Build the section calls for one resume as (name, coroutine function) pairs"""
+        tasks = [(name, partial(getattr(self, 'a' + method), *args))
+                 for name, method, args in self._section_specs(job_analysis, is_matching)]
+        if self.warm_pool is None or is_matching:
+            return tasks
+        industry = self.classify_industry(job_analysis)
+        must_haves = self.extract_requirements_list(job_analysis.get('must_have', []))
+        return [(name, partial(self._afrom_warm_pool, industry, must_haves, name, task)) for name, task in tasks]
+    
+    def _from_warm_pool(self, industry: str, must_haves: List[str], name: str, task: Callable[[], Any]) -> Any:
+        """
+        Use a pre-generated non-matching section if the warm pool has one that names none of
+        the posting's must-haves, otherwise run the call
+        """
+        section = self.warm_pool.take(industry, name, must_haves)
+        return task() if section is None else section
+    
+    async def _afrom_warm_pool(self, industry: str, must_haves: List[str], name: str,
+                               task: Callable[[], Awaitable[Any]]) -> Any:
+        """Async version of _from_warm_pool"""
+        section = self.warm_pool.take(industry, name, must_haves)
+        return await task() if section is None else section
+    
+    def _run_tasks(self, tasks: List[Callable[[], Any]]) -> List[Any]:
+        """Run section calls concurrently (bounded by max_concurrency), returning results in task order"""
+        if self.max_concurrency == 1 or len(tasks) <= 1:
+            return [task() for task in tasks]
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(tasks))) as executor:
+            futures = [executor.submit(task) for task in tasks]
+            return [future.result() for future in futures]
+    
+    async def _arun_tasks(self, tasks: List[Callable[[], Awaitable[Any]]]) -> List[Any]:
+        """Async version of _run_tasks: a semaphore bounds calls in flight, gather keeps task order"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
         
-        # Generate 3 work experience entries
-        senior_experience = self.generate_work_experience(job_analysis, industry, "Senior", is_matching)
-        mid_experience = self.generate_work_experience(job_analysis, industry, "Mid-level", is_matching)  
-        junior_experience = self.generate_work_experience(job_analysis, industry, "Junior", is_matching)
+        async def run(task):
+            async with semaphore:
+                return await task()
         
-        education_certs = self.generate_education_certifications(job_analysis, industry, is_matching)
+        return list(await asyncio.gather(*(run(task) for task in tasks)))
+    
+    def build_resume(self, sections: Dict[str, Any]) -> Resume:
+        """Assemble the generated sections into a Resume, experience in seniority order"""
+        return Resume(
+            contact=sections['contact_info'],
+            summary=sections['summary'],
+            skills=sections['skills'],
+            experience=sections['senior_experience'] + sections['mid_experience'] + sections['junior_experience'],
+            education=sections['education_certs']
+        )
+    
+    def build_multi_stage_resume(self, job_analysis: Dict, is_matching: bool = True) -> Resume:
+        """Assemble resume using multi-stage generation approach"""
+        # Generate each section separately (concurrently when max_concurrency > 1)
+        tasks = self._section_tasks(job_analysis, is_matching)
+        results = self._run_tasks([task for _, task in tasks])
         
-        # Assemble final resume with proper formatting
-        resume = f"""{contact_info}
-
-{summary}
-
-{skills}
-
-💼 PROFESSIONAL EXPERIENCE
-
-{senior_experience}
-
-{mid_experience}
-
-{junior_experience}
-
-{education_certs}"""
+        return self.build_resume(dict(zip((name for name, _ in tasks), results)))
+    
+    async def abuild_multi_stage_resume(self, job_analysis: Dict, is_matching: bool = True) -> Resume:
+        """Async version of build_multi_stage_resume"""
+        tasks = self._async_section_tasks(job_analysis, is_matching)
+        results = await self._arun_tasks([task for _, task in tasks])
         
-        return resume
+        return self.build_resume(dict(zip((name for name, _ in tasks), results)))
     
+    def assemble_multi_stage_resume(self, job_analysis: Dict, is_matching: bool = True) -> str:
+        return self.build_multi_stage_resume(job_analysis, is_matching).to_text()
     
-    def parse_job_description(self, job_description: str) -> Dict:
+    async def aassemble_multi_stage_resume(self, job_analysis: Dict, is_matching: bool = True) -> str:
+        return (await self.abuild_multi_stage_resume(job_analysis, is_matching)).to_text()
+    
+    
+    def _parse_request(self, job_description: str) -> Dict:
+        """Build the chat completion request for job description analysis"""
         prompt = f"""
         Analyze the following job description and extract key information.
         
@@ -537,17 +788,19 @@ class ResumeGenerator:
         Return ONLY the JSON object, no other text.
         """
         
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
+        return {
+            'model': PARSE_MODEL,
+            'messages': [
                 {"role": "system", "content": "You are a job description analyst. Extract key requirements and return them in valid JSON format."},
                 {"role": "user", "content": prompt}
             ],
-            temperature=0.3
-        )
-        
+            'temperature': 0.3
+        }
+    
+    def _parse_job_analysis(self, raw_content: str) -> Dict:
+        """Parse the analysis JSON, returning None if the response is unusable"""
         try:
-            content = response.choices[0].message.content.strip()
+            content = raw_content
             # Try to extract JSON if it's wrapped in markdown code blocks
             if content.startswith('```json'):
                 content = content.split('```json')[1].split('```')[0].strip()
@@ -557,14 +810,52 @@ class ResumeGenerator:
             return json.loads(content)
         except (json.JSONDecodeError, IndexError, AttributeError) as e:
             print(f"Warning: Failed to parse job description JSON: {e}")
-            print(f"Raw response: {response.choices[0].message.content}")
-            return {
-                "must_have": [],
-                "nice_to_have": [],
-                "job_title": "Unknown",
-                "industry": "Unknown", 
-                "responsibilities": []
-            }
+            print(f"Raw response: {raw_content}")
+            return None
+    
+    def _empty_job_analysis(self) -> Dict:
+        return {
+            "must_have": [],
+            "nice_to_have": [],
+            "job_title": "Unknown",
+            "industry": "Unknown", 
+            "responsibilities": []
+        }
+    
+    def _analysis_key(self, job_description: str) -> str:
+        return content_key(normalize_text(job_description), PARSE_MODEL, PARSE_PROMPT_VERSION)
+    
+    def _cache_job_analysis(self, key: str, job_analysis: Dict) -> Dict:
+        if job_analysis is None:
+            # Don't cache failed parses; the next submission gets a fresh attempt
+            return self._empty_job_analysis()
+        self.analysis_cache.set(key, job_analysis)
+        return copy.deepcopy(job_analysis)
+    
+    def parse_job_description(self, job_description: str) -> Dict:
+        key = self._analysis_key(job_description)
+        cached = self.analysis_cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        job_analysis = self.parse_flights.do(key, partial(self._parse_uncached, job_description))
+        return self._cache_job_analysis(key, job_analysis)
+    
+    def _parse_uncached(self, job_description: str) -> Dict:
+        return self._parse_job_analysis(self._complete(self._parse_request(job_description), 'parse'))
+    
+    async def _aparse_uncached(self, job_description: str) -> Dict:
+        return self._parse_job_analysis(await self._acomplete(self._parse_request(job_description), 'parse'))
+    
+    async def aparse_job_description(self, job_description: str) -> Dict:
+        """Async version of parse_job_description"""
+        key = self._analysis_key(job_description)
+        cached = self.analysis_cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        job_analysis = await self.parse_flights.ado(key, partial(self._aparse_uncached, job_description))
+        return self._cache_job_analysis(key, job_analysis)
     
     def generate_matching_resume(self, job_analysis: Dict) -> str:
         return self.assemble_multi_stage_resume(job_analysis, is_matching=True)
@@ -572,13 +863,108 @@ class ResumeGenerator:
     def generate_non_matching_resume(self, job_analysis: Dict) -> str:
         return self.assemble_multi_stage_resume(job_analysis, is_matching=False)
     
-    def generate_resumes(self, job_description: str) -> Tuple[str, str]:
+    async def agenerate_matching_resume(self, job_analysis: Dict) -> str:
+        return await self.aassemble_multi_stage_resume(job_analysis, is_matching=True)
+    
+    async def agenerate_non_matching_resume(self, job_analysis: Dict) -> str:
+        return await self.aassemble_multi_stage_resume(job_analysis, is_matching=False)
+    
+    def _check_mode(self, mode: str):
+        if mode not in GENERATION_MODES:
+            raise ValueError(f"Unknown generation mode {mode!r}, expected one of {', '.join(GENERATION_MODES)}")
+    
+    def _generation_key(self, job_description: str, mode: str) -> str:
+        return content_key(normalize_text(job_description), mode, self.structured_output)
+    
+    def generate_resume_models(self, job_description: str, mode: str = DEFAULT_GENERATION_MODE) -> Tuple[Resume, Resume]:
+        """Generate both resumes; a call identical to one already running waits for and shares its result"""
+        self._check_mode(mode)
+        resumes = self.generation_flights.do(self._generation_key(job_description, mode),
+                                             partial(self._generate_resume_models, job_description, mode))
+        # Every caller gets its own copy, so one request can't mutate another's resumes
+        return copy.deepcopy(resumes)
+    
+    def _generate_resume_models(self, job_description: str, mode: str) -> Tuple[Resume, Resume]:
         job_analysis = self.parse_job_description(job_description)
-        matching_resume = self.generate_matching_resume(job_analysis)
-        non_matching_resume = self.generate_non_matching_resume(job_analysis)
+        
+        if mode == 'fast':
+            matching_resume, non_matching_resume = self._run_tasks([
+                partial(self.generate_fast_resume, job_analysis, True),
+                partial(self.generate_fast_resume, job_analysis, False)
+            ])
+            return matching_resume, non_matching_resume
+        
+        # Fan out the sections of both resumes together so wall-clock time
+        # approaches the slowest single call rather than the sum of all of them
+        matching_tasks = self._section_tasks(job_analysis, is_matching=True)
+        non_matching_tasks = self._section_tasks(job_analysis, is_matching=False)
+        results = self._run_tasks([task for _, task in matching_tasks + non_matching_tasks])
+        
+        split = len(matching_tasks)
+        matching_resume = self.build_resume(dict(zip((name for name, _ in matching_tasks), results[:split])))
+        non_matching_resume = self.build_resume(dict(zip((name for name, _ in non_matching_tasks), results[split:])))
         
         return matching_resume, non_matching_resume
     
+    def generate_resumes(self, job_description: str, mode: str = DEFAULT_GENERATION_MODE) -> Tuple[str, str]:
+        matching_resume, non_matching_resume = self.generate_resume_models(job_description, mode)
+        return matching_resume.to_text(), non_matching_resume.to_text()
+    
+    def iter_resume_sections(self, job_description: str) -> Iterator[Tuple[bool, str, Any]]:
+        """
+        Yield (is_matching, section_name, section) for each section of both resumes
+        as soon as its call returns, in completion order rather than output order.
+        Pass the sections of one resume to build_resume once all have arrived.
+        Iterating the same posting while it is already streaming joins that run,
+        replaying the sections that are already done.
+        """
+        sections = self.section_flights.iterate(self._generation_key(job_description, 'detailed'),
+                                                partial(self._labelled_section_tasks, job_description),
+                                                self.max_concurrency)
+        try:
+            for (is_matching, name), section in sections:
+                # Every consumer gets its own copy, as with generate_resume_models
+                yield is_matching, name, copy.deepcopy(section)
+        finally:
+            sections.close()
+    
+    def _labelled_section_tasks(self, job_description: str) -> List[Tuple[Tuple[bool, str], Callable[[], Any]]]:
+        job_analysis = self.parse_job_description(job_description)
+        return [((is_matching, name), task) for is_matching in (True, False)
+                for name, task in self._section_tasks(job_analysis, is_matching)]
+    
+    async def agenerate_resume_models(self, job_description: str, mode: str = DEFAULT_GENERATION_MODE) -> Tuple[Resume, Resume]:
+        """Async version of generate_resume_models"""
+        self._check_mode(mode)
+        resumes = await self.generation_flights.ado(self._generation_key(job_description, mode),
+                                                    partial(self._agenerate_resume_models, job_description, mode))
+        return copy.deepcopy(resumes)
+    
+    async def _agenerate_resume_models(self, job_description: str, mode: str) -> Tuple[Resume, Resume]:
+        job_analysis = await self.aparse_job_description(job_description)
+        
+        if mode == 'fast':
+            matching_resume, non_matching_resume = await self._arun_tasks([
+                partial(self.agenerate_fast_resume, job_analysis, True),
+                partial(self.agenerate_fast_resume, job_analysis, False)
+            ])
+            return matching_resume, non_matching_resume
+        
+        matching_tasks = self._async_section_tasks(job_analysis, is_matching=True)
+        non_matching_tasks = self._async_section_tasks(job_analysis, is_matching=False)
+        results = await self._arun_tasks([task for _, task in matching_tasks + non_matching_tasks])
+        
+        split = len(matching_tasks)
+        matching_resume = self.build_resume(dict(zip((name for name, _ in matching_tasks), results[:split])))
+        non_matching_resume = self.build_resume(dict(zip((name for name, _ in non_matching_tasks), results[split:])))
+        
+        return matching_resume, non_matching_resume
+    
+    async def agenerate_resumes(self, job_description: str, mode: str = DEFAULT_GENERATION_MODE) -> Tuple[str, str]:
+        """Async version of generate_resumes"""
+        matching_resume, non_matching_resume = await self.agenerate_resume_models(job_description, mode)
+        return matching_resume.to_text(), non_matching_resume.to_text()
+    
     def generate_resumes_txt(self, job_description: str, output_dir: str = "output"):
         """Generate TXT resume files with full emoji formatting"""
         matching_resume, non_matching_resume = self.generate_resumes(job_description)
@@ -597,9 +983,24 @@ class ResumeGenerator:
         
         return matching_txt, non_matching_txt
     
+    def generate_resumes_json(self, job_description: str, output_dir: str = "output"):
+        """Generate JSON resume files holding the structured resume model"""
+        matching_resume, non_matching_resume = self.generate_resume_models(job_description)
+        
+        os.makedirs(output_dir, exist_ok=True)
+        
+        matching_json = os.path.join(output_dir, 'matching_resume.json')
+        non_matching_json = os.path.join(output_dir, 'non_matching_resume.json')
+        
+        for resume, path in ((matching_resume, matching_json), (non_matching_resume, non_matching_json)):
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(resume.to_dict(), f, ensure_ascii=False, indent=2)
+        
+        return matching_json, non_matching_json
+    
     def generate_resumes_pdf(self, job_description: str, output_dir: str = "output"):
         """Generate PDF resume files (legacy method)"""
-        matching_resume, non_matching_resume = self.generate_resumes(job_description)
+        matching_resume, non_matching_resume = self.generate_resume_models(job_description)
         
         os.makedirs(output_dir, exist_ok=True)
         
@@ -609,4 +1010,35 @@ class ResumeGenerator:
         self.pdf_generator.create_pdf_resume(matching_resume, matching_pdf)
         self.pdf_generator.create_pdf_resume(non_matching_resume, non_matching_pdf)
         
-        return matching_pdf, non_matching_pdf
\ No newline at end of file
+        return matching_pdf, non_matching_pdf
+    
+    async def agenerate_resumes_pdf(self, job_description: str, output_dir: str = "output"):
+        """Async version of generate_resumes_pdf; PDF rendering runs off the event loop"""
+        matching_resume, non_matching_resume = await self.agenerate_resume_models(job_description)
+        
+        os.makedirs(output_dir, exist_ok=True)
+        
+        matching_pdf = os.path.join(output_dir, 'matching_resume.pdf')
+        non_matching_pdf = os.path.join(output_dir, 'non_matching_resume.pdf')
+        
+        await asyncio.to_thread(self.pdf_generator.create_pdf_resume, matching_resume, matching_pdf)
+        await asyncio.to_thread(self.pdf_generator.create_pdf_resume, non_matching_resume, non_matching_pdf)
+        
+        return matching_pdf, non_matching_pdf
+
+
+_shared_generator = None
+_shared_generator_lock = threading.Lock()
+
+def get_shared_generator() -> ResumeGenerator:
+    """
+    Per-process ResumeGenerator reused across requests, so the OpenAI client, its
+    connection pool and the PDF stylesheet are built once per worker. All of its
+    mutable state (clients, caches) is thread-safe.
+    """
+    global _shared_generator
+    if _shared_generator is None:
+        with _shared_generator_lock:
+            if _shared_generator is None:
+                _shared_generator = ResumeGenerator()
+    return _shared_generator
\ No newline at end of file
@@ -0,0 +1,381 @@
+import re
+import json
+from dataclasses import asdict, dataclass, field
+from typing import Any, ClassVar, Dict, List
+
+SEPARATOR = '═' * 58
+
+DEGREE_WORDS = ('Bachelor', 'Master', 'PhD', 'Associate', 'Degree')
+
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b|\bPresent\b')
+_LEADING_EMOJI_RE = re.compile(r'^[🏢📅📍🎓📚🏅🛠️💼•\-*]+\s*')
+
+
+def _clean(line: str) -> str:
+    """Strip whitespace plus any emoji or bullet marker the model echoed back"""
+    return _LEADING_EMOJI_RE.sub('', line.strip()).replace('📍', '').strip()
+
+
+def _object_schema(**properties: Any) -> Dict[str, Any]:
+    """Strict-mode JSON schema object: every property required, nothing extra allowed"""
+    return {'type': 'object', 'properties': properties, 'required': list(properties), 'additionalProperties': False}
+
+
+_STRING = {'type': 'string'}
+_STRINGS = {'type': 'array', 'items': _STRING}
+
+
+def _text(value: Any) -> str:
+    if not isinstance(value, str):
+        raise TypeError(f"expected a string, got {type(value).__name__}")
+    return _clean(value)
+
+
+def _texts(values: Any) -> List[str]:
+    if not isinstance(values, list):
+        raise TypeError(f"expected a list, got {type(values).__name__}")
+    return [text for text in map(_text, values) if text]
+
+
+@dataclass(slots=True)
+class ContactInfo:
+    name: str
+    email: str = ''
+    phone: str = ''
+    location: str = ''
+    linkedin: str = ''
+
+    def to_line(self) -> str:
+        """Contact details without emojis, as shown under the name in the PDF"""
+        return ' | '.join(value for value in (self.email, self.phone, self.location, self.linkedin) if value)
+
+    def to_text(self) -> str:
+        details = ' | '.join(f"{emoji} {value}" for emoji, value in (
+            ('📧', self.email), ('📞', self.phone), ('🌍', self.location), ('💼', self.linkedin)
+        ) if value)
+        return f"""{SEPARATOR}
+
+{self.name}
+
+{details}
+
+{SEPARATOR}"""
+
+
+@dataclass(slots=True)
+class Summary:
+    text: str
+
+    SCHEMA: ClassVar[Dict[str, Any]] = _object_schema(summary=_STRING)
+
+    @classmethod
+    def from_response(cls, content: str) -> 'Summary':
+        return cls(text=content.strip())
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> 'Summary':
+        text = data['summary']
+        if not isinstance(text, str) or not text.strip():
+            raise ValueError('empty summary')
+        return cls(text=text.strip())
+
+    def to_text(self) -> str:
+        return f"""💼 PROFESSIONAL SUMMARY
+
+{self.text}
+
+{SEPARATOR}"""
+
+
+@dataclass(slots=True)
+class SkillGroup:
+    category: str
+    skills: str
+
+    def to_line(self) -> str:
+        return f"• {self.category}: {self.skills}" if self.category else self.skills
+
+
+@dataclass(slots=True)
+class Skills:
+    groups: List[SkillGroup] = field(default_factory=list)
+
+    SCHEMA: ClassVar[Dict[str, Any]] = _object_schema(
+        groups={'type': 'array', 'items': _object_schema(category=_STRING, skills=_STRING)}
+    )
+
+    @classmethod
+    def from_response(cls, content: str) -> 'Skills':
+        """One group per "Category: skill, skill" line; lines without a category are kept as-is"""
+        groups = []
+        for line in content.split('\n'):
+            line = line.strip().lstrip('•-*').strip()
+            if not line:
+                continue
+            category, colon, skills = line.partition(':')
+            if colon and skills.strip():
+                groups.append(SkillGroup(category=category.strip(), skills=skills.strip()))
+            else:
+                groups.append(SkillGroup(category='', skills=line))
+        return cls(groups=groups)
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> 'Skills':
+        groups = [SkillGroup(category=_text(group['category']), skills=_text(group['skills']))
+                  for group in data['groups']]
+        groups = [group for group in groups if group.skills]
+        if not groups:
+            raise ValueError('no skill groups')
+        return cls(groups=groups)
+
+    def lines(self) -> List[str]:
+        return [group.to_line() for group in self.groups]
+
+    def to_text(self) -> str:
+        return f"""🛠️ TECHNICAL EXPERTISE
+
+{chr(10).join(self.lines())}
+
+{SEPARATOR}"""
+
+
+@dataclass(slots=True)
+class ExperienceEntry:
+    company: str = ''
+    title: str = ''
+    dates: str = ''
+    location: str = ''
+    bullets: List[str] = field(default_factory=list)
+    details: List[str] = field(default_factory=list)
+
+    SCHEMA: ClassVar[Dict[str, Any]] = _object_schema(entries={'type': 'array', 'items': _object_schema(
+        company=_STRING, title=_STRING, dates=_STRING, location=_STRING, bullets=_STRINGS
+    )})
+
+    @classmethod
+    def from_response(cls, content: str) -> List['ExperienceEntry']:
+        """
+        Parse one or more "Company - Title" / "Dates | Location" / bullet blocks.
+
+        Date lines are recognised before company lines, since "January 2022 -
+        Present | Seattle, WA" also contains " - ".
+        """
+        entries = []
+        current = None
+        for raw_line in content.split('\n'):
+            stripped = raw_line.strip()
+            line = _clean(stripped)
+            if not line:
+                continue
+
+            if stripped.startswith(('•', '-', '*')):
+                if current is None:
+                    current = cls()
+                    entries.append(current)
+                current.bullets.append(line)
+            elif '|' in line and _YEAR_RE.search(line) and current is not None and not current.dates:
+                dates, _, location = line.partition('|')
+                current.dates, current.location = dates.strip(), location.strip()
+            elif ' - ' in line or '|' in line:
+                company, _, title = line.partition(' - ' if ' - ' in line else '|')
+                current = cls(company=company.strip(), title=title.strip())
+                entries.append(current)
+            elif current is None:
+                current = cls(title=line)
+                entries.append(current)
+            else:
+                current.details.append(line)
+        return entries
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> List['ExperienceEntry']:
+        entries = [cls(company=_text(entry['company']), title=_text(entry['title']), dates=_text(entry['dates']),
+                       location=_text(entry['location']), bullets=_texts(entry['bullets']))
+                   for entry in data['entries']]
+        if not entries or not all((entry.company or entry.title) and entry.bullets for entry in entries):
+            raise ValueError('experience entry without a title or bullets')
+        return entries
+
+    def company_line(self) -> str:
+        """Company, location and dates joined the way the PDF shows them under the title"""
+        return ' | '.join(value for value in (self.company, self.location, self.dates) if value)
+
+    def to_text(self) -> str:
+        lines = [f"🏢 {self.company} - {self.title}" if self.company and self.title
+                 else f"🏢 {self.company or self.title}"]
+        if self.dates or self.location:
+            lines.append(f"📅 {' | '.join(value for value in (self.dates, self.location) if value)}")
+        lines.extend(self.details)
+        lines.append('')
+        lines.extend(f"• {bullet}" for bullet in self.bullets)
+        return '\n'.join(lines)
+
+
+@dataclass(slots=True)
+class EducationEntry:
+    degree: str = ''
+    institution: str = ''
+    year: str = ''
+    details: List[str] = field(default_factory=list)
+
+    def lines(self) -> List[str]:
+        lines = []
+        if self.degree:
+            lines.append(self.degree)
+        if self.institution or self.year:
+            lines.append(' | '.join(value for value in (self.institution, self.year) if value))
+        return lines + self.details
+
+
+@dataclass(slots=True)
+class Education:
+    entries: List[EducationEntry] = field(default_factory=list)
+    certifications: List[str] = field(default_factory=list)
+
+    SCHEMA: ClassVar[Dict[str, Any]] = _object_schema(
+        entries={'type': 'array', 'items': _object_schema(
+            degree=_STRING, institution=_STRING, year=_STRING, details=_STRINGS
+        )},
+        certifications=_STRINGS
+    )
+
+    @classmethod
+    def from_response(cls, content: str) -> 'Education':
+        education = cls()
+        in_certifications = False
+        current = None
+
+        for raw_line in content.split('\n'):
+            stripped = raw_line.strip()
+            line = _clean(stripped)
+            if not line:
+                continue
+
+            upper = line.upper()
+            if upper.startswith('CERTIFICATIONS'):
+                in_certifications = True
+                continue
+            if upper.startswith('EDUCATION'):
+                in_certifications = False
+                continue
+
+            if in_certifications or stripped.startswith(('•', '-', '*')):
+                education.certifications.append(line)
+            elif any(word in line for word in DEGREE_WORDS) or '|' in line:
+                parts = [part.strip() for part in line.split('|')]
+                if any(word in parts[0] for word in DEGREE_WORDS):
+                    degree, rest = parts[0], parts[1:]
+                else:
+                    degree, rest = '', parts
+                # A new degree, or a second institution line, starts a new entry
+                if current is None or (degree and current.degree) or (rest and current.institution):
+                    current = EducationEntry()
+                    education.entries.append(current)
+                if degree:
+                    current.degree = degree
+                if rest:
+                    current.institution = rest[0]
+                    current.year = ' | '.join(rest[1:])
+            else:
+                if current is None:
+                    current = EducationEntry()
+                    education.entries.append(current)
+                current.details.append(line)
+        return education
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any]) -> 'Education':
+        entries = [EducationEntry(degree=_text(entry['degree']), institution=_text(entry['institution']),
+                                  year=_text(entry['year']), details=_texts(entry['details']))
+                   for entry in data['entries']]
+        if not entries or not all(entry.degree or entry.institution for entry in entries):
+            raise ValueError('education entry without a degree or institution')
+        return cls(entries=entries, certifications=_texts(data['certifications']))
+
+    def to_text(self) -> str:
+        lines = ["🎓 EDUCATION & CERTIFICATIONS", '']
+        for entry in self.entries:
+            if entry.degree:
+                lines.append(f"🎓 {entry.degree}")
+            if entry.institution or entry.year:
+                lines.append(f"🎓 {' | '.join(value for value in (entry.institution, entry.year) if value)}")
+            lines.extend(f"📚 {detail}" for detail in entry.details)
+        if self.certifications:
+            lines += ['', "🏅 CERTIFICATIONS (Recent & Relevant)"]
+            lines.extend(f"• {certification}" for certification in self.certifications)
+        lines += ['', SEPARATOR]
+        return '\n'.join(lines)
+
+
+@dataclass(slots=True)
+class Resume:
+    """A generated resume; every output format (TXT, JSON, PDF) is rendered from this"""
+    contact: ContactInfo
+    summary: Summary
+    skills: Skills
+    experience: List[ExperienceEntry]
+    education: Education
+
+    # Everything but the contact details, which are made up locally, in one structured response
+    SCHEMA: ClassVar[Dict[str, Any]] = _object_schema(
+        summary=_STRING,
+        skills=Skills.SCHEMA['properties']['groups'],
+        experience=ExperienceEntry.SCHEMA['properties']['entries'],
+        education=Education.SCHEMA['properties']['entries'],
+        certifications=_STRINGS
+    )
+
+    def to_text(self) -> str:
+        """Emoji-formatted plain text, as shown in the browser and written to .txt files"""
+        experience = '\n\n'.join(entry.to_text() for entry in self.experience)
+        return f"""{self.contact.to_text()}
+
+{self.summary.to_text()}
+
+{self.skills.to_text()}
+
+💼 PROFESSIONAL EXPERIENCE
+
+{experience}
+
+{self.education.to_text()}"""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), ensure_ascii=False)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Resume':
+        education = data['education']
+        return cls(
+            contact=ContactInfo(**data['contact']),
+            summary=Summary(**data['summary']),
+            skills=Skills(groups=[SkillGroup(**group) for group in data['skills']['groups']]),
+            experience=[ExperienceEntry(**entry) for entry in data['experience']],
+            education=Education(entries=[EducationEntry(**entry) for entry in education['entries']],
+                                certifications=list(education['certifications']))
+        )
+
+    @classmethod
+    def from_data(cls, data: Dict[str, Any], contact: ContactInfo) -> 'Resume':
+        """Build a resume from a response matching SCHEMA"""
+        return cls(
+            contact=contact,
+            summary=Summary.from_data({'summary': data['summary']}),
+            skills=Skills.from_data({'groups': data['skills']}),
+            experience=ExperienceEntry.from_data({'entries': data['experience']}),
+            education=Education.from_data({'entries': data['education'], 'certifications': data['certifications']})
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> 'Resume':
+        return cls.from_dict(json.loads(text))
+
+
+def section_text(section: Any) -> str:
+    """Text for one generated section; experience sections are lists of entries"""
+    if isinstance(section, list):
+        return '\n\n'.join(entry.to_text() for entry in section)
+    return section.to_text()
@@ -0,0 +1,269 @@
+import os
+import json
+import time
+import random
+import asyncio
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, fields, replace
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+from openai import APIConnectionError
+
+from metrics import LLM_HEDGES, LLM_RETRIES
+from rate_limiter import get_rate_limiter
+
+T = TypeVar('T')
+
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+
+@dataclass(slots=True)
+class RetryPolicy:
+    """How one section's LLM calls are retried and hedged"""
+    attempts: int = 3
+    # Full jitter: each retry sleeps a random time up to base_delay * 2**retry, capped at max_delay
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    # Send a duplicate request once a call has run longer than this section's recent p95
+    hedge: bool = False
+    hedge_percentile: float = 95
+    hedge_min_delay: float = 1.0
+    # No hedging until this many latencies are known, and at most this share of calls hedged
+    hedge_min_samples: int = 20
+    hedge_budget: float = 0.1
+
+
+# Work experience entries are the longest calls and the usual tail, so only they hedge by default
+DEFAULT_POLICIES = {
+    'experience': RetryPolicy(hedge=True),
+    'requirement': RetryPolicy(attempts=2),
+    'requirement_batch': RetryPolicy(attempts=2),
+}
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Rate limits, timeouts, conflicts, server errors and dropped connections are worth another try"""
+    status = getattr(error, 'status_code', None)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES or status >= 500
+    return isinstance(error, (APIConnectionError, TimeoutError, ConnectionError))
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Seconds the server asked us to wait (Retry-After header), if any"""
+    headers = getattr(getattr(error, 'response', None), 'headers', None) or {}
+    try:
+        return float(headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+class LatencyTracker:
+    """Recent successful call latencies per section, for hedge delays"""
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self._samples: Dict[str, deque] = {}
+        self._calls: Dict[str, int] = {}
+        self._hedges: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, section: str, seconds: float):
+        with self._lock:
+            self._samples.setdefault(section, deque(maxlen=self.window)).append(seconds)
+
+    def percentile(self, section: str, pct: float) -> Optional[float]:
+        with self._lock:
+            samples = sorted(self._samples.get(section, ()))
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(pct / 100 * len(samples)))]
+
+    def count_call(self, section: str):
+        with self._lock:
+            self._calls[section] = self._calls.get(section, 0) + 1
+
+    def take_hedge(self, section: str, budget: float) -> bool:
+        """Reserve a hedge if this section is within its budget"""
+        with self._lock:
+            hedges = self._hedges.get(section, 0)
+            if hedges + 1 > budget * self._calls.get(section, 0):
+                return False
+            self._hedges[section] = hedges + 1
+            return True
+
+    def sample_count(self, section: str) -> int:
+        with self._lock:
+            return len(self._samples.get(section, ()))
+
+
+class ResilientCaller:
+    """
+    Runs LLM calls under their section's RetryPolicy: retryable errors are
+    retried with jittered exponential backoff, and calls slower than the
+    section's recent p95 get one hedged duplicate, first answer wins.
+    """
+
+    def __init__(self, policies: Dict[str, RetryPolicy] = None, default: RetryPolicy = None,
+                 hedge_workers: int = None):
+        self.policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        self.default = default or RetryPolicy()
+        self.latency = LatencyTracker()
+        self._rng = random.Random()
+        self._hedge_workers = hedge_workers
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def policy(self, section: str) -> RetryPolicy:
+        return self.policies.get(section, self.default)
+
+    def backoff(self, policy: RetryPolicy, retry: int, error: BaseException) -> float:
+        delay = self._rng.uniform(0, min(policy.max_delay, policy.base_delay * 2 ** retry))
+        return max(delay, min(retry_after(error) or 0, policy.max_delay))
+
+    def hedge_delay(self, section: str, policy: RetryPolicy) -> Optional[float]:
+        if not policy.hedge or self.latency.sample_count(section) < policy.hedge_min_samples:
+            return None
+        return max(policy.hedge_min_delay, self.latency.percentile(section, policy.hedge_percentile))
+
+    def _timed(self, section: str, call: Callable[[], T]) -> T:
+        start = time.perf_counter()
+        result = call()
+        self.latency.record(section, time.perf_counter() - start)
+        return result
+
+    async def _atimed(self, section: str, call: Callable[[], Awaitable[T]]) -> T:
+        start = time.perf_counter()
+        result = await call()
+        self.latency.record(section, time.perf_counter() - start)
+        return result
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        # Hedged sync calls run the primary and the duplicate on these threads so the caller can wait on both.
+        # Every call the limiter lets through may have both running, so the pool defaults to twice its ceiling
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    workers = self._hedge_workers or 2 * int(get_rate_limiter().concurrency.maximum)
+                    self._executor = ThreadPoolExecutor(workers, thread_name_prefix='llm-hedge')
+        return self._executor
+
+    def _hedged(self, section: str, policy: RetryPolicy, call: Callable[[], T]) -> T:
+        self.latency.count_call(section)
+        delay = self.hedge_delay(section, policy)
+        if delay is None:
+            return self._timed(section, call)
+
+        started = threading.Event()
+
+        def run_primary() -> T:
+            started.set()
+            return self._timed(section, call)
+
+        primary = self.executor.submit(run_primary)
+        # Time spent queued for a pool thread doesn't count toward the hedge delay
+        started.wait()
+        done, _ = wait([primary], timeout=delay)
+        if done or not self.latency.take_hedge(section, policy.hedge_budget):
+            return primary.result()
+
+        hedge = self.executor.submit(self._timed, section, call)
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    # The loser can't be interrupted mid-request; its answer is simply dropped
+                    LLM_HEDGES.labels(section, 'hedge_won' if future is hedge else 'primary_won').inc()
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    async def _ahedged(self, section: str, policy: RetryPolicy, call: Callable[[], Awaitable[T]]) -> T:
+        self.latency.count_call(section)
+        delay = self.hedge_delay(section, policy)
+        if delay is None:
+            return await self._atimed(section, call)
+
+        primary = asyncio.ensure_future(self._atimed(section, call))
+        pending = {primary}
+        error = None
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done or not self.latency.take_hedge(section, policy.hedge_budget):
+                return await primary
+
+            hedge = asyncio.ensure_future(self._atimed(section, call))
+            pending = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        LLM_HEDGES.labels(section, 'hedge_won' if task is hedge else 'primary_won').inc()
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def call(self, section: str, call: Callable[[], T]) -> T:
+        """Run call (one LLM request) with the section's retries and hedging"""
+        policy = self.policy(section)
+        for attempt in range(policy.attempts):
+            try:
+                return self._hedged(section, policy, call)
+            except Exception as e:
+                if attempt + 1 >= policy.attempts or not is_retryable(e):
+                    raise
+                LLM_RETRIES.labels(section, type(e).__name__).inc()
+                time.sleep(self.backoff(policy, attempt, e))
+
+    async def acall(self, section: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Async version of call"""
+        policy = self.policy(section)
+        for attempt in range(policy.attempts):
+            try:
+                return await self._ahedged(section, policy, call)
+            except Exception as e:
+                if attempt + 1 >= policy.attempts or not is_retryable(e):
+                    raise
+                LLM_RETRIES.labels(section, type(e).__name__).inc()
+                await asyncio.sleep(self.backoff(policy, attempt, e))
+
+
+def load_policies(overrides: str = None) -> Dict[str, RetryPolicy]:
+    """
+    DEFAULT_POLICIES with per-section overrides from JSON, e.g.
+    '{"summary": {"hedge": true}, "experience": {"attempts": 4, "hedge_percentile": 90}}'.
+    Fields not given keep the section's default.
+    """
+    policies = dict(DEFAULT_POLICIES)
+    known = {field.name for field in fields(RetryPolicy)}
+    for section, options in json.loads(overrides or '{}').items():
+        unknown = set(options) - known
+        if unknown:
+            raise ValueError(f"Unknown retry policy option(s) for {section}: {', '.join(sorted(unknown))}")
+        policies[section] = replace(policies.get(section, RetryPolicy()), **options)
+    return policies
+
+
+_shared_caller = None
+_caller_lock = threading.Lock()
+
+
+def get_resilient_caller() -> ResilientCaller:
+    """Process-wide caller configured by LLM_RETRY_POLICIES (JSON) and LLM_HEDGING=0 to turn hedging off"""
+    global _shared_caller
+    if _shared_caller is None:
+        with _caller_lock:
+            if _shared_caller is None:
+                policies = load_policies(os.getenv('LLM_RETRY_POLICIES'))
+                if os.getenv('LLM_HEDGING', '1').lower() in ('0', 'false', 'no'):
+                    policies = {section: replace(policy, hedge=False) for section, policy in policies.items()}
+                _shared_caller = ResilientCaller(policies)
+    return _shared_caller
@@ -0,0 +1,173 @@
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import partial
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, List, Tuple, TypeVar
+
+from metrics import SINGLEFLIGHT_SHARED
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key onto one execution.
+
+    The first caller for a key runs the work; callers arriving while it is in
+    flight wait for it and get the same result (or exception). Nothing is kept
+    once it finishes, so this deduplicates bursts without acting as a cache.
+    Waiters may be threads or coroutines on any event loop, since the shared
+    result is a concurrent.futures.Future.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.shared = 0
+
+    def _join(self, key: Hashable) -> Tuple[Future, bool]:
+        """Return the key's in-flight future and whether the caller must run the work"""
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.shared += 1
+                SINGLEFLIGHT_SHARED.labels(self.name).inc()
+                return future, False
+            future = Future()
+            self._calls[key] = future
+            self.executions += 1
+            return future, True
+
+    def _finish(self, key: Hashable, future: Future, result=None, error: BaseException = None):
+        with self._lock:
+            del self._calls[key]
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def do(self, key: Hashable, work: Callable[[], T]) -> T:
+        future, leader = self._join(key)
+        if not leader:
+            return future.result()
+        try:
+            result = work()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result)
+        return result
+
+    async def ado(self, key: Hashable, work: Callable[[], Awaitable[T]]) -> T:
+        """Async version of do"""
+        future, leader = self._join(key)
+        if not leader:
+            return await asyncio.wrap_future(future)
+        try:
+            result = await work()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result)
+        return result
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+
+class _FanOut:
+    """One shared run of labelled tasks: its futures, once planned, and who is still reading them"""
+
+    def __init__(self):
+        self.futures = Future()
+        self.executor = None
+        self.consumers = 0
+        self.remaining = 0
+
+
+class FanOutFlight:
+    """
+    SingleFlight for work that produces several results as they complete, such
+    as the sections of a streamed generation.
+
+    The first caller for a key plans the tasks and starts them; callers arriving
+    while they run iterate the same futures, so each still sees every result as
+    it finishes. The key is forgotten once all tasks finish. Tasks that haven't
+    started are cancelled only when every caller has stopped iterating.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._runs: Dict[Hashable, _FanOut] = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.shared = 0
+
+    def iterate(self, key: Hashable, plan: Callable[[], List[Tuple[Any, Callable[[], T]]]],
+                max_workers: int) -> Iterator[Tuple[Any, T]]:
+        """Yield (label, result) for each of plan()'s (label, task) pairs, in completion order"""
+        with self._lock:
+            run = self._runs.get(key)
+            leader = run is None
+            if leader:
+                run = self._runs[key] = _FanOut()
+                self.executions += 1
+            else:
+                self.shared += 1
+                SINGLEFLIGHT_SHARED.labels(self.name).inc()
+            run.consumers += 1
+
+        try:
+            if leader:
+                self._start(key, run, plan, max_workers)
+            labels = {future: label for label, future in run.futures.result()}
+            for future in as_completed(labels):
+                yield labels[future], future.result()
+        finally:
+            self._leave(key, run)
+
+    def _start(self, key: Hashable, run: _FanOut, plan: Callable, max_workers: int):
+        try:
+            tasks = plan()
+        except BaseException as e:
+            self._forget(key, run)
+            run.futures.set_exception(e)
+            raise
+        run.executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks))))
+        futures = [(label, run.executor.submit(task)) for label, task in tasks]
+        run.remaining = len(futures)
+        for _, future in futures:
+            future.add_done_callback(partial(self._task_done, key, run))
+        run.futures.set_result(futures)
+        if not futures:
+            self._forget(key, run)
+
+    def _task_done(self, key: Hashable, run: _FanOut, _future: Future):
+        with self._lock:
+            run.remaining -= 1
+            finished = run.remaining == 0
+        if finished:
+            self._forget(key, run)
+            run.executor.shutdown(wait=False)
+
+    def _leave(self, key: Hashable, run: _FanOut):
+        with self._lock:
+            run.consumers -= 1
+            abandoned = run.consumers == 0
+        if abandoned:
+            self._forget(key, run)
+            if run.executor is not None:
+                # Don't start queued tasks once nobody is reading (e.g. every client disconnected)
+                run.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _forget(self, key: Hashable, run: _FanOut):
+        with self._lock:
+            if self._runs.get(key) is run:
+                del self._runs[key]
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._runs)
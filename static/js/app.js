@@ -5,6 +5,9 @@ class ResumeGenerator {
         this.jobDescription = '';
         this.goodResume = '';
         this.badResume = '';
+        this.goodResumeId = null;
+        this.badResumeId = null;
+        this.resultsVisible = false;
         this.nonNegotiables = [];
         this.niceToHaves = [];
         this.initializeEventListeners();
@@ -168,28 +171,21 @@ class ResumeGenerator {
         this.startLoadingAnimation();
 
         try {
-            const response = await fetch('/generate', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({ job_description: jobDescription })
-            });
-
-            const data = await response.json();
+            const modeSelect = document.getElementById('generationMode');
+            const mode = modeSelect ? modeSelect.value : 'detailed';
 
-            if (!response.ok) {
-                throw new Error(data.error || 'Generation failed');
-            }
+            // Detailed sections are rendered as they arrive; fast mode returns both resumes at once
+            const data = mode === 'fast'
+                ? await this.fetchResumes(jobDescription, mode)
+                : await this.streamResumes(jobDescription);
 
             this.goodResume = data.good_resume;
             this.badResume = data.bad_resume;
+            this.goodResumeId = data.good_resume_id || null;
+            this.badResumeId = data.bad_resume_id || null;
 
-            // Simulate minimum loading time for better UX
-            setTimeout(() => {
-                this.showResults();
-                this.showToast('Resumes generated successfully!', 'success');
-            }, 1500);
+            this.showResults();
+            this.showToast('Resumes generated successfully!', 'success');
 
         } catch (error) {
             console.error('Generation error:', error);
@@ -198,6 +194,108 @@ class ResumeGenerator {
         }
     }
 
+    async fetchResumes(jobDescription, mode) {
+        const response = await fetch('/generate', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ job_description: jobDescription, mode: mode })
+        });
+
+        const data = await response.json();
+        if (!response.ok || !data.success) {
+            throw new Error(data.error || 'Generation failed');
+        }
+        return data;
+    }
+
+    async streamResumes(jobDescription) {
+        const response = await fetch('/generate/stream', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ job_description: jobDescription })
+        });
+
+        if (!response.ok) {
+            const data = await response.json();
+            throw new Error(data.error || 'Generation failed');
+        }
+
+        const sections = { good: {}, bad: {} };
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+
+        while (true) {
+            const { value, done } = await reader.read();
+            if (done) break;
+
+            buffer += decoder.decode(value, { stream: true });
+
+            // Server-Sent Events are separated by a blank line
+            let boundary;
+            while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                const { event, data } = this.parseServerSentEvent(buffer.slice(0, boundary));
+                buffer = buffer.slice(boundary + 2);
+
+                if (event === 'section') {
+                    sections[data.resume][data.section] = data.content;
+                    this.renderPartialResume(data.resume, sections[data.resume]);
+                } else if (event === 'done') {
+                    return data;
+                } else if (event === 'error') {
+                    throw new Error(data.error || 'Generation failed');
+                }
+            }
+        }
+
+        throw new Error('Generation stream ended unexpectedly');
+    }
+
+    parseServerSentEvent(frame) {
+        let event = 'message';
+        const dataLines = [];
+        frame.split('\n').forEach(line => {
+            if (line.startsWith('event:')) {
+                event = line.slice(6).trim();
+            } else if (line.startsWith('data:')) {
+                dataLines.push(line.slice(5).trim());
+            }
+        });
+        return { event, data: JSON.parse(dataLines.join('\n') || '{}') };
+    }
+
+    renderPartialResume(resume, sections) {
+        if (!this.resultsVisible) {
+            this.showResultsLayout();
+            ['goodResumeContent', 'badResumeContent'].forEach(id => {
+                const element = document.getElementById(id);
+                if (element) element.textContent = '⏳ Generating...';
+            });
+        }
+
+        // Same section order and experience header as the server-side assembly
+        const order = ['contact_info', 'summary', 'skills', 'senior_experience', 'mid_experience', 'junior_experience', 'education_certs'];
+        const parts = [];
+        order.forEach(name => {
+            if (name === 'senior_experience' && ['senior_experience', 'mid_experience', 'junior_experience'].some(key => key in sections)) {
+                parts.push('💼 PROFESSIONAL EXPERIENCE');
+            }
+            if (name in sections) {
+                parts.push(sections[name]);
+            }
+        });
+        if (Object.keys(sections).length < order.length) {
+            parts.push('⏳ Generating remaining sections...');
+        }
+
+        const content = document.getElementById(resume === 'good' ? 'goodResumeContent' : 'badResumeContent');
+        if (content) content.textContent = parts.join('\n\n');
+    }
+
     startLoadingAnimation() {
         const progressFill = document.querySelector('.progress-fill');
         if (progressFill) {
@@ -226,24 +324,51 @@ class ResumeGenerator {
     }
 
     hideLoadingState() {
+        const resultsSection = document.getElementById('resultsSection');
         const inputSection = document.querySelector('.input-section');
         const loadingSection = document.getElementById('loadingSection');
         
         if (loadingSection) loadingSection.style.display = 'none';
         if (inputSection) inputSection.style.display = 'block';
 
+        // A failed stream may already have revealed partial results
+        if (this.resultsVisible) {
+            const heroSection = document.querySelector('.hero');
+            if (resultsSection) resultsSection.style.display = 'none';
+            if (heroSection) heroSection.style.display = 'block';
+            this.resultsVisible = false;
+        }
+
         // Restore page title
         document.title = '🎯 Role Requirements Assistant';
     }
 
     showResults() {
-        const loadingSection = document.getElementById('loadingSection');
-        const resultsSection = document.getElementById('resultsSection');
         const badResumeContent = document.getElementById('badResumeContent');
         const goodResumeContent = document.getElementById('goodResumeContent');
+
+        if (!this.resultsVisible) {
+            this.showResultsLayout();
+        }
+
+        if (badResumeContent) badResumeContent.textContent = this.badResume;
+        if (goodResumeContent) goodResumeContent.textContent = this.goodResume;
+
+        // Populate criteria evaluation
+        this.populateEvaluation();
+
+        // Update page title
+        document.title = '📋 Candidate Examples - Role Requirements Assistant';
+    }
+
+    showResultsLayout() {
+        const loadingSection = document.getElementById('loadingSection');
+        const resultsSection = document.getElementById('resultsSection');
         const heroSection = document.querySelector('.hero');
         const inputSection = document.querySelector('.input-section');
 
+        this.resultsVisible = true;
+
         if (loadingSection) loadingSection.style.display = 'none';
         if (heroSection) heroSection.style.display = 'none';
         if (inputSection) inputSection.style.display = 'none';
@@ -254,15 +379,6 @@ class ResumeGenerator {
             resultsSection.scrollIntoView({ behavior: 'smooth', block: 'start' });
         }
 
-        if (badResumeContent) badResumeContent.textContent = this.badResume;
-        if (goodResumeContent) goodResumeContent.textContent = this.goodResume;
-
-        // Populate criteria evaluation
-        this.populateEvaluation();
-
-        // Update page title
-        document.title = '📋 Candidate Examples - Role Requirements Assistant';
-
         // Trigger animations
         setTimeout(() => {
             document.querySelectorAll('.resume-card').forEach((card, index) => {
@@ -297,37 +413,20 @@ class ResumeGenerator {
         acceptCriteria.innerHTML = '<div class="loading-analysis">🤖 AI is analyzing resume criteria...</div>';
 
         try {
+            // One batch request per resume instead of one request per requirement;
+            // both resumes are analyzed in parallel
+            const [badResults, goodResults] = await Promise.all([
+                this.analyzeRequirements(this.badResume, this.badResumeId),
+                this.analyzeRequirements(this.goodResume, this.goodResumeId)
+            ]);
+
             // Analyze bad resume (reject criteria)
-            this.currentlyEvaluatingGoodResume = false;
             rejectCriteria.innerHTML = '';
-            
-            for (const requirement of this.nonNegotiables) {
-                const actuallyMeetsRequirement = await this.doesResumeMeetRequirement(this.badResume, requirement);
-                const criteriaItem = this.createCriteriaItem(requirement, actuallyMeetsRequirement, true);
-                rejectCriteria.appendChild(criteriaItem);
-            }
-
-            for (const requirement of this.niceToHaves) {
-                const actuallyMeetsRequirement = await this.doesResumeMeetRequirement(this.badResume, requirement);
-                const criteriaItem = this.createCriteriaItem(requirement, actuallyMeetsRequirement, false);
-                rejectCriteria.appendChild(criteriaItem);
-            }
+            this.appendCriteriaItems(rejectCriteria, badResults);
 
             // Analyze good resume (accept criteria)
-            this.currentlyEvaluatingGoodResume = true;
             acceptCriteria.innerHTML = '';
-            
-            for (const requirement of this.nonNegotiables) {
-                const actuallyMeetsRequirement = await this.doesResumeMeetRequirement(this.goodResume, requirement);
-                const criteriaItem = this.createCriteriaItem(requirement, actuallyMeetsRequirement, true);
-                acceptCriteria.appendChild(criteriaItem);
-            }
-
-            for (const requirement of this.niceToHaves) {
-                const actuallyMeetsRequirement = await this.doesResumeMeetRequirement(this.goodResume, requirement);
-                const criteriaItem = this.createCriteriaItem(requirement, actuallyMeetsRequirement, false);
-                acceptCriteria.appendChild(criteriaItem);
-            }
+            this.appendCriteriaItems(acceptCriteria, goodResults);
             
         } catch (error) {
             console.error('Error during evaluation:', error);
@@ -336,38 +435,56 @@ class ResumeGenerator {
         }
     }
 
-    async doesResumeMeetRequirement(resumeText, requirement) {
-        if (!resumeText || !requirement) return false;
-        
-        try {
-            const response = await fetch('/analyze-requirement', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({
-                    requirement: requirement,
-                    resume_text: resumeText
-                })
-            });
-            
-            const result = await response.json();
-            
-            if (response.ok) {
-                // Store the AI analysis for later use
-                this.lastAnalysis = result;
-                return result.meets_requirement;
-            } else {
-                console.error('Analysis failed:', result.error);
-                return false;
+    appendCriteriaItems(container, results) {
+        const nonNegotiableCount = this.nonNegotiables.length;
+        results.forEach((analysis, index) => {
+            const criteriaItem = this.createCriteriaItem(
+                analysis.requirement, analysis.meets_requirement, index < nonNegotiableCount, analysis
+            );
+            container.appendChild(criteriaItem);
+        });
+    }
+
+    async postWithResumeIds(url, payload, resumeIds, resumeTexts) {
+        // Send the compact server-side resume IDs; if the server no longer has them, resend the text
+        const post = (body) => fetch(url, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify(body)
+        });
+
+        if (Object.values(resumeIds).every(Boolean)) {
+            const response = await post({ ...payload, ...resumeIds });
+            if (response.status !== 404) {
+                return response;
             }
-        } catch (error) {
-            console.error('Error analyzing requirement:', error);
-            return false;
         }
+
+        return post({ ...payload, ...resumeTexts });
+    }
+
+    async analyzeRequirements(resumeText, resumeId) {
+        const requirements = [...this.nonNegotiables, ...this.niceToHaves];
+
+        const response = await this.postWithResumeIds(
+            '/analyze-requirements',
+            { requirements: requirements },
+            { resume_id: resumeId },
+            { resume_text: resumeText }
+        );
+
+        const result = await response.json();
+
+        if (!response.ok) {
+            throw new Error(result.error || 'Analysis failed');
+        }
+
+        return result.results;
     }
 
-    createCriteriaItem(requirement, passed, isNonNegotiable) {
+    createCriteriaItem(requirement, passed, isNonNegotiable, analysis = null) {
         const item = document.createElement('div');
         item.className = 'criteria-item';
 
@@ -386,7 +503,7 @@ class ResumeGenerator {
         statusDiv.className = 'criteria-status';
         
         // Generate realistic explanations based on the requirement
-        const explanation = this.generateCriteriaExplanation(requirement, passed, isNonNegotiable);
+        const explanation = this.generateCriteriaExplanation(requirement, passed, isNonNegotiable, analysis);
         statusDiv.textContent = explanation;
         
         if (passed) {
@@ -406,7 +523,7 @@ class ResumeGenerator {
             console.log('Show Examples clicked for:', requirement);
             // Determine if this is from accept or reject section
             const isFromAcceptSection = item.closest('#acceptCriteria') !== null;
-            this.showExamples(requirement, passed, isNonNegotiable, isFromAcceptSection);
+            this.showExamples(requirement, passed, isNonNegotiable, isFromAcceptSection, analysis);
         });
 
         item.appendChild(icon);
@@ -416,16 +533,16 @@ class ResumeGenerator {
         return item;
     }
 
-    generateCriteriaExplanation(requirement, passed, isNonNegotiable) {
-        // Use the AI analysis that was stored when checking the requirement
-        if (this.lastAnalysis && this.lastAnalysis.explanation) {
-            return this.lastAnalysis.explanation;
+    generateCriteriaExplanation(requirement, passed, isNonNegotiable, analysis = null) {
+        // Prefer the batch analysis for this requirement
+        if (analysis && analysis.explanation) {
+            return analysis.explanation;
         }
-        
+
         return passed ? 'Requirement appears to be met.' : 'No clear evidence found.';
     }
 
-    showExamples(requirement, passed, isNonNegotiable, isFromAcceptSection) {
+    showExamples(requirement, passed, isNonNegotiable, isFromAcceptSection, analysis = null) {
         console.log('showExamples called:', { requirement, passed, isNonNegotiable, isFromAcceptSection });
         
         const modal = document.getElementById('examplesModal');
@@ -440,13 +557,40 @@ class ResumeGenerator {
 
         // Use the section parameter to determine which resume to show
         const currentResume = isFromAcceptSection ? this.goodResume : this.badResume;
+        const currentResumeId = isFromAcceptSection ? this.goodResumeId : this.badResumeId;
         const resumeType = isFromAcceptSection ? 'ACCEPT' : 'REJECT';
         
-        // Get fresh AI analysis for this specific requirement and resume
-        this.getAIAnalysisForModal(requirement, currentResume, resumeType, modal, modalBody, passed, isNonNegotiable);
+        // Reuse the analysis from the evaluation when it has evidence; only fetch when it doesn't
+        if (analysis && analysis.explanation && analysis.evidence) {
+            this.renderModalAnalysis(modalBody, requirement, resumeType, isNonNegotiable, analysis);
+            modal.style.display = 'block';
+            return;
+        }
+        this.getAIAnalysisForModal(requirement, currentResume, currentResumeId, resumeType, modal, modalBody, passed, isNonNegotiable);
+    }
+
+    renderModalAnalysis(modalBody, requirement, resumeType, isNonNegotiable, result) {
+        modalBody.innerHTML = `
+            <h3><i class="fas fa-search"></i> Resume Evidence</h3>
+            <div class="requirement-header">
+                <h4>${result.meets_requirement ? '✅' : '❌'} ${requirement}</h4>
+                <p class="requirement-type">${isNonNegotiable ? 'Non-Negotiable Requirement' : 'Nice to Have'}</p>
+            </div>
+            
+            <div class="examples-content">
+                <div class="resume-example">
+                    <h5>${resumeType} Resume - AI Analysis:</h5>
+                    <div class="example-text">
+                        <p><strong>Analysis:</strong> ${result.explanation}</p>
+                        <p><strong>Supporting Evidence:</strong></p>
+                        <pre class="resume-excerpt">${result.evidence}</pre>
+                    </div>
+                </div>
+            </div>
+        `;
     }
 
-    async getAIAnalysisForModal(requirement, resumeText, resumeType, modal, modalBody, passed, isNonNegotiable) {
+    async getAIAnalysisForModal(requirement, resumeText, resumeId, resumeType, modal, modalBody, passed, isNonNegotiable) {
         // Show loading in modal
         modalBody.innerHTML = `
             <h3><i class="fas fa-search"></i> Resume Evidence</h3>
@@ -463,38 +607,17 @@ class ResumeGenerator {
         modal.style.display = 'block';
         
         try {
-            const response = await fetch('/analyze-requirement', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({
-                    requirement: requirement,
-                    resume_text: resumeText
-                })
-            });
+            const response = await this.postWithResumeIds(
+                '/analyze-requirement',
+                { requirement: requirement },
+                { resume_id: resumeId },
+                { resume_text: resumeText }
+            );
             
             const result = await response.json();
             
             if (response.ok) {
-                modalBody.innerHTML = `
-                    <h3><i class="fas fa-search"></i> Resume Evidence</h3>
-                    <div class="requirement-header">
-                        <h4>${result.meets_requirement ? '✅' : '❌'} ${requirement}</h4>
-                        <p class="requirement-type">${isNonNegotiable ? 'Non-Negotiable Requirement' : 'Nice to Have'}</p>
-                    </div>
-                    
-                    <div class="examples-content">
-                        <div class="resume-example">
-                            <h5>${resumeType} Resume - AI Analysis:</h5>
-                            <div class="example-text">
-                                <p><strong>Analysis:</strong> ${result.explanation}</p>
-                                <p><strong>Supporting Evidence:</strong></p>
-                                <pre class="resume-excerpt">${result.evidence}</pre>
-                            </div>
-                        </div>
-                    </div>
-                `;
+                this.renderModalAnalysis(modalBody, requirement, resumeType, isNonNegotiable, result);
             } else {
                 modalBody.innerHTML += `<div class="error-analysis">❌ Error: ${result.error}</div>`;
             }
@@ -692,6 +815,7 @@ class ResumeGenerator {
         
         if (resultsSection) resultsSection.style.display = 'none';
         if (heroSection) heroSection.style.display = 'block';
+        this.resultsVisible = false;
         if (inputSection) {
             inputSection.style.display = 'block';
             // Smooth scroll to input
@@ -701,6 +825,8 @@ class ResumeGenerator {
         // Clear previous results
         this.goodResume = '';
         this.badResume = '';
+        this.goodResumeId = null;
+        this.badResumeId = null;
 
         // Restore page title
         document.title = '🎯 Role Requirements Assistant';
@@ -766,34 +892,23 @@ class ResumeGenerator {
     }
 
     async exportPDFs() {
-        if (!this.jobDescription) {
-            this.showToast('No job description available for PDF export', 'error');
+        if (!this.goodResume || !this.badResume) {
+            this.showToast('No resumes available for PDF export', 'error');
             return;
         }
 
         const exportBtn = document.getElementById('exportPdfBtn');
         const originalText = exportBtn.innerHTML;
-        exportBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Generating PDFs...';
+        exportBtn.innerHTML = '<i class="fas fa-spinner fa-spin"></i> Rendering PDFs...';
         exportBtn.disabled = true;
 
         try {
-            const response = await fetch('/export/pdf', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json',
-                },
-                body: JSON.stringify({ job_description: this.jobDescription })
-            });
-
-            const data = await response.json();
-
-            if (!response.ok) {
-                throw new Error(data.error || 'PDF export failed');
-            }
-
-            // Download PDFs
-            this.downloadBase64File(data.good_pdf, 'strong_candidate_example.pdf');
-            this.downloadBase64File(data.bad_pdf, 'weak_candidate_example.pdf');
+            // Export the resumes already on screen instead of regenerating them;
+            // each PDF arrives as raw bytes, both requests run in parallel
+            await Promise.all([
+                this.downloadPDF('good', this.goodResumeId, this.goodResume, 'strong_candidate_example.pdf'),
+                this.downloadPDF('bad', this.badResumeId, this.badResume, 'weak_candidate_example.pdf')
+            ]);
 
             this.showToast('PDFs exported successfully!', 'success');
 
@@ -806,15 +921,23 @@ class ResumeGenerator {
         }
     }
 
-    downloadBase64File(base64Data, filename) {
-        const byteCharacters = atob(base64Data);
-        const byteNumbers = new Array(byteCharacters.length);
-        for (let i = 0; i < byteCharacters.length; i++) {
-            byteNumbers[i] = byteCharacters.charCodeAt(i);
+    async downloadPDF(which, resumeId, resumeText, filename) {
+        const response = await this.postWithResumeIds(
+            '/export/pdf/download',
+            { which: which },
+            { [`${which}_resume_id`]: resumeId },
+            { [`${which}_resume`]: resumeText }
+        );
+
+        if (!response.ok) {
+            const data = await response.json();
+            throw new Error(data.error || 'PDF export failed');
         }
-        const byteArray = new Uint8Array(byteNumbers);
-        const blob = new Blob([byteArray], { type: 'application/pdf' });
-        
+
+        this.downloadBlob(await response.blob(), filename);
+    }
+
+    downloadBlob(blob, filename) {
         const url = URL.createObjectURL(blob);
         const a = document.createElement('a');
         a.href = url;
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test the batch generation CLI on the fake LLM backend (runs offline)
+"""
+
+import json
+import os
+
+from batch_generate import CHECKPOINT_FILE, read_jobs, run_batch
+from llm_backend import FakeLLMBackend
+from resume_model import Resume
+from testing_helpers import isolated_generator
+
+JOBS = [
+    ('backend', "Senior Backend Engineer\n1. Python\n2. PostgreSQL"),
+    ('data', "Data Scientist\n1. Machine learning\n2. SQL"),
+    ('frontend', "Frontend Developer\n1. React\n2. TypeScript"),
+]
+
+
+def test_reads_directory_and_jsonl(tmp_path):
+    (tmp_path / 'jobs').mkdir()
+    (tmp_path / 'jobs' / 'senior dev.txt').write_text('Senior developer')
+    (tmp_path / 'jobs' / 'notes.md').write_text('ignored')
+    (tmp_path / 'jobs.jsonl').write_text(
+        json.dumps({'id': 'a/1', 'job_description': 'Analyst'}) + '\n\n' + json.dumps({'job_description': 'Nurse'}) + '\n'
+    )
+
+    assert list(read_jobs(str(tmp_path / 'jobs'))) == [('senior_dev-996fa380', 'Senior developer')]
+    assert list(read_jobs(str(tmp_path / 'jobs.jsonl'))) == [('a_1-2cd25db4', 'Analyst'), ('line-3', 'Nurse')]
+
+
+def test_sanitized_job_ids_do_not_collide(tmp_path):
+    (tmp_path / 'jobs.jsonl').write_text(
+        '\n'.join(json.dumps({'id': job_id, 'job_description': 'Analyst'}) for job_id in ('a/b', 'a_b', 'a b')) + '\n'
+    )
+
+    job_ids = [job_id for job_id, _ in read_jobs(str(tmp_path / 'jobs.jsonl'))]
+
+    assert job_ids[1] == 'a_b' and len(set(job_ids)) == 3
+
+
+def test_writes_every_format(tmp_path):
+    summary = run_batch(JOBS, str(tmp_path), ['txt', 'json', 'pdf'], workers=2, pdf_processes=0,
+                        generator=isolated_generator())
+
+    assert summary['succeeded'] == 3 and not summary['failed']
+    job_dir = tmp_path / 'backend'
+    assert sorted(os.listdir(job_dir)) == sorted(
+        f"{name}.{ext}" for name in ('matching_resume', 'non_matching_resume') for ext in ('txt', 'json', 'pdf')
+    )
+    assert (job_dir / 'matching_resume.pdf').read_bytes().startswith(b'%PDF')
+    model = Resume.from_dict(json.loads((job_dir / 'matching_resume.json').read_text()))
+    assert model.to_text() == (job_dir / 'matching_resume.txt').read_text()
+
+
+def test_pdfs_render_in_worker_processes(tmp_path):
+    summary = run_batch(JOBS[:1], str(tmp_path), ['pdf'], pdf_processes=1, generator=isolated_generator())
+
+    assert summary['succeeded'] == 1
+    assert (tmp_path / 'backend' / 'non_matching_resume.pdf').read_bytes().startswith(b'%PDF')
+
+
+def test_resumes_from_checkpoint_and_retries_failures(tmp_path):
+    failing = run_batch(JOBS, str(tmp_path), generator=isolated_generator(backend=FakeLLMBackend(error_rate=1)))
+    assert failing['succeeded'] == 0 and set(failing['failed']) == {'backend', 'data', 'frontend'}
+
+    first = run_batch(JOBS[:2], str(tmp_path), generator=isolated_generator())
+    second = run_batch(JOBS, str(tmp_path), generator=isolated_generator())
+
+    assert first['succeeded'] == 2
+    assert second['skipped'] == 2 and second['succeeded'] == 1
+    statuses = [json.loads(line)['status'] for line in (tmp_path / CHECKPOINT_FILE).read_text().splitlines()]
+    assert statuses.count('done') == 3 and statuses.count('failed') == 3
+
+
+if __name__ == '__main__':
+    import pathlib
+    import tempfile
+    for test in (test_reads_directory_and_jsonl, test_sanitized_job_ids_do_not_collide, test_writes_every_format,
+                 test_pdfs_render_in_worker_processes, test_resumes_from_checkpoint_and_retries_failures):
+        with tempfile.TemporaryDirectory() as directory:
+            test(pathlib.Path(directory))
+    print("✅ Batch generation tests passed")
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test the benchmark runner's baseline comparison and a quick run of each suite (runs offline)
+"""
+
+import json
+
+from benchmarks import bench_pdf
+from benchmarks.runner import compare, load_baseline, run_suites, save_baseline
+
+
+def test_regressions_respect_metric_direction():
+    baseline = {'pdf.model.pages_per_second': 100.0, 'http.generate.p50_ms': 50.0, 'parse.x1.kb_per_second': 10.0}
+    current = {'pdf.model.pages_per_second': 70.0, 'http.generate.p50_ms': 40.0, 'parse.x1.kb_per_second': 14.0}
+
+    rows = {metric: regressed for metric, _, _, _, regressed in compare(baseline, current, threshold=0.2)}
+
+    assert rows == {'pdf.model.pages_per_second': True, 'http.generate.p50_ms': False, 'parse.x1.kb_per_second': False}
+    slower = compare({'http.generate.p50_ms': 50.0}, {'http.generate.p50_ms': 65.0}, threshold=0.2)
+    assert slower[0][4]
+
+
+def test_quick_run_saves_a_comparable_baseline(tmp_path):
+    path = tmp_path / 'baseline.json'
+
+    results = run_suites(['parse', 'pdf', 'generate', 'http'], quick=True)
+    save_baseline(str(path), results, quick=True)
+
+    assert json.loads(path.read_text())['quick'] is True
+    assert load_baseline(str(path))['metrics'] == results
+    assert {'generate.c12.resumes_per_second', 'http.export_pdf.p95_ms', 'pdf.text.pages_per_second'} <= results.keys()
+    assert all(value > 0 for value in results.values())
+
+
+def test_page_count_skips_page_tree():
+    assert bench_pdf.count_pages(b'<< /Type /Pages /Count 2 >> << /Type /Page >> << /Type/Page >>') == 2
+
+
+if __name__ == '__main__':
+    import pathlib
+    import tempfile
+    test_regressions_respect_metric_direction()
+    with tempfile.TemporaryDirectory() as directory:
+        test_quick_run_saves_a_comparable_baseline(pathlib.Path(directory))
+    test_page_count_skips_page_tree()
+    print("✅ Benchmark runner tests passed")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test concurrent section fan-out in ResumeGenerator (runs offline)
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from testing_helpers import isolated_generator
+
+CALL_LATENCY = 0.2
+
+JOB_ANALYSIS_JSON = '{"must_have": ["Python", "SQL"], "nice_to_have": ["AWS"], "job_title": "Engineer", "industry": "Technology", "responsibilities": []}'
+
+
+class SlowCompletions:
+    """Stand-in for client.chat.completions that sleeps like a network call"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    def create(self, model, messages, temperature, **kwargs):
+        system = messages[0]['content']
+        with self.lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if 'job description analyst' in system:
+                content = JOB_ANALYSIS_JSON
+            else:
+                time.sleep(CALL_LATENCY)
+                content = f"temperature={temperature}"
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class AsyncSlowCompletions(SlowCompletions):
+    """Async stand-in for async_client.chat.completions"""
+
+    async def create(self, model, messages, temperature, **kwargs):
+        with self.lock:
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if 'job description analyst' in messages[0]['content']:
+                content = JOB_ANALYSIS_JSON
+            else:
+                await asyncio.sleep(CALL_LATENCY)
+                content = f"temperature={temperature}"
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def test_concurrent_matches_sequential_order():
+    sequential = isolated_generator(completions=SlowCompletions(), max_concurrency=1)
+    concurrent = isolated_generator(completions=SlowCompletions(), max_concurrency=12)
+
+    seq_good, seq_bad = sequential.generate_resumes("Python engineer")
+    con_good, con_bad = concurrent.generate_resumes("Python engineer")
+
+    # Contact info is randomised, so compare everything after the header block
+    assert seq_good.split('PROFESSIONAL SUMMARY', 1)[1] == con_good.split('PROFESSIONAL SUMMARY', 1)[1]
+    assert seq_bad.split('PROFESSIONAL SUMMARY', 1)[1] == con_bad.split('PROFESSIONAL SUMMARY', 1)[1]
+
+    # Sections keep their original order: summary (0.7), skills (0.5), 3x experience (0.6), education (0.4)
+    body = con_good.split('PROFESSIONAL SUMMARY', 1)[1]
+    positions = [body.index(marker) for marker in ('temperature=0.7', 'temperature=0.5', 'temperature=0.6', 'temperature=0.4')]
+    assert positions == sorted(positions)
+
+
+def test_concurrency_limit_is_respected():
+    completions = SlowCompletions()
+    generator = isolated_generator(completions=completions, max_concurrency=3)
+    generator.generate_resumes("Python engineer")
+
+    assert completions.calls == 13
+    assert completions.max_in_flight <= 3
+
+
+def test_wall_clock_approaches_slowest_call():
+    generator = isolated_generator(completions=SlowCompletions(), max_concurrency=12)
+
+    start = time.perf_counter()
+    generator.generate_resumes("Python engineer")
+    elapsed = time.perf_counter() - start
+
+    # 12 section calls of CALL_LATENCY each would take ~2.4s sequentially
+    assert elapsed < CALL_LATENCY * 4
+
+
+def test_async_engine_matches_sync_output():
+    sync_generator = isolated_generator(completions=SlowCompletions(), max_concurrency=12)
+    async_generator = isolated_generator(completions=SlowCompletions(), max_concurrency=4)
+    completions = AsyncSlowCompletions()
+
+    async def run():
+        async_generator.backend._async_client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        return await async_generator.agenerate_resumes("Python engineer")
+
+    sync_good, _ = sync_generator.generate_resumes("Python engineer")
+    async_good, async_bad = asyncio.run(run())
+
+    assert sync_good.split('PROFESSIONAL SUMMARY', 1)[1] == async_good.split('PROFESSIONAL SUMMARY', 1)[1]
+    assert 'PROFESSIONAL EXPERIENCE' in async_bad
+    assert completions.calls == 13
+    assert completions.max_in_flight <= 4
+
+
+if __name__ == '__main__':
+    test_concurrent_matches_sequential_order()
+    test_concurrency_limit_is_respected()
+    test_wall_clock_approaches_slowest_call()
+    test_async_engine_matches_sync_output()
+    print("✅ Concurrent generation tests passed")
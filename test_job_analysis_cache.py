@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test the content-addressed job analysis cache (runs offline)
+"""
+
+import time
+from types import SimpleNamespace
+
+from cache import TTLCache
+from testing_helpers import isolated_generator
+
+
+class CountingCompletions:
+    def __init__(self):
+        self.calls = 0
+
+    def create(self, **request):
+        self.calls += 1
+        content = f'{{"must_have": ["Python {self.calls}"], "nice_to_have": [], "job_title": "Engineer", "industry": "Tech", "responsibilities": []}}'
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def test_repeat_submissions_skip_parse_call():
+    cache = TTLCache()
+    completions = CountingCompletions()
+    generator = isolated_generator(completions=completions, analysis_cache=cache)
+
+    first = generator.parse_job_description("Senior Python Engineer\n\n  Must know SQL")
+    second = generator.parse_job_description("senior python engineer must know   SQL ")
+
+    assert completions.calls == 1
+    assert first == second
+    assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+
+def test_cached_analysis_is_not_shared_mutable_state():
+    generator = isolated_generator(completions=CountingCompletions())
+
+    first = generator.parse_job_description("Python Engineer")
+    first['must_have'].append('mutated')
+
+    assert 'mutated' not in generator.parse_job_description("Python Engineer")['must_have']
+
+
+def test_failed_parse_is_not_cached():
+    cache = TTLCache()
+    generator = isolated_generator(completions=CountingCompletions(), analysis_cache=cache)
+    generator.backend.client.chat.completions.create = lambda **request: SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="not json"))])
+
+    assert generator.parse_job_description("Python Engineer")['job_title'] == 'Unknown'
+    assert len(cache) == 0
+
+
+def test_lru_eviction_and_ttl():
+    cache = TTLCache(maxsize=2, ttl=0.05)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.stats()['evictions'] == 1
+
+    time.sleep(0.06)
+    assert cache.get('a') is None
+
+
+if __name__ == '__main__':
+    test_repeat_submissions_skip_parse_call()
+    test_cached_analysis_is_not_shared_mutable_state()
+    test_failed_parse_is_not_cached()
+    test_lru_eviction_and_ttl()
+    print("✅ Job analysis cache tests passed")
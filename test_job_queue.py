@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Test the SQLite job queue and the /jobs endpoints on the fake LLM backend (runs offline)
+"""
+
+import time
+from unittest.mock import patch
+
+import app as web_app
+import job_queue
+from job_queue import JobQueue
+from llm_backend import FakeLLMBackend
+from testing_helpers import isolated_generator
+
+JOB_DESCRIPTION = "Senior Backend Engineer\n1. Python\n2. PostgreSQL"
+
+
+def wait_for(queue, job_id, statuses=('done', 'failed'), timeout=10):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = queue.status(job_id)
+        if status['status'] in statuses:
+            return status
+        time.sleep(0.02)
+    raise AssertionError(f"job {job_id} still {status['status']}")
+
+
+def test_workers_generate_and_render_jobs(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.sqlite3'), generator=isolated_generator())
+    detailed = queue.enqueue(JOB_DESCRIPTION)
+    fast = queue.enqueue(JOB_DESCRIPTION, mode='fast', render_pdf=False)
+    assert queue.status(fast)['queue_position'] == 1
+
+    queue.start_workers(2)
+    try:
+        status = wait_for(queue, detailed)
+        fast_status = wait_for(queue, fast)
+    finally:
+        queue.stop()
+
+    assert status['status'] == 'done' and status['has_pdf']
+    assert status['progress'] == {'completed': 15, 'total': 15}
+    assert queue.pdf(detailed, 'good').startswith(b'%PDF')
+    good, _ = queue.resumes(detailed)
+    assert len(good.experience) == 3
+    assert fast_status['progress'] == {'completed': 2, 'total': 2} and not fast_status['has_pdf']
+
+
+def test_failed_job_is_retried_then_reported(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.sqlite3'), generator=isolated_generator(backend=FakeLLMBackend(error_rate=1)))
+    job_id = queue.enqueue(JOB_DESCRIPTION)
+
+    queue.run_job(queue.claim())
+    assert queue.status(job_id)['status'] == 'queued'
+    queue.run_job(queue.claim())
+
+    status = queue.status(job_id)
+    assert status['status'] == 'failed'
+    assert status['error'].startswith('FakeBackendError')
+    assert queue.claim() is None
+
+
+def test_stale_running_job_is_reclaimed(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.sqlite3'), generator=isolated_generator())
+    job_id = queue.enqueue(JOB_DESCRIPTION)
+    queue.claim()
+    assert queue.claim() is None
+
+    # A worker that died mid-job stops updating its row
+    queue._connection().execute("UPDATE jobs SET updated_at = ? WHERE id = ?",
+                                (time.time() - job_queue.STALE_AFTER - 1, job_id))
+
+    assert queue.claim()['id'] == job_id
+
+
+def test_stale_job_out_of_attempts_is_failed(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.sqlite3'), generator=isolated_generator())
+    job_id = queue.enqueue(JOB_DESCRIPTION)
+    queue.claim()
+    queue._connection().execute("UPDATE jobs SET attempts = ?, updated_at = ? WHERE id = ?",
+                                (queue.max_attempts, time.time() - job_queue.STALE_AFTER - 1, job_id))
+
+    assert queue.claim() is None
+    status = queue.status(job_id)
+    assert status['status'] == 'failed' and status['error'] == 'Worker stopped responding'
+
+
+def test_retried_job_that_succeeds_clears_its_error(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.sqlite3'), generator=isolated_generator())
+    job_id = queue.enqueue(JOB_DESCRIPTION, render_pdf=False)
+    queue._update(job_id, error='FakeBackendError: Injected failure for parse call')
+
+    queue.run_job(queue.claim())
+
+    status = queue.status(job_id)
+    assert status['status'] == 'done' and 'error' not in status
+
+
+def test_idle_workers_purge_at_most_once_per_interval(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.sqlite3'), generator=isolated_generator())
+
+    with patch.object(queue, 'purge_expired', return_value=0) as purge:
+        for _ in range(3):
+            queue.purge_if_due()
+        assert purge.call_count == 1
+
+        with patch.object(job_queue, 'PURGE_INTERVAL', 0):
+            queue.purge_if_due()
+        assert purge.call_count == 2
+
+
+def test_jobs_endpoints(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.sqlite3'), generator=isolated_generator())
+    client = web_app.app.test_client()
+
+    with patch.object(web_app, 'get_job_queue', return_value=queue), \
+            patch.object(web_app, 'backend_configured', return_value=True):
+        created = client.post('/jobs', json={'job_description': JOB_DESCRIPTION})
+        job_id = created.get_json()['job_id']
+        pending = client.get(f'/jobs/{job_id}').get_json()
+
+        queue.run_job(queue.claim())
+        done = client.get(f'/jobs/{job_id}').get_json()
+        pdf = client.get(done['pdf_urls']['bad'])
+        missing = client.get('/jobs/unknown')
+        rejected = client.post('/jobs', json={'job_description': JOB_DESCRIPTION, 'mode': 'turbo'})
+
+    assert created.status_code == 202
+    assert pending['status'] == 'queued'
+    assert done['status'] == 'done' and 'PROFESSIONAL EXPERIENCE' in done['result']['good_resume']
+    assert web_app.load_resume(done['result']['good_resume_id']).to_text() == done['result']['good_resume']
+    assert pdf.mimetype == 'application/pdf' and pdf.data.startswith(b'%PDF')
+    assert missing.status_code == 404 and rejected.status_code == 400
+
+
+
+def test_job_purged_while_polled_is_not_found(tmp_path):
+    queue = JobQueue(str(tmp_path / 'jobs.sqlite3'), generator=isolated_generator())
+    job_id = queue.enqueue(JOB_DESCRIPTION)
+    queue.run_job(queue.claim())
+    client = web_app.app.test_client()
+
+    with patch.object(web_app, 'get_job_queue', return_value=queue), \
+            patch.object(queue, 'resumes', return_value=None):
+        response = client.get(f'/jobs/{job_id}')
+
+    assert response.status_code == 404
+
+
+if __name__ == '__main__':
+    import pathlib
+    import tempfile
+    for test in (test_workers_generate_and_render_jobs, test_failed_job_is_retried_then_reported,
+                 test_stale_running_job_is_reclaimed, test_stale_job_out_of_attempts_is_failed,
+                 test_retried_job_that_succeeds_clears_its_error, test_idle_workers_purge_at_most_once_per_interval,
+                 test_jobs_endpoints, test_job_purged_while_polled_is_not_found):
+        with tempfile.TemporaryDirectory() as directory:
+            test(pathlib.Path(directory))
+    print("✅ Job queue tests passed")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Test the pluggable LLM backends and the deterministic fake (runs offline)
+"""
+
+import asyncio
+import random
+import time
+from unittest.mock import patch
+
+import pytest
+
+import app as web_app
+import llm_backend
+from cache import TTLCache
+from llm_backend import FakeBackendError, FakeLLMBackend, parse_latency
+from pdf_generator import PDFResumeGenerator
+from requirement_analyzer import RequirementAnalyzer
+from resume_generator import ResumeGenerator
+from testing_helpers import isolated_generator
+
+JOB_DESCRIPTION = """Senior Backend Engineer
+NON-NEGOTIABLES:
+1. 5+ years of Python
+2. PostgreSQL
+3. Kubernetes
+"""
+
+
+def test_fake_backend_is_deterministic():
+    request = {'model': 'gpt-4o-mini', 'messages': [{'role': 'user', 'content': 'Create a summary'}]}
+
+    first = [FakeLLMBackend(seed=7).complete(request, 'summary').content for _ in range(2)]
+    backend = FakeLLMBackend(seed=7)
+    repeated = [backend.complete(request, 'summary').content for _ in range(2)]
+
+    assert first[0] == first[1] == repeated[0]
+    # Resending the same request (a retry) gets a fresh draw
+    assert repeated[0] != repeated[1]
+
+
+def test_attempt_counts_are_bounded():
+    backend = FakeLLMBackend(max_keys=2)
+    requests = [{'model': 'gpt-4o-mini', 'messages': [{'role': 'user', 'content': f"Prompt {i}"}]} for i in range(5)]
+
+    for request in requests:
+        backend.complete(request, 'summary')
+    backend.complete(requests[-1], 'summary')
+
+    assert len(backend._attempts) == 2
+    assert list(backend._attempts.values()) == [1, 2]
+
+
+def test_full_generation_runs_through_fake():
+    good, bad = isolated_generator().generate_resumes(JOB_DESCRIPTION)
+
+    parsed = PDFResumeGenerator()._parse_resume_text(good)
+    assert len(parsed['experience']) == 3
+    assert 'Kubernetes' in good
+    assert good != bad
+
+
+@pytest.mark.parametrize('structured_output', [True, False])
+def test_fake_answers_match_section_shapes(structured_output):
+    good, _ = asyncio.run(isolated_generator(structured_output=structured_output).agenerate_resume_models(JOB_DESCRIPTION))
+
+    assert [entry.title for entry in good.experience] == [
+        'Senior Software Engineer', 'Software Engineer', 'Junior Developer'
+    ]
+    assert good.skills.groups and good.education.entries
+
+
+def test_fast_mode_runs_through_fake():
+    good, _ = isolated_generator().generate_resume_models(JOB_DESCRIPTION, mode='fast')
+
+    assert len(good.experience) == 3
+
+
+def test_requirement_verdicts_follow_resume_text():
+    analyzer = RequirementAnalyzer(backend=FakeLLMBackend(), verdict_cache=TTLCache())
+
+    results = asyncio.run(analyzer.analyze_batch(['PostgreSQL', 'COBOL mainframes'], 'Built APIs on PostgreSQL'))
+
+    assert [result['meets_requirement'] for result in results] == [True, False]
+
+
+def test_injected_errors_and_latency():
+    request = {'model': 'gpt-4o-mini', 'messages': [{'role': 'user', 'content': 'Create a summary'}]}
+
+    with pytest.raises(FakeBackendError):
+        FakeLLMBackend(error_rate=1).complete(request, 'summary')
+
+    start = time.perf_counter()
+    asyncio.run(FakeLLMBackend(latency='fixed:0.05').acomplete(request, 'summary'))
+    assert time.perf_counter() - start >= 0.05
+
+
+def test_latency_specs():
+    rng = random.Random(0)
+
+    assert parse_latency('0.3')(rng) == 0.3
+    assert 0.2 <= parse_latency('uniform:0.2:0.4')(rng) <= 0.4
+    assert parse_latency('lognormal:1:0.5')(rng) > 0
+    with pytest.raises(ValueError):
+        parse_latency('gamma:1')
+
+
+def test_generate_endpoint_needs_no_key_with_fake_backend(monkeypatch):
+    monkeypatch.delenv('OPENAI_API_KEY', raising=False)
+    monkeypatch.setenv('RESUME_LLM_BACKEND', 'fake')
+    client = web_app.app.test_client()
+
+    with patch.object(llm_backend, '_shared_backend', None):
+        generator = ResumeGenerator(analysis_cache=TTLCache())
+        with patch.object(web_app, 'get_shared_generator', return_value=generator):
+            response = client.post('/generate', json={'job_description': JOB_DESCRIPTION})
+
+    assert isinstance(generator.backend, FakeLLMBackend)
+    assert response.status_code == 200
+    assert len(web_app.load_resume(response.get_json()['good_resume_id']).experience) == 3
+
+
+if __name__ == '__main__':
+    test_fake_backend_is_deterministic()
+    test_attempt_counts_are_bounded()
+    test_full_generation_runs_through_fake()
+    test_fake_answers_match_section_shapes(True)
+    test_fake_answers_match_section_shapes(False)
+    test_fast_mode_runs_through_fake()
+    test_requirement_verdicts_follow_resume_text()
+    test_injected_errors_and_latency()
+    test_latency_specs()
+    print("✅ LLM backend tests passed")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test LLM call instrumentation and the /metrics endpoint (runs offline)
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from prometheus_client import REGISTRY
+
+import app as web_app
+from cache import TTLCache
+from metrics import observe_llm_call
+from requirement_analyzer import RequirementAnalyzer
+from test_concurrent_generation import SlowCompletions
+from testing_helpers import isolated_generator
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+class UsageCompletions:
+    """Async completions that report token usage like the OpenAI API"""
+
+    async def create(self, model, messages, **kwargs):
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content='{"meets_requirement": true}'))],
+            usage=SimpleNamespace(prompt_tokens=120, completion_tokens=15)
+        )
+
+
+def test_generation_records_every_section():
+    generator = isolated_generator(completions=SlowCompletions(), max_concurrency=12)
+    before = {section: sample('llm_calls_total', model='gpt-4o-mini', section=section, outcome='success')
+              for section in ('parse', 'summary', 'skills', 'experience', 'education')}
+
+    generator.generate_resumes("Python engineer")
+
+    after = {section: sample('llm_calls_total', model='gpt-4o-mini', section=section, outcome='success')
+             for section in before}
+    assert {section: after[section] - before[section] for section in before} == {
+        'parse': 1, 'summary': 2, 'skills': 2, 'experience': 6, 'education': 2
+    }
+
+
+def test_tokens_and_latency_are_recorded():
+    analyzer = RequirementAnalyzer(async_client=SimpleNamespace(chat=SimpleNamespace(completions=UsageCompletions())),
+                                   verdict_cache=TTLCache(), prescreen=False)
+    labels = {'model': 'gpt-3.5-turbo', 'section': 'requirement'}
+    tokens_before = sample('llm_tokens_total', kind='prompt', **labels)
+    count_before = sample('llm_call_duration_seconds_count', outcome='success', **labels)
+
+    asyncio.run(analyzer.analyze('Python', 'Python developer'))
+
+    assert sample('llm_tokens_total', kind='prompt', **labels) - tokens_before == 120
+    assert sample('llm_call_duration_seconds_count', outcome='success', **labels) - count_before == 1
+
+
+def test_failed_calls_are_counted_as_errors():
+    labels = {'model': 'gpt-4o-mini', 'section': 'summary', 'outcome': 'error'}
+    before = sample('llm_calls_total', **labels)
+
+    with pytest.raises(TimeoutError):
+        with observe_llm_call('gpt-4o-mini', 'summary'):
+            raise TimeoutError()
+
+    assert sample('llm_calls_total', **labels) - before == 1
+
+
+def test_metrics_endpoint_exposes_request_counts():
+    client = web_app.app.test_client()
+    client.post('/export/pdf', json={})
+
+    response = client.get('/metrics')
+
+    body = response.get_data(as_text=True)
+    assert response.status_code == 200
+    assert 'http_requests_total{endpoint="/export/pdf",method="POST",status="400"}' in body
+    assert 'llm_call_duration_seconds_bucket' in body
+
+
+if __name__ == '__main__':
+    test_generation_records_every_section()
+    test_tokens_and_latency_are_recorded()
+    test_failed_calls_are_counted_as_errors()
+    test_metrics_endpoint_exposes_request_counts()
+    print("✅ Metrics tests passed")
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test PDF export from already-generated resume text (runs offline)
+"""
+
+import base64
+import io
+import os
+import zipfile
+from unittest.mock import patch
+
+import app as web_app
+from test_resume_model import sample_resume
+
+SAMPLE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_sample(name):
+    with open(os.path.join(SAMPLE_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_export_renders_posted_text_without_llm_calls():
+    client = web_app.app.test_client()
+
+    with patch.object(web_app, 'get_shared_generator', side_effect=AssertionError('must not regenerate')):
+        response = client.post('/export/pdf', json={
+            'good_resume': load_sample('detailed_tech_resume.txt'),
+            'bad_resume': load_sample('detailed_marketing_resume.txt')
+        })
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert base64.b64decode(data['good_pdf']).startswith(b'%PDF')
+    assert base64.b64decode(data['bad_pdf']).startswith(b'%PDF')
+
+
+def test_export_accepts_result_store_ids():
+    client = web_app.app.test_client()
+    good_id = web_app.store_resume(sample_resume())
+    bad_id = web_app.store_resume(sample_resume())
+
+    # Stored resumes are models, so rendering them never goes back through the text parser
+    with patch.object(web_app.pdf_generator, '_parse_resume_text', side_effect=AssertionError('must not parse')):
+        response = client.post('/export/pdf', json={'good_resume_id': good_id, 'bad_resume_id': bad_id})
+
+    assert response.status_code == 200
+    assert base64.b64decode(response.get_json()['good_pdf']).startswith(b'%PDF')
+
+
+def test_export_escapes_markup_in_resume_text():
+    client = web_app.app.test_client()
+    resume = load_sample('detailed_tech_resume.txt').replace('Python', 'a < b & c <font color="red">Python</font>', 1)
+    resume += '\n<img src="/etc/passwd"/> & <b>unclosed'
+
+    response = client.post('/export/pdf', json={'good_resume': resume, 'bad_resume': resume})
+
+    assert response.status_code == 200
+    assert base64.b64decode(response.get_json()['good_pdf']).startswith(b'%PDF')
+
+
+def test_model_fields_are_escaped():
+    resume = sample_resume()
+    resume.summary.text = 'a < b & c'
+    resume.experience[0].bullets.append('<img src="/etc/passwd"/>')
+
+    assert web_app.pdf_generator.render_pdf_bytes(resume).startswith(b'%PDF')
+
+
+def test_export_reports_expired_ids():
+    client = web_app.app.test_client()
+
+    response = client.post('/export/pdf', json={'good_resume_id': 'gone', 'bad_resume_id': 'gone'})
+
+    assert response.status_code == 404
+    assert response.get_json()['expired'] is True
+
+
+def test_download_streams_single_pdf_bytes():
+    client = web_app.app.test_client()
+
+    response = client.post('/export/pdf/download', json={
+        'which': 'good',
+        'good_resume': load_sample('detailed_tech_resume.txt')
+    })
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/pdf'
+    assert 'strong_candidate_example.pdf' in response.headers['Content-Disposition']
+    assert response.data.startswith(b'%PDF')
+
+
+def test_download_both_as_zip():
+    client = web_app.app.test_client()
+
+    response = client.post('/export/pdf/download', json={
+        'good_resume': load_sample('detailed_tech_resume.txt'),
+        'bad_resume': load_sample('detailed_marketing_resume.txt')
+    })
+
+    assert response.mimetype == 'application/zip'
+    with zipfile.ZipFile(io.BytesIO(response.data)) as archive:
+        assert sorted(archive.namelist()) == ['strong_candidate_example.pdf', 'weak_candidate_example.pdf']
+        assert archive.read('weak_candidate_example.pdf').startswith(b'%PDF')
+
+
+def test_export_requires_resume_text():
+    client = web_app.app.test_client()
+
+    response = client.post('/export/pdf', json={'good_resume': 'only one'})
+
+    assert response.status_code == 400
+
+
+if __name__ == '__main__':
+    test_export_renders_posted_text_without_llm_calls()
+    test_export_accepts_result_store_ids()
+    test_export_escapes_markup_in_resume_text()
+    test_model_fields_are_escaped()
+    test_export_reports_expired_ids()
+    test_download_streams_single_pdf_bytes()
+    test_download_both_as_zip()
+    test_export_requires_resume_text()
+    print("✅ PDF export tests passed")
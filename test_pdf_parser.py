@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Test resume text parsing used for PDF rendering (runs offline)
+"""
+
+import os
+
+from pdf_generator import PDFResumeGenerator
+
+SAMPLE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_sample(name):
+    with open(os.path.join(SAMPLE_DIR, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_parses_sample_sections():
+    parsed = PDFResumeGenerator()._parse_resume_text(load_sample('detailed_tech_resume.txt'))
+
+    assert parsed['name'] == 'Michael Chen'
+    assert parsed['contact'].startswith('michael.chen@gmail.com | (555) 234-5678')
+    assert len(parsed['experience']) == 3
+    assert all(job['bullets'] for job in parsed['experience'])
+    assert parsed['experience'][0]['dates'] == 'January 2020 - Present'
+    assert parsed['summary'].endswith(' ')
+    assert 'Python' in parsed['skills']
+    assert 'University of Washington' in parsed['education']
+
+
+def test_long_resume_scales_linearly_in_content():
+    resume = load_sample('detailed_tech_resume.txt')
+    header, separator, body = resume.partition('💼 PROFESSIONAL SUMMARY')
+
+    single = PDFResumeGenerator()._parse_resume_text(resume)
+    repeated = PDFResumeGenerator()._parse_resume_text(header + separator + body * 20)
+
+    assert len(repeated['experience']) == 20 * len(single['experience'])
+    assert repeated['skills'] == single['skills'] * 20
+
+
+if __name__ == '__main__':
+    test_parses_sample_sections()
+    test_long_resume_scales_linearly_in_content()
+    print("✅ PDF parser tests passed")
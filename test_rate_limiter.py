@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test the outbound LLM rate limiter: token buckets, AIMD concurrency and queue depth (runs offline)
+"""
+
+import asyncio
+import threading
+
+import pytest
+from prometheus_client import REGISTRY
+
+from cache import TTLCache
+from llm_backend import FakeLLMBackend
+from rate_limiter import AIMDLimit, RateLimiter
+from requirement_analyzer import RequirementAnalyzer
+from testing_helpers import isolated_generator
+
+REQUEST = {'model': 'gpt-4o-mini', 'messages': [{'role': 'user', 'content': 'x' * 400}]}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+class TrackingBackend(FakeLLMBackend):
+    """Fake backend that records the most calls it ever had in flight"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def complete(self, request, section):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            return super().complete(request, section)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+class RateLimitedBackend(FakeLLMBackend):
+
+    async def acomplete(self, request, section):
+        raise RateLimitError("Rate limit reached for requests")
+
+
+def test_request_budget_refills_over_time():
+    clock = FakeClock()
+    limiter = RateLimiter(requests_per_minute=60, clock=clock)
+
+    for _ in range(60):
+        assert limiter._try_admit(0) == 0
+        limiter.in_flight -= 1
+    assert limiter._try_admit(0) == pytest.approx(1.0)
+
+    clock.now += 1
+    assert limiter._try_admit(0) == 0
+
+
+def test_token_reservation_is_settled_with_real_usage():
+    clock = FakeClock()
+    limiter = RateLimiter(tokens_per_minute=6000, completion_estimate=100, clock=clock)
+    assert limiter.estimate_tokens(REQUEST) == 200
+
+    with limiter.acquire(REQUEST, 'summary') as permit:
+        permit.record_usage(FakeLLMBackend().complete(REQUEST, 'summary'))
+        assert limiter.tokens.level == 5800
+
+    # The fake reports ~100 prompt tokens and a short completion, so part of the reservation comes back
+    assert 5800 < limiter.tokens.level < 6000
+
+
+def test_aimd_backs_off_once_per_cooldown_and_recovers():
+    limit = AIMDLimit(16, minimum=2, cooldown=2.0)
+
+    limit.on_rate_limited(now=0)
+    limit.on_rate_limited(now=1)
+    assert limit.limit == 8
+    limit.on_rate_limited(now=3)
+    assert limit.limit == 4
+
+    for _ in range(8):
+        limit.on_success('summary', 1.0, now=4)
+    assert 5 < limit.limit < 6
+
+
+def test_latency_spike_backs_off():
+    limit = AIMDLimit(16)
+    for _ in range(5):
+        limit.on_success('experience', 2.0, now=0)
+
+    limit.on_success('experience', 9.0, now=10)
+
+    assert limit.limit == 8
+    # A slow section compared against a fast section's baseline is not a spike
+    limit.on_success('summary', 9.0, now=20)
+    assert limit.limit > 8
+
+
+def test_concurrency_limit_bounds_calls_in_flight():
+    backend = TrackingBackend(latency='fixed:0.02')
+    limiter = RateLimiter(max_concurrency=3)
+    generator = isolated_generator(max_concurrency=12, backend=backend, limiter=limiter)
+
+    generator.generate_resumes("Python engineer")
+
+    assert backend.peak == 3
+    assert limiter.stats()['in_flight'] == 0 and limiter.stats()['waiting'] == 0
+
+
+def test_async_rate_limit_errors_shrink_the_limit():
+    limiter = RateLimiter(max_concurrency=16)
+    analyzer = RequirementAnalyzer(backend=RateLimitedBackend(), limiter=limiter, verdict_cache=TTLCache(),
+                                   prescreen=False)
+    depth_before = REGISTRY.get_sample_value('llm_limiter_queue_depth')
+
+    with pytest.raises(RateLimitError):
+        asyncio.run(analyzer.analyze('Python', 'Python developer'))
+
+    assert limiter.concurrency.limit == 8
+    assert limiter.in_flight == 0
+    assert REGISTRY.get_sample_value('llm_limiter_queue_depth') == depth_before
+    assert REGISTRY.get_sample_value('llm_limiter_backoffs_total', {'reason': 'rate_limited'}) >= 1
+
+
+if __name__ == '__main__':
+    test_request_budget_refills_over_time()
+    test_token_reservation_is_settled_with_real_usage()
+    test_aimd_backs_off_once_per_cooldown_and_recovers()
+    test_latency_spike_backs_off()
+    test_concurrency_limit_bounds_calls_in_flight()
+    test_async_rate_limit_errors_shrink_the_limit()
+    print("✅ Rate limiter tests passed")
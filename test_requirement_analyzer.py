@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test batch requirement analysis (runs offline)
+"""
+
+import asyncio
+import json
+
+from cache import TTLCache
+from requirement_analyzer import RequirementAnalyzer
+
+RESUME = "Senior engineer with 8 years of Python and SQL. Bachelor's degree in Computer Science."
+
+
+class ScriptedAnalyzer(RequirementAnalyzer):
+    """Answers batch prompts with a canned verdict per requirement, optionally dropping some"""
+
+    def __init__(self, drop=(), **kwargs):
+        kwargs.setdefault('verdict_cache', TTLCache())
+        kwargs.setdefault('prescreen', False)
+        super().__init__(**kwargs)
+        self.drop = set(drop)
+        self.requests = []
+
+    async def _complete(self, request, section):
+        self.requests.append(request)
+        prompt = request['messages'][0]['content']
+
+        if 'response_format' not in request:
+            requirement = prompt.split('Requirement: ', 1)[1].split('\n', 1)[0]
+            return json.dumps({'meets_requirement': True, 'explanation': f'single {requirement}', 'evidence': ''})
+
+        block = prompt.split('Requirements:\n', 1)[1].split('\n\nResume:', 1)[0]
+        results = []
+        for line in block.splitlines():
+            index, requirement = line.split('. ', 1)
+            if requirement in self.drop:
+                continue
+            results.append({'index': int(index), 'meets_requirement': requirement.lower() in RESUME.lower(),
+                            'explanation': f'batch {requirement}', 'evidence': requirement})
+        return json.dumps({'results': results})
+
+
+def test_batch_uses_one_call_and_keeps_order():
+    analyzer = ScriptedAnalyzer()
+    requirements = ['Python', 'SQL', 'Kubernetes']
+
+    results = asyncio.run(analyzer.analyze_batch(requirements, RESUME))
+
+    assert len(analyzer.requests) == 1
+    assert [r['requirement'] for r in results] == requirements
+    assert [r['meets_requirement'] for r in results] == [True, True, False]
+
+
+def test_batch_falls_back_for_missing_entries():
+    analyzer = ScriptedAnalyzer(drop={'SQL'})
+
+    results = asyncio.run(analyzer.analyze_batch(['Python', 'SQL'], RESUME))
+
+    assert len(analyzer.requests) == 2
+    assert results[1]['explanation'] == 'single SQL'
+
+
+def test_large_batches_are_chunked():
+    analyzer = ScriptedAnalyzer(max_requirements_per_call=2)
+    requirements = ['Python', 'SQL', 'Go', 'Rust', 'Java']
+
+    results = asyncio.run(analyzer.analyze_batch(requirements, RESUME))
+
+    assert len(analyzer.requests) == 3
+    assert [r['requirement'] for r in results] == requirements
+
+
+def test_non_boolean_verdicts_fall_back_to_single_calls():
+    analyzer = ScriptedAnalyzer()
+    response = json.dumps({'results': [
+        {'index': 0, 'meets_requirement': 'false', 'explanation': 'stringly', 'evidence': ''},
+        {'index': 1, 'meets_requirement': False, 'explanation': 'real', 'evidence': ''},
+    ]})
+
+    verdicts = analyzer._parse_batch(response, 2)
+
+    assert list(verdicts) == [1] and verdicts[1]['meets_requirement'] is False
+
+
+class MalformedSingleAnalyzer(ScriptedAnalyzer):
+    """Batch answers drop every requirement; single answers are the given raw text"""
+
+    def __init__(self, single_answer, **kwargs):
+        super().__init__(**kwargs)
+        self.single_answer = single_answer
+
+    async def _complete(self, request, section):
+        self.requests.append(request)
+        return json.dumps({'results': []}) if 'response_format' in request else self.single_answer
+
+
+def test_malformed_single_answers_are_booleans_and_not_cached():
+    stringly = MalformedSingleAnalyzer('{"meets_requirement": "false", "explanation": "no", "evidence": ""}')
+    assert asyncio.run(stringly.analyze('Python', RESUME))['meets_requirement'] is False
+    asyncio.run(stringly.analyze('Python', RESUME))
+    assert len(stringly.requests) == 2
+
+    # Braces around something that isn't JSON must not fail the whole batch
+    garbled = MalformedSingleAnalyzer('Sure! {meets_requirement: true, because the resume lists it}')
+    results = asyncio.run(garbled.analyze_batch(['Python', 'SQL'], RESUME))
+    assert [r['meets_requirement'] for r in results] == [True, True]
+    asyncio.run(garbled.analyze_batch(['Python'], RESUME))
+    assert len(garbled.requests) == 5
+
+
+def test_verdicts_are_cached_per_resume_and_requirement():
+    analyzer = ScriptedAnalyzer()
+    asyncio.run(analyzer.analyze_batch(['Python', 'SQL'], RESUME))
+
+    # The evidence modal asks for one of the same requirements again, spelled slightly differently
+    verdict = asyncio.run(analyzer.analyze('  python ', RESUME))
+    assert len(analyzer.requests) == 1
+    assert verdict['explanation'] == 'batch Python'
+
+    # Only the new requirement is sent; a different resume is a different key
+    results = asyncio.run(analyzer.analyze_batch(['SQL', 'Kubernetes', 'SQL'], RESUME))
+    assert len(analyzer.requests) == 2
+    assert 'Kubernetes' in analyzer.requests[1]['messages'][0]['content']
+    assert 'SQL' not in analyzer.requests[1]['messages'][0]['content'].split('Requirements:')[1].split('Resume:')[0]
+    assert [r['requirement'] for r in results] == ['SQL', 'Kubernetes', 'SQL']
+
+    asyncio.run(analyzer.analyze('Python', RESUME + ' Also Go.'))
+    assert len(analyzer.requests) == 3
+
+
+def test_verdict_cache_is_bounded():
+    analyzer = ScriptedAnalyzer(verdict_cache=TTLCache(maxsize=2))
+
+    asyncio.run(analyzer.analyze_batch(['Python', 'SQL', 'Go'], RESUME))
+    asyncio.run(analyzer.analyze('Python', RESUME))
+
+    assert len(analyzer.requests) == 2
+    assert analyzer.verdict_cache.stats()['evictions'] == 2
+
+
+if __name__ == '__main__':
+    test_batch_uses_one_call_and_keeps_order()
+    test_batch_falls_back_for_missing_entries()
+    test_large_batches_are_chunked()
+    test_non_boolean_verdicts_fall_back_to_single_calls()
+    test_malformed_single_answers_are_booleans_and_not_cached()
+    test_verdicts_are_cached_per_resume_and_requirement()
+    test_verdict_cache_is_bounded()
+    print("✅ Requirement analyzer tests passed")
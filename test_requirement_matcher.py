@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Test the local lexical pre-screen for requirement matching (runs offline)
+"""
+
+import asyncio
+
+from cache import TTLCache
+from requirement_analyzer import RequirementAnalyzer
+from requirement_matcher import RequirementMatcher, stem
+from test_requirement_analyzer import ScriptedAnalyzer
+
+RESUME = """Jane Doe
+Senior engineer with 8 years of Python and SQL.
+• Built CI/CD pipelines on GitHub Actions and deployed services to Amazon Web Services
+• Tuned PostgreSQL databases and mentored developers
+Bachelor’s degree in Computer Science"""
+
+
+def verdict(requirement, matcher=None):
+    return (matcher or RequirementMatcher()).match(requirement, RESUME)
+
+
+def test_keywords_aliases_and_implied_terms_are_met():
+    for requirement in ['Git', 'SQL databases', "Bachelor's degree", 'Python', 'AWS', 'Cloud platforms', 'CI/CD']:
+        result = verdict(requirement)
+        assert result['meets_requirement'], requirement
+        assert result['source'] == 'lexical'
+
+
+def test_evidence_spans_point_into_the_resume():
+    result = verdict('Git')
+
+    assert result['evidence'] == 'Built CI/CD pipelines on GitHub Actions and deployed services to Amazon Web Services'
+    assert [RESUME[start:end] for start, end in result['evidence_spans']] == ['GitHub']
+
+    assert [RESUME[start:end] for start, end in verdict('Amazon Web Services')['evidence_spans']] == ['Amazon Web Services']
+
+
+def test_missing_terms_are_left_to_the_model():
+    # A resume can show a skill without naming it, so the matcher never answers "not met"
+    for requirement in ['Kubernetes', 'React', "Master's degree", 'Experience with Docker']:
+        assert verdict(requirement) is None, requirement
+
+
+def test_words_joined_by_slashes_and_hyphens_count_separately():
+    resume = "Built Python/Django services and React/Redux dashboards.\nShipped Python-based, MySQL-backed APIs."
+    for requirement in ['Python', 'Django', 'Redux', 'React', 'MySQL', 'SQL', 'Python/Django', 'Django and React']:
+        result = RequirementMatcher().match(requirement, resume)
+        assert result and result['meets_requirement'], requirement
+
+    spans = RequirementMatcher().match('Redux', resume)['evidence_spans']
+    assert [resume[start:end] for start, end in spans] == ['Redux']
+
+
+def test_ambiguous_short_terms_are_left_to_the_model():
+    resume = "Led R&D for our go to market launch.\nReplaced a failed cluster node with AI-assisted tooling."
+    for requirement in ['R', 'Go', 'Golang', 'Node', 'Node.js', 'AI', 'SEM', 'Python and R']:
+        assert RequirementMatcher().match(requirement, resume) is None, requirement
+
+
+def test_judgement_calls_are_left_to_the_model():
+    for requirement in ['5+ years of Python', 'Senior-level SQL', 'Team leadership', 'Strong communication skills',
+                        'Python, Go, Rust and Kubernetes', 'Python and Kubernetes in production']:
+        assert verdict(requirement) is None, requirement
+
+
+def test_negated_or_hedged_mentions_are_left_to_the_model():
+    # Wording the non-matching resume prompts ask for
+    cases = {
+        "Never used Kubernetes or Docker in production.": ['Kubernetes', 'Docker'],
+        "2 years experience with basic HTML/CSS and WordPress. Some exposure to JavaScript but no framework experience.":
+            ['JavaScript frameworks', 'JavaScript'],
+        "Limited exposure to Python through online courses.": ['Python'],
+        "Familiar with data visualization through Excel charts and Power BI.": ['Power BI', 'Excel'],
+        "Analyzed data using Excel pivot tables and basic SQL queries.": ['SQL'],
+        "Hasn't worked with AWS.": ['AWS'],
+    }
+    for resume, requirements in cases.items():
+        for requirement in requirements:
+            assert RequirementMatcher().match(requirement, resume) is None, (requirement, resume)
+
+    assert RequirementMatcher().match('Excel', "Built Excel models for the finance team.")['meets_requirement']
+
+
+def test_stemming_meets_plurals_and_verb_forms():
+    assert stem('databases') == stem('database')
+    assert stem('management') == stem('managed') == stem('manager')
+    assert verdict('Mentoring developers')['meets_requirement']
+
+
+def test_avoided_fraction_is_reported():
+    matcher = RequirementMatcher()
+    for requirement in ['Git', 'React', 'Team leadership', '3 years of SQL']:
+        verdict(requirement, matcher)
+
+    assert matcher.stats() == {'checked': 4, 'answered': 1, 'avoided_fraction': 0.25}
+
+
+def test_analyzer_only_asks_the_model_about_ambiguous_requirements():
+    analyzer = ScriptedAnalyzer(prescreen=True)
+    requirements = ['Git', 'Kubernetes', 'Team leadership', '5+ years of Python']
+
+    results = asyncio.run(analyzer.analyze_batch(requirements, RESUME))
+
+    assert len(analyzer.requests) == 1
+    block = analyzer.requests[0]['messages'][0]['content'].split('Requirements:\n', 1)[1].split('\n\nResume:', 1)[0]
+    assert block.splitlines() == ['0. Kubernetes', '1. Team leadership', '2. 5+ years of Python']
+    assert [r['requirement'] for r in results] == requirements
+    assert [r.get('source') for r in results] == ['lexical', None, None, None]
+    assert results[1]['meets_requirement'] is False
+
+    asyncio.run(analyzer.analyze('SQL databases', RESUME))
+    assert len(analyzer.requests) == 1
+
+
+def test_prescreen_can_be_turned_off():
+    assert RequirementAnalyzer(verdict_cache=TTLCache(), prescreen=False).matcher is None
+
+    analyzer = ScriptedAnalyzer(prescreen=False)
+    result = asyncio.run(analyzer.analyze('Git', RESUME))
+
+    assert len(analyzer.requests) == 1 and 'source' not in result
+
+
+if __name__ == '__main__':
+    test_keywords_aliases_and_implied_terms_are_met()
+    test_evidence_spans_point_into_the_resume()
+    test_missing_terms_are_left_to_the_model()
+    test_words_joined_by_slashes_and_hyphens_count_separately()
+    test_ambiguous_short_terms_are_left_to_the_model()
+    test_judgement_calls_are_left_to_the_model()
+    test_negated_or_hedged_mentions_are_left_to_the_model()
+    test_stemming_meets_plurals_and_verb_forms()
+    test_avoided_fraction_is_reported()
+    test_analyzer_only_asks_the_model_about_ambiguous_requirements()
+    test_prescreen_can_be_turned_off()
+    print("✅ Requirement matcher tests passed")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test the server-side result store (runs offline)
+"""
+
+import time
+
+from result_store import ResultStore
+
+
+def test_round_trip_is_compressed_and_content_addressed():
+    store = ResultStore()
+    text = "💼 PROFESSIONAL SUMMARY\n\n" + "Led team of 5 developers. " * 200
+
+    resume_id = store.put(text)
+
+    assert store.get(resume_id) == text
+    assert store.put(text) == resume_id
+    assert len(store) == 1
+    assert store.stats()['bytes'] < len(text.encode('utf-8')) / 5
+
+
+def test_unknown_and_expired_ids_return_none():
+    store = ResultStore(ttl=0.05)
+    resume_id = store.put("resume")
+
+    assert store.get('missing') is None
+    time.sleep(0.06)
+    assert store.get(resume_id) is None
+    assert len(store) == 0
+
+
+def test_evicts_least_recently_used_when_over_budget():
+    store = ResultStore(max_bytes=60)
+    first = store.put("first resume " * 5)
+    second = store.put("second resume " * 5)
+    store.get(first)
+    third = store.put("third resume " * 5)
+
+    assert store.get(second) is None
+    assert store.get(first) is not None
+    assert store.get(third) is not None
+    assert store.stats()['bytes'] <= 60
+    assert store.stats()['evictions'] == 1
+
+
+if __name__ == '__main__':
+    test_round_trip_is_compressed_and_content_addressed()
+    test_unknown_and_expired_ids_return_none()
+    test_evicts_least_recently_used_when_over_budget()
+    print("✅ Result store tests passed")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test the structured resume model and its renderers (runs offline)
+"""
+
+from pdf_generator import PDFResumeGenerator
+from resume_model import (ContactInfo, Education, ExperienceEntry, Resume, Skills, Summary,
+                          section_text)
+
+EXPERIENCE_RESPONSE = """
+TechCorp - Senior Software Engineer
+January 2022 - Present | Seattle, WA
+
+• Architected microservices platform serving 2.3M daily users
+- Led team of 5 developers to migrate legacy system to AWS
+"""
+
+EDUCATION_RESPONSE = """
+EDUCATION
+
+Bachelor of Science in Computer Science
+University of Washington | 2016
+Relevant Coursework: Distributed Systems, Databases
+
+CERTIFICATIONS
+
+• AWS Certified Solutions Architect - Amazon (2021)
+"""
+
+
+def sample_resume():
+    return Resume(
+        contact=ContactInfo(name='Sarah Chen', email='sarah.chen@gmail.com', phone='(555) 234-5678',
+                            location='Seattle, WA', linkedin='linkedin.com/in/sarah-chen'),
+        summary=Summary.from_response('Backend engineer with 8 years of Python.'),
+        skills=Skills.from_response('Programming Languages: Python, Go\nDatabases: PostgreSQL, Redis'),
+        experience=ExperienceEntry.from_response(EXPERIENCE_RESPONSE),
+        education=Education.from_response(EDUCATION_RESPONSE)
+    )
+
+
+def test_experience_separates_dates_from_company_line():
+    [entry] = ExperienceEntry.from_response(EXPERIENCE_RESPONSE)
+
+    assert (entry.company, entry.title) == ('TechCorp', 'Senior Software Engineer')
+    assert (entry.dates, entry.location) == ('January 2022 - Present', 'Seattle, WA')
+    assert entry.bullets[1] == 'Led team of 5 developers to migrate legacy system to AWS'
+
+
+def test_education_fields():
+    education = Education.from_response(EDUCATION_RESPONSE)
+
+    [entry] = education.entries
+    assert entry.degree == 'Bachelor of Science in Computer Science'
+    assert (entry.institution, entry.year) == ('University of Washington', '2016')
+    assert entry.details == ['Relevant Coursework: Distributed Systems, Databases']
+    assert education.certifications == ['AWS Certified Solutions Architect - Amazon (2021)']
+
+
+def test_text_uses_emoji_layout():
+    text = sample_resume().to_text()
+
+    assert '📧 sarah.chen@gmail.com | 📞 (555) 234-5678 | 🌍 Seattle, WA' in text
+    assert '• Programming Languages: Python, Go' in text
+    assert '🏢 TechCorp - Senior Software Engineer\n📅 January 2022 - Present | Seattle, WA' in text
+    assert '🏅 CERTIFICATIONS (Recent & Relevant)' in text
+    assert text.index('PROFESSIONAL SUMMARY') < text.index('PROFESSIONAL EXPERIENCE') < text.index('EDUCATION')
+
+
+def test_section_text_matches_resume_text():
+    resume = sample_resume()
+
+    assert section_text(resume.experience) in resume.to_text()
+    assert section_text(resume.skills) in resume.to_text()
+
+
+def test_json_round_trip():
+    resume = sample_resume()
+
+    assert Resume.from_json(resume.to_json()) == resume
+
+
+def test_pdf_renders_from_model():
+    assert PDFResumeGenerator().render_pdf_bytes(sample_resume()).startswith(b'%PDF')
+
+
+if __name__ == '__main__':
+    test_experience_separates_dates_from_company_line()
+    test_education_fields()
+    test_text_uses_emoji_layout()
+    test_section_text_matches_resume_text()
+    test_json_round_trip()
+    test_pdf_renders_from_model()
+    print("✅ Resume model tests passed")
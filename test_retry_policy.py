@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Test per-section retries with jittered backoff and hedged LLM calls (runs offline)
+"""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from llm_backend import FakeLLMBackend
+from rate_limiter import get_rate_limiter
+from retry_policy import ResilientCaller, RetryPolicy, is_retryable, load_policies
+from testing_helpers import isolated_generator
+
+
+class StatusError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers=headers or {})
+
+
+class Flaky:
+    """Raises the given errors in turn, then answers"""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return 'ok'
+
+
+class FirstCallSlow:
+    """The first call stalls, later ones (the hedge) answer straight away"""
+
+    def __init__(self, stall=1.0):
+        self.stall = stall
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def _stall(self):
+        with self.lock:
+            self.calls += 1
+            return self.stall if self.calls == 1 else 0.0
+
+    def __call__(self):
+        time.sleep(self._stall())
+        return f'answer {self.calls}'
+
+    async def acall(self):
+        await asyncio.sleep(self._stall())
+        return 'async answer'
+
+
+def hedging_caller(hedge_workers=None, **options):
+    options = {'hedge': True, 'hedge_min_delay': 0.05, 'hedge_min_samples': 5, 'hedge_budget': 1.0, **options}
+    policy = RetryPolicy(**options)
+    caller = ResilientCaller({'experience': policy}, hedge_workers=hedge_workers)
+    for _ in range(10):
+        caller.latency.record('experience', 0.01)
+        caller.latency.count_call('experience')
+    return caller
+
+
+def test_transient_errors_are_retried():
+    caller = ResilientCaller(default=RetryPolicy(attempts=3, base_delay=0))
+    call = Flaky(StatusError(429), StatusError(503))
+
+    assert caller.call('summary', call) == 'ok'
+    assert call.calls == 3
+
+
+def test_client_errors_and_exhausted_attempts_raise():
+    caller = ResilientCaller(default=RetryPolicy(attempts=2, base_delay=0))
+
+    rejected = Flaky(StatusError(400))
+    with pytest.raises(StatusError):
+        caller.call('summary', rejected)
+    assert rejected.calls == 1
+
+    exhausted = Flaky(StatusError(500), StatusError(500), StatusError(500))
+    with pytest.raises(StatusError):
+        caller.call('summary', exhausted)
+    assert exhausted.calls == 2
+
+
+def test_backoff_is_jittered_capped_and_honours_retry_after():
+    caller = ResilientCaller()
+    policy = RetryPolicy(base_delay=1, max_delay=4)
+
+    delays = [caller.backoff(policy, 5, StatusError(503)) for _ in range(50)]
+    assert all(0 <= delay <= 4 for delay in delays) and len(set(delays)) > 1
+    assert caller.backoff(policy, 0, StatusError(429, {'retry-after': '3'})) >= 3
+    assert is_retryable(TimeoutError()) and not is_retryable(ValueError())
+
+
+def test_slow_call_is_hedged():
+    caller = hedging_caller()
+    call = FirstCallSlow()
+
+    start = time.perf_counter()
+    assert caller.call('experience', call) == 'answer 2'
+    assert time.perf_counter() - start < 0.5
+    assert call.calls == 2
+
+
+def test_hedge_delay_starts_when_the_primary_does():
+    caller = hedging_caller(hedge_workers=1, hedge_min_delay=0.15)
+    calls = []
+
+    def call():
+        calls.append(1)
+        time.sleep(0.1)
+        return 'ok'
+
+    # The second call waits 0.1s for the only pool thread, then finishes well within its own delay
+    threads = [threading.Thread(target=caller.call, args=('experience', call)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 2
+
+
+def test_hedge_pool_is_sized_from_the_limiter():
+    assert hedging_caller().executor._max_workers == 2 * get_rate_limiter().concurrency.maximum
+    assert hedging_caller(hedge_workers=3).executor._max_workers == 3
+
+
+def test_async_hedge_cancels_the_loser():
+    caller = hedging_caller()
+    call = FirstCallSlow(stall=5)
+
+    async def run():
+        start = time.perf_counter()
+        result = await caller.acall('experience', call.acall)
+        elapsed = time.perf_counter() - start
+        await asyncio.sleep(0)
+        # The stalled primary was cancelled rather than left running
+        return result, elapsed, len(asyncio.all_tasks())
+
+    result, elapsed, tasks = asyncio.run(run())
+    assert result == 'async answer' and elapsed < 0.5 and tasks == 1
+
+
+def test_cancelled_async_caller_cancels_the_primary():
+    caller = hedging_caller(hedge_min_delay=1)
+    call = FirstCallSlow(stall=5)
+
+    async def run():
+        waiter = asyncio.ensure_future(caller.acall('experience', call.acall))
+        # Cancel while the primary is still inside its hedge delay
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        await asyncio.sleep(0)
+        return len(asyncio.all_tasks())
+
+    assert asyncio.run(run()) == 1
+
+
+def test_hedging_respects_budget_and_history():
+    no_budget = hedging_caller(hedge_budget=0)
+    call = FirstCallSlow(stall=0.2)
+    no_budget.call('experience', call)
+    assert call.calls == 1
+
+    # Sections without enough latency history never hedge
+    assert ResilientCaller().hedge_delay('experience', RetryPolicy(hedge=True)) is None
+
+
+def test_policy_overrides():
+    policies = load_policies('{"summary": {"hedge": true}, "experience": {"attempts": 5}}')
+
+    assert policies['summary'].hedge and policies['summary'].attempts == 3
+    assert policies['experience'].attempts == 5 and policies['experience'].hedge
+    with pytest.raises(ValueError):
+        load_policies('{"summary": {"retries": 2}}')
+
+
+def test_generation_survives_transient_backend_errors():
+    class FailsFirstCallPerSection(FakeLLMBackend):
+        def __init__(self):
+            super().__init__()
+            self.failed = set()
+
+        def complete(self, request, section):
+            if section not in self.failed:
+                self.failed.add(section)
+                raise StatusError(502)
+            return super().complete(request, section)
+
+    generator = isolated_generator(backend=FailsFirstCallPerSection(),
+                                   resilience=ResilientCaller(default=RetryPolicy(base_delay=0)))
+
+    good, _ = generator.generate_resume_models("Python engineer")
+
+    assert len(good.experience) == 3
+
+
+if __name__ == '__main__':
+    test_transient_errors_are_retried()
+    test_client_errors_and_exhausted_attempts_raise()
+    test_backoff_is_jittered_capped_and_honours_retry_after()
+    test_slow_call_is_hedged()
+    test_hedge_delay_starts_when_the_primary_does()
+    test_hedge_pool_is_sized_from_the_limiter()
+    test_async_hedge_cancels_the_loser()
+    test_cancelled_async_caller_cancels_the_primary()
+    test_hedging_respects_budget_and_history()
+    test_policy_overrides()
+    test_generation_survives_transient_backend_errors()
+    print("✅ Retry policy tests passed")
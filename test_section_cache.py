@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Test the section variant cache for skills and education sections (runs offline)
+"""
+
+import asyncio
+import random
+import time
+
+from cache import VariantCache
+from testing_helpers import CountingBackend, isolated_generator
+
+JOB_ANALYSIS = {
+    'job_title': 'Backend Engineer',
+    'must_have': ['Python', 'PostgreSQL'],
+    'nice_to_have': ['Docker']
+}
+
+
+def test_pool_fills_then_serves_variants():
+    cache = VariantCache(variants=2)
+
+    assert cache.get('key') is None
+    cache.add('key', 'a')
+    assert cache.get('key') is None
+    cache.add('key', 'b')
+    cache.add('key', 'c')
+
+    assert {cache.get('key') for _ in range(50)} == {'a', 'b'}
+    assert cache.stats()['variants'] == 2
+
+
+def test_eviction_is_bounded_by_stored_variants():
+    cache = VariantCache(maxsize=3, variants=2)
+    cache.add('old', 1)
+    cache.add('old', 2)
+    cache.add('new', 3)
+    cache.add('new', 4)
+
+    assert cache.stats() == {'size': 1, 'variants': 2, 'hits': 0, 'misses': 0, 'evictions': 1}
+    assert cache.get('new') in (3, 4)
+
+
+def test_expired_variants_are_dropped():
+    cache = VariantCache(variants=1, ttl=0.05)
+    cache.add('key', 'a')
+    assert cache.get('key') == 'a'
+
+    time.sleep(0.06)
+
+    assert cache.get('key') is None and cache.stats()['variants'] == 0
+    assert VariantCache(maxsize=0).add('key', 'a') is None and len(VariantCache(maxsize=0)) == 0
+
+
+def test_repeated_inputs_reuse_sections():
+    backend = CountingBackend()
+    generator = isolated_generator(backend=backend, section_cache=VariantCache(variants=2, rng=random.Random(0)))
+
+    for _ in range(5):
+        generator.generate_skills_section(JOB_ANALYSIS, 'technology')
+        generator.generate_education_certifications(JOB_ANALYSIS, 'technology')
+
+    assert backend.sections['skills'] == 2 and backend.sections['education'] == 2
+
+
+def test_similar_jobs_share_and_different_inputs_do_not():
+    backend = CountingBackend()
+    generator = isolated_generator(backend=backend, section_cache=VariantCache(variants=1))
+    generator.generate_skills_section(JOB_ANALYSIS, 'technology')
+
+    # Requirement order, case and spacing don't matter
+    reordered = dict(JOB_ANALYSIS, must_have=['postgresql ', 'PYTHON'], job_title='Platform Engineer')
+    generator.generate_skills_section(reordered, 'technology')
+    assert backend.sections['skills'] == 1
+
+    generator.generate_skills_section(JOB_ANALYSIS, 'technology', is_matching=False)
+    generator.generate_skills_section(JOB_ANALYSIS, 'finance')
+    generator.generate_skills_section(dict(JOB_ANALYSIS, nice_to_have=['Kubernetes']), 'technology')
+    assert backend.sections['skills'] == 4
+
+    # Education ignores nice-to-haves, so that posting still shares its section
+    generator.generate_education_certifications(JOB_ANALYSIS, 'technology')
+    generator.generate_education_certifications(dict(JOB_ANALYSIS, nice_to_have=['Kubernetes']), 'technology')
+    assert backend.sections['education'] == 1
+
+
+def test_cached_sections_are_copies():
+    generator = isolated_generator(section_cache=VariantCache(variants=1))
+    first = generator.generate_skills_section(JOB_ANALYSIS, 'technology')
+    first.groups.clear()
+
+    assert generator.generate_skills_section(JOB_ANALYSIS, 'technology').groups
+
+
+def test_async_sections_use_the_cache():
+    backend = CountingBackend()
+    generator = isolated_generator(backend=backend, section_cache=VariantCache(variants=1))
+
+    async def run():
+        for _ in range(3):
+            await generator.agenerate_skills_section(JOB_ANALYSIS, 'technology')
+            await generator.agenerate_education_certifications(JOB_ANALYSIS, 'technology')
+
+    asyncio.run(run())
+
+    assert backend.sections['skills'] == 1 and backend.sections['education'] == 1
+
+
+def test_repeat_jobs_only_pay_for_differing_sections():
+    backend = CountingBackend()
+    generator = isolated_generator(backend=backend, section_cache=VariantCache(variants=1))
+    generator.generate_resumes("Backend Engineer\n1. Python\n2. PostgreSQL")
+    before = sum(backend.sections.values())
+
+    generator.generate_resumes("Senior Backend Engineer (remote)\n1. Python\n2. PostgreSQL")
+
+    # A new parse, summary and experience calls; skills and education come from the cache
+    assert sum(backend.sections.values()) - before == 9
+
+
+if __name__ == '__main__':
+    test_pool_fills_then_serves_variants()
+    test_eviction_is_bounded_by_stored_variants()
+    test_expired_variants_are_dropped()
+    test_repeated_inputs_reuse_sections()
+    test_similar_jobs_share_and_different_inputs_do_not()
+    test_cached_sections_are_copies()
+    test_async_sections_use_the_cache()
+    test_repeat_jobs_only_pay_for_differing_sections()
+    print("✅ Section cache tests passed")
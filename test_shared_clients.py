@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Test process-wide shared generator, clients and event loop (runs offline)
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import llm_backend
+import llm_client
+import resume_generator
+
+
+def test_shared_generator_is_built_once_across_threads():
+    with patch.object(resume_generator, '_shared_generator', None), \
+            patch.object(llm_backend, '_shared_backend', None), \
+            patch.object(llm_client, '_shared_client', None), \
+            patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            generators = list(executor.map(lambda _: resume_generator.get_shared_generator(), range(16)))
+
+        assert all(generator is generators[0] for generator in generators)
+        assert generators[0].backend.client is llm_client.get_shared_client()
+
+
+def test_async_views_share_one_loop_and_client():
+    async def current_client():
+        return asyncio.get_running_loop(), llm_client.get_async_client()
+
+    async def view():
+        # Each asyncio.run mimics Flask giving every async request its own loop
+        return await llm_client.run_on_shared_loop(current_client())
+
+    with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}):
+        first_loop, first_client = asyncio.run(view())
+        second_loop, second_client = asyncio.run(view())
+
+    assert first_loop is second_loop is llm_client.get_shared_loop()
+    assert first_client is second_client
+
+    # Don't leave a client built with the fake key behind for other tests
+    llm_client._async_clients.pop(first_loop, None)
+
+
+if __name__ == '__main__':
+    test_shared_generator_is_built_once_across_threads()
+    test_async_views_share_one_loop_and_client()
+    print("✅ Shared client tests passed")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Test single-flight deduplication of concurrent identical generations (runs offline)
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from singleflight import SingleFlight
+from testing_helpers import CountingBackend, isolated_generator
+
+JOB_DESCRIPTION = "Senior Backend Engineer\n1. Python\n2. PostgreSQL"
+
+
+def test_concurrent_identical_requests_share_one_run():
+    backend = CountingBackend(latency='fixed:0.05')
+    generator = isolated_generator(backend=backend)
+    # Whitespace and case differences still count as the same posting
+    descriptions = [JOB_DESCRIPTION, JOB_DESCRIPTION.upper(), f"  {JOB_DESCRIPTION}\n"] * 3
+
+    with ThreadPoolExecutor(max_workers=len(descriptions)) as executor:
+        results = list(executor.map(generator.generate_resumes, descriptions))
+
+    assert sum(backend.sections.values()) == 13
+    assert all(result == results[0] for result in results)
+    assert generator.generation_flights.shared == len(descriptions) - 1
+
+
+def test_async_and_sync_callers_join_the_same_flight():
+    backend = CountingBackend(latency='fixed:0.1')
+    generator = isolated_generator(backend=backend)
+
+    async def burst():
+        sync_result = asyncio.to_thread(generator.generate_resume_models, JOB_DESCRIPTION)
+        return await asyncio.gather(sync_result, *(generator.agenerate_resume_models(JOB_DESCRIPTION) for _ in range(4)))
+
+    results = asyncio.run(burst())
+
+    assert sum(backend.sections.values()) == 13
+    assert len({good.to_text() for good, _ in results}) == 1
+    # Callers get their own copies
+    results[0][0].experience.clear()
+    assert len(results[1][0].experience) == 3
+
+
+def test_different_options_are_not_shared():
+    backend = CountingBackend(latency='fixed:0.05')
+    generator = isolated_generator(backend=backend)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(lambda mode: generator.generate_resumes(JOB_DESCRIPTION, mode), ['detailed', 'fast']))
+
+    assert backend.sections['resume'] == 2 and backend.sections['summary'] == 2
+    assert generator.generation_flights.shared == 0
+
+
+def test_concurrent_parses_share_one_call():
+    backend = CountingBackend(latency='fixed:0.05')
+    generator = isolated_generator(backend=backend)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        analyses = list(executor.map(lambda _: generator.parse_job_description(JOB_DESCRIPTION), range(6)))
+
+    assert backend.sections['parse'] == 1
+    analyses[0]['must_have'].append('mutated')
+    assert 'mutated' not in analyses[1]['must_have']
+
+
+def test_errors_reach_every_waiter_and_are_not_remembered():
+    flights = SingleFlight('test')
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def failing():
+        calls.append(1)
+        started.set()
+        release.wait()
+        raise RuntimeError("boom")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        leader = executor.submit(flights.do, 'key', failing)
+        started.wait()
+        followers = [executor.submit(flights.do, 'key', failing) for _ in range(2)]
+        while flights.shared < 2:
+            time.sleep(0.001)
+        release.set()
+        for future in [leader, *followers]:
+            with pytest.raises(RuntimeError):
+                future.result()
+
+    assert len(calls) == 1 and flights.in_flight() == 0
+    assert flights.do('key', lambda: 'fresh') == 'fresh'
+
+
+def test_concurrent_streams_share_one_run():
+    backend = CountingBackend(latency='fixed:0.05')
+    generator = isolated_generator(backend=backend)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        streams = list(executor.map(lambda _: list(generator.iter_resume_sections(JOB_DESCRIPTION)), range(3)))
+
+    assert sum(backend.sections.values()) == 13
+    assert all(len(sections) == 14 for sections in streams)
+    assert generator.section_flights.shared == 2 and generator.section_flights.in_flight() == 0
+    # Each stream gets its own copies of the sections
+    skills = [next(section for _, name, section in sections if name == 'skills') for sections in streams[:2]]
+    assert skills[0] is not skills[1]
+
+
+def test_stream_keeps_running_while_anyone_is_reading():
+    backend = CountingBackend(latency='fixed:0.05')
+    generator = isolated_generator(backend=backend)
+    first = generator.iter_resume_sections(JOB_DESCRIPTION)
+    next(first)
+    second = generator.iter_resume_sections(JOB_DESCRIPTION)
+    next(second)
+
+    # One client disconnecting doesn't cancel sections the other is still waiting for
+    first.close()
+    assert len(list(second)) == 13
+    assert sum(backend.sections.values()) == 13
+
+    third = generator.iter_resume_sections(JOB_DESCRIPTION)
+    next(third)
+    third.close()
+    assert generator.section_flights.in_flight() == 0
+
+
+if __name__ == '__main__':
+    test_concurrent_identical_requests_share_one_run()
+    test_async_and_sync_callers_join_the_same_flight()
+    test_different_options_are_not_shared()
+    test_concurrent_parses_share_one_call()
+    test_errors_reach_every_waiter_and_are_not_remembered()
+    test_concurrent_streams_share_one_run()
+    test_stream_keeps_running_while_anyone_is_reading()
+    print("✅ Single-flight tests passed")
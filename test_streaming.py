@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test Server-Sent Events streaming of resume sections (runs offline)
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import app as web_app
+from test_concurrent_generation import SlowCompletions
+from testing_helpers import isolated_generator
+
+
+def parse_events(body):
+    events = []
+    for frame in body.strip().split('\n\n'):
+        lines = dict(line.split(': ', 1) for line in frame.split('\n'))
+        events.append((lines['event'], json.loads(lines['data'])))
+    return events
+
+
+def test_sections_are_yielded_as_they_complete():
+    generator = isolated_generator(completions=SlowCompletions(), max_concurrency=12)
+
+    sections = list(generator.iter_resume_sections("Python engineer"))
+
+    assert len(sections) == 14
+    assert {(is_matching, name) for is_matching, name, _ in sections} == {
+        (is_matching, name) for is_matching in (True, False) for name, _ in generator._section_tasks({}, is_matching)
+    }
+    # Contact info needs no LLM call, so it is among the first sections out
+    assert sections[0][1] == 'contact_info'
+
+
+def test_stream_endpoint_emits_sections_then_done():
+    generator = isolated_generator(completions=SlowCompletions(), max_concurrency=12)
+    client = web_app.app.test_client()
+
+    with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}), \
+            patch.object(web_app, 'get_shared_generator', return_value=generator):
+        response = client.post('/generate/stream', json={'job_description': 'Python engineer'})
+        body = response.get_data(as_text=True)
+
+    assert response.mimetype == 'text/event-stream'
+    events = parse_events(body)
+    assert [event for event, _ in events] == ['section'] * 14 + ['done']
+
+    done = events[-1][1]
+    assert done['good_resume'].index('PROFESSIONAL SUMMARY') < done['good_resume'].index('PROFESSIONAL EXPERIENCE')
+    assert web_app.load_resume(done['bad_resume_id']).to_text() == done['bad_resume']
+
+
+if __name__ == '__main__':
+    test_sections_are_yielded_as_they_complete()
+    test_stream_endpoint_emits_sections_then_done()
+    print("✅ Streaming tests passed")
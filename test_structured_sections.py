@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test structured-output sections, per-section retries and fast mode (runs offline)
+"""
+
+import asyncio
+import json
+import os
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import app as web_app
+from resume_generator import STRUCTURED_OUTPUT_ATTEMPTS, SectionFormatError
+from test_concurrent_generation import JOB_ANALYSIS_JSON
+from testing_helpers import isolated_generator
+
+SECTION_DATA = {
+    'summary': {'summary': 'Backend engineer with 8 years of Python.'},
+    'skills': {'groups': [{'category': 'Languages', 'skills': 'Python, SQL'}]},
+    'experienceentry': {'entries': [{
+        'company': 'TechCorp', 'title': 'Senior Engineer', 'dates': 'January 2022 - Present',
+        'location': 'Seattle, WA', 'bullets': ['• Led migration to AWS', 'Cut latency by 40%']
+    }]},
+    'education': {
+        'entries': [{'degree': 'BSc Computer Science', 'institution': 'University of Washington',
+                     'year': '2016', 'details': []}],
+        'certifications': ['AWS Solutions Architect (2021)']
+    }
+}
+SECTION_DATA['resume'] = {
+    'summary': SECTION_DATA['summary']['summary'],
+    'skills': SECTION_DATA['skills']['groups'],
+    'experience': SECTION_DATA['experienceentry']['entries'] * 3,
+    'education': SECTION_DATA['education']['entries'],
+    'certifications': SECTION_DATA['education']['certifications']
+}
+
+
+class StructuredCompletions:
+    """Answers each section schema with canned JSON, optionally garbling the first few answers per schema"""
+
+    def __init__(self, malformed=None):
+        self.malformed = dict(malformed or {})
+        self.lock = threading.Lock()
+        self.calls = []
+
+    def _content(self, messages, response_format=None):
+        if 'job description analyst' in messages[0]['content']:
+            return JOB_ANALYSIS_JSON
+        name = response_format['json_schema']['name']
+        with self.lock:
+            self.calls.append(name)
+            if self.malformed.get(name, 0) > 0:
+                self.malformed[name] -= 1
+                return '{"entries": [{"company": "TechCorp"'
+        return json.dumps(SECTION_DATA[name])
+
+    def create(self, model, messages, temperature, response_format=None, **kwargs):
+        content = self._content(messages, response_format)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+class AsyncStructuredCompletions(StructuredCompletions):
+
+    async def create(self, model, messages, temperature, response_format=None, **kwargs):
+        content = self._content(messages, response_format)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def test_sections_are_built_from_schema_fields():
+    completions = StructuredCompletions()
+
+    good, _ = isolated_generator(completions=completions, structured_output=True).generate_resume_models("Python engineer")
+
+    assert good.experience[0].bullets == ['Led migration to AWS', 'Cut latency by 40%']
+    assert good.experience[0].dates == 'January 2022 - Present'
+    assert good.education.entries[0].institution == 'University of Washington'
+    assert len(completions.calls) == 12
+
+
+def test_malformed_section_is_retried_alone():
+    completions = StructuredCompletions(malformed={'experienceentry': 1})
+
+    good, bad = isolated_generator(completions=completions, structured_output=True, max_concurrency=1).generate_resume_models("Python engineer")
+
+    assert len(completions.calls) == 13
+    assert completions.calls.count('experienceentry') == 7
+    assert completions.calls.count('summary') == 2
+    assert len(good.experience) == 3 and len(bad.experience) == 3
+
+
+def test_section_gives_up_after_max_attempts():
+    completions = StructuredCompletions(malformed={'summary': STRUCTURED_OUTPUT_ATTEMPTS})
+    generator = isolated_generator(completions=completions, structured_output=True)
+
+    with pytest.raises(SectionFormatError):
+        generator.generate_professional_summary({}, 'technology')
+
+
+def test_async_retries_match_sync():
+    completions = AsyncStructuredCompletions(malformed={'education': 2})
+
+    good, _ = asyncio.run(isolated_generator(completions=completions, structured_output=True).agenerate_resume_models("Python engineer"))
+
+    assert completions.calls.count('education') == 4
+    assert good.education.certifications == ['AWS Solutions Architect (2021)']
+
+
+def test_fast_mode_uses_one_call_per_resume():
+    completions = StructuredCompletions()
+    generator = isolated_generator(completions=completions, structured_output=False)
+
+    good, bad = generator.generate_resume_models("Python engineer", mode='fast')
+
+    assert completions.calls == ['resume', 'resume']
+    assert len(good.experience) == 3
+    assert good.contact.name and bad.contact.name
+    assert 'PROFESSIONAL EXPERIENCE' in good.to_text()
+
+
+def test_fast_mode_retries_malformed_resume():
+    completions = AsyncStructuredCompletions(malformed={'resume': 1})
+
+    asyncio.run(isolated_generator(completions=completions, structured_output=True).agenerate_resumes("Python engineer", mode='fast'))
+
+    assert completions.calls == ['resume'] * 3
+
+
+def test_generate_endpoint_accepts_mode():
+    completions = AsyncStructuredCompletions()
+    client = web_app.app.test_client()
+
+    with patch.dict(os.environ, {'OPENAI_API_KEY': 'test-key'}), \
+            patch.object(web_app, 'get_shared_generator', return_value=isolated_generator(completions=completions, structured_output=True)):
+        response = client.post('/generate', json={'job_description': 'Python engineer', 'mode': 'fast'})
+        rejected = client.post('/generate', json={'job_description': 'Python engineer', 'mode': 'turbo'})
+
+    assert response.status_code == 200
+    assert completions.calls == ['resume', 'resume']
+    assert web_app.load_resume(response.get_json()['good_resume_id']).experience[0].company == 'TechCorp'
+    assert rejected.status_code == 400
+
+
+if __name__ == '__main__':
+    test_sections_are_built_from_schema_fields()
+    test_malformed_section_is_retried_alone()
+    test_section_gives_up_after_max_attempts()
+    test_async_retries_match_sync()
+    test_fast_mode_uses_one_call_per_resume()
+    test_fast_mode_retries_malformed_resume()
+    test_generate_endpoint_accepts_mode()
+    print("✅ Structured section tests passed")
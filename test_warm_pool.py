@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Test the warm pool of pre-generated experience and education sections (runs offline)
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+
+from cache import VariantCache
+from rate_limiter import RateLimiter
+from resume_model import section_text
+from testing_helpers import CountingBackend, isolated_generator
+from warm_pool import WarmPool
+
+JOB_DESCRIPTION = "Senior Backend Software Engineer\n1. Python\n2. PostgreSQL"
+
+
+def test_fill_covers_every_slot():
+    backend = CountingBackend()
+    generator = isolated_generator(backend=backend, section_cache=VariantCache(maxsize=0), limiter=RateLimiter())
+    pool = WarmPool(generator, size=2, industries=['technology', 'sales'])
+
+    pool.fill()
+
+    # 2 industries x (3 experience levels + education) x 2 each, all non-matching
+    assert pool.stats()['ready'] == pool.stats()['capacity'] == 16
+    assert backend.sections['experience'] == 12 and backend.sections['education'] == 4
+    assert not pool.fill_one()
+
+
+def test_only_non_matching_sections_come_from_the_pool():
+    backend = CountingBackend()
+    generator = isolated_generator(backend=backend, section_cache=VariantCache(maxsize=0), limiter=RateLimiter())
+    pool = WarmPool(generator, size=1, industries=['technology'])
+    pool.fill()
+    backend.sections.clear()
+
+    good, bad = generator.generate_resume_models(JOB_DESCRIPTION)
+
+    # The matching resume's sections are tailored to the posting; only the non-matching ones come from the pool
+    assert dict(backend.sections) == {'parse': 1, 'summary': 2, 'skills': 2, 'experience': 3, 'education': 1}
+    assert len(good.experience) == 3 and good.education.entries and len(bad.experience) == 3
+    assert pool.stats()['ready'] == 0 and pool.stats()['hits'] == 4
+
+
+def test_pooled_sections_naming_a_must_have_are_skipped():
+    backend = CountingBackend()
+    generator = isolated_generator(backend=backend, section_cache=VariantCache(maxsize=0), limiter=RateLimiter())
+    pool = WarmPool(generator, size=1, industries=['technology'])
+    pool.fill()
+    # A pooled Senior entry that happens to list one of the posting's must-haves
+    slot = pool._pools[('technology', 'senior_experience')]
+    slot[0] = generator.generate_work_experience({'must_have': ['PostgreSQL']}, 'technology', 'Senior')
+    assert 'PostgreSQL' in section_text(slot[0])
+    backend.sections.clear()
+
+    generator.generate_resume_models(JOB_DESCRIPTION)
+
+    # The clashing entry stays pooled for other postings and the non-matching resume gets a live one instead
+    assert backend.sections['experience'] == 4
+    assert pool.stats()['ready'] == 1 and pool.stats()['hits'] == 3 and len(slot) == 1
+    assert pool.take('technology', 'senior_experience', ['Kubernetes']) is not None
+
+
+def test_empty_pool_falls_back_to_live_calls():
+    backend = CountingBackend()
+    generator = isolated_generator(backend=backend, section_cache=VariantCache(maxsize=0), limiter=RateLimiter())
+    pool = WarmPool(generator, industries=['technology'])
+
+    asyncio.run(generator.agenerate_resume_models(JOB_DESCRIPTION))
+
+    assert backend.sections['experience'] == 6 and backend.sections['education'] == 2
+    assert pool.stats()['misses'] == 4 and pool.stats()['hits'] == 0
+
+
+def test_background_refill_waits_for_idle_limiter():
+    backend = CountingBackend()
+    generator = isolated_generator(backend=backend, section_cache=VariantCache(maxsize=0), limiter=RateLimiter())
+    pool = WarmPool(generator, size=1, industries=['marketing'], interval=0.01)
+    generator.limiter.in_flight = 1
+    pool.start()
+    try:
+        time.sleep(0.05)
+        assert pool.stats()['ready'] == 0
+
+        generator.limiter.in_flight = 0
+        deadline = time.monotonic() + 5
+        while pool.stats()['ready'] < pool.stats()['capacity'] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pool.stats()['ready'] == pool.stats()['capacity']
+
+        pool.take('marketing', 'education_certs')
+        deadline = time.monotonic() + 5
+        while pool.stats()['ready'] < pool.stats()['capacity'] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pool.stats()['ready'] == pool.stats()['capacity']
+    finally:
+        pool.stop(timeout=5)
+
+
+def test_app_import_starts_the_pool():
+    # gunicorn and flask run import the app rather than running it as __main__
+    env = dict(os.environ, WARM_POOL_SIZE='1', WARM_POOL_INDUSTRIES='technology', RESUME_LLM_BACKEND='fake')
+    result = subprocess.run([sys.executable, '-c', 'import app, warm_pool; print(warm_pool._shared_pool is not None)'],
+                            cwd=os.path.dirname(os.path.abspath(__file__)), env=env, capture_output=True, text=True,
+                            timeout=60)
+
+    assert result.stdout.strip().endswith('True'), result.stderr
+
+
+if __name__ == '__main__':
+    test_fill_covers_every_slot()
+    test_only_non_matching_sections_come_from_the_pool()
+    test_pooled_sections_naming_a_must_have_are_skipped()
+    test_empty_pool_falls_back_to_live_calls()
+    test_background_refill_waits_for_idle_limiter()
+    test_app_import_starts_the_pool()
+    print("✅ Warm pool tests passed")
@@ -0,0 +1,50 @@
+"""
+Helpers shared by the offline tests: a generator with its own caches, and a fake
+backend that counts calls per section.
+"""
+
+import threading
+from collections import Counter
+from types import SimpleNamespace
+
+from cache import TTLCache, VariantCache
+from llm_backend import FakeLLMBackend
+from resume_generator import ResumeGenerator
+
+
+class CountingBackend(FakeLLMBackend):
+    """Fake backend that counts calls per section"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.sections = Counter()
+        self.lock = threading.Lock()
+
+    def _count(self, section):
+        with self.lock:
+            self.sections[section] += 1
+
+    def complete(self, request, section):
+        self._count(section)
+        return super().complete(request, section)
+
+    async def acomplete(self, request, section):
+        self._count(section)
+        return await super().acomplete(request, section)
+
+
+def isolated_generator(backend=None, completions=None, **kwargs) -> ResumeGenerator:
+    """
+    ResumeGenerator with fresh job analysis and section caches (override either via
+    kwargs). Calls go to backend, or to a stand-in for client.chat.completions used
+    as both the sync and async client, or else to FakeLLMBackend.
+    """
+    kwargs.setdefault('analysis_cache', TTLCache())
+    kwargs.setdefault('section_cache', VariantCache())
+    if completions is not None:
+        client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        kwargs.setdefault('client', client)
+        kwargs.setdefault('async_client', client)
+    elif backend is None and 'client' not in kwargs:
+        backend = FakeLLMBackend()
+    return ResumeGenerator(backend=backend, **kwargs)
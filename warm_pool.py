@@ -0,0 +1,178 @@
+import os
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
+
+from metrics import WARM_POOL_SECTIONS, WARM_POOL_TAKES
+from requirement_matcher import mentions_any
+from resume_generator import ResumeGenerator, get_shared_generator
+from resume_model import section_text
+
+# Non-matching sections generated ahead of time for a generic posting; (generator method, extra args after industry)
+POOLED_SECTIONS = {
+    'senior_experience': ('generate_work_experience', ("Senior",)),
+    'mid_experience': ('generate_work_experience', ("Mid-level",)),
+    'junior_experience': ('generate_work_experience', ("Junior",)),
+    'education_certs': ('generate_education_certifications', ()),
+}
+
+Slot = Tuple[str, str]
+
+
+def generic_job_analysis(industry: str, industry_data: Dict) -> Dict:
+    """A stand-in job analysis for an industry, built from its focus areas"""
+    focus_areas = industry_data['focus_areas']
+    return {
+        'job_title': f"{industry.replace('_', ' ').title()} Professional",
+        'must_have': focus_areas[:3],
+        'nice_to_have': focus_areas[3:],
+        'experience_level': '',
+        'education': ''
+    }
+
+
+class WarmPool:
+    """
+    Pre-generated non-matching work experience (per level) and education
+    sections for every industry, refilled by a background thread whenever the
+    rate limiter has no calls in flight or waiting.
+
+    A generator with a warm pool takes these instead of making their calls.
+    They are generated without knowing the posting, so a section that names one
+    of its must-haves (a generic technology entry listing Python, for a Python
+    posting) would undo the point of the weak resume; take() skips those and
+    the generator falls back to a live call. The matching resume has to show
+    the posting's must-haves, so its sections are always generated for the job.
+    Each pooled section is handed out once.
+    """
+
+    def __init__(self, generator: ResumeGenerator, size: int = 2, industries: List[str] = None,
+                 idle_calls: int = 0, interval: float = 1.0):
+        self.generator = generator
+        self.size = max(1, size)
+        self.industries = list(industries or generator.industry_mappings)
+        # Only refill while no more than idle_calls LLM calls are in flight or queued
+        self.idle_calls = idle_calls
+        self.interval = interval
+        self._pools: Dict[Slot, deque] = {
+            (industry, section): deque() for industry in self.industries for section in POOLED_SECTIONS
+        }
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        self.hits = 0
+        self.misses = 0
+        generator.warm_pool = self
+
+    def take(self, industry: str, section: str, must_haves: List[str] = ()) -> Optional[Any]:
+        """
+        Remove and return a pooled non-matching section that names none of must_haves,
+        or None if there is none ready
+        """
+        pool = self._pools.get((industry, section))
+        if pool is None:
+            return None
+        with self._lock:
+            value = next((value for value in pool if not mentions_any(must_haves, section_text(value))), None)
+            if value is None:
+                result = 'conflict' if pool else 'miss'
+                self.misses += 1
+            else:
+                result = 'hit'
+                pool.remove(value)
+                self.hits += 1
+                WARM_POOL_SECTIONS.dec()
+        WARM_POOL_TAKES.labels(section, result).inc()
+        self._wakeup.set()
+        return value
+
+    def missing(self) -> List[Slot]:
+        """Slots below the target size, emptiest first"""
+        with self._lock:
+            slots = [(len(pool), slot) for slot, pool in self._pools.items() if len(pool) < self.size]
+        return [slot for _, slot in sorted(slots, key=lambda item: item[0])]
+
+    def idle(self) -> bool:
+        stats = self.generator.limiter.stats()
+        return stats['in_flight'] + stats['waiting'] <= self.idle_calls
+
+    def generate(self, slot: Slot) -> Any:
+        industry, section = slot
+        method, args = POOLED_SECTIONS[section]
+        job_analysis = generic_job_analysis(industry, self.generator.industry_mappings[industry])
+        return getattr(self.generator, method)(job_analysis, industry, *args, False)
+
+    def fill_one(self) -> bool:
+        """Generate one section for the emptiest slot; False if the pool is already full"""
+        missing = self.missing()
+        if not missing:
+            return False
+        slot = missing[0]
+        value = self.generate(slot)
+        with self._lock:
+            self._pools[slot].append(value)
+            WARM_POOL_SECTIONS.inc()
+        return True
+
+    def fill(self):
+        """Fill every slot now, regardless of load (e.g. before taking traffic)"""
+        while self.fill_one():
+            pass
+
+    def _run(self):
+        while not self._stopping.is_set():
+            self._wakeup.clear()
+            if self.idle():
+                try:
+                    if self.fill_one():
+                        continue
+                except Exception as e:
+                    print(f"⚠️  Warm pool refill failed: {e}")
+            # Sleep until a section is taken, or recheck the load after interval
+            self._wakeup.wait(self.interval)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='warm-pool', daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = None):
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'ready': sum(len(pool) for pool in self._pools.values()),
+                'capacity': len(self._pools) * self.size,
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_warm_pool() -> Optional[WarmPool]:
+    """
+    Process-wide pool for the shared generator, started on first use when
+    WARM_POOL_SIZE (sections kept per industry and section) is above 0.
+    WARM_POOL_INDUSTRIES limits it to a comma-separated list of industries.
+    """
+    global _shared_pool
+    size = int(os.getenv('WARM_POOL_SIZE', 0))
+    if size <= 0:
+        return None
+    if _shared_pool is None:
+        with _shared_pool_lock:
+            if _shared_pool is None:
+                industries = [name.strip() for name in os.getenv('WARM_POOL_INDUSTRIES', '').split(',') if name.strip()]
+                pool = WarmPool(get_shared_generator(), size=size, industries=industries or None,
+                                idle_calls=int(os.getenv('WARM_POOL_IDLE_CALLS', 0)))
+                pool.start()
+                _shared_pool = pool
+    return _shared_pool